@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import io
+import os
 import random
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from typing import Callable, Iterator, List, Sequence, TextIO, Tuple
+
+from DataGenerator.Content.sentence_bank import SentenceBank, build_sentence_bank
+from DataGenerator.DateTime.timestamp import datetime_range
+from DataGenerator.DateTime.workday import work_calendar
 
 
 DEFAULT_FILE_TYPES = (
@@ -55,6 +64,9 @@ DEFAULT_SIGN_OFFS = (
     "感谢配合。",
 )
 
+# 补充内容按块生成并写出，单块字符数上限，决定大文档模式的峰值内存
+FILL_BLOCK_LENGTH = 1 << 20
+
 
 @dataclass
 class DocumentGeneratorConfig:
@@ -92,6 +104,9 @@ class DocumentGeneratorConfig:
     sign_off_probability: float = 0.6
     """在结尾添加落款信息的概率。"""
 
+    sign_off_date_range: Tuple[str, str] | None = None
+    """落款日期范围（含端点，如 ("2024-01-01", "2024-12-31")），设置后按中国工作日历在范围内抽取工作日；默认使用生成当天的日期。"""
+
     file_types: Sequence[str] = field(default_factory=lambda: DEFAULT_FILE_TYPES)
     """标题类型候选池。"""
 
@@ -122,6 +137,8 @@ class DocumentGeneratorConfig:
             raise ValueError("sign_off_probability 必须在 0 与 1 之间")
         if not self.file_types or not self.sentences_pool:
             raise ValueError("file_types 与 sentences_pool 不能为空")
+        if self.sign_off_date_range is not None:
+            _sign_off_ranks(*self.sign_off_date_range)
 
 
 def generate_document(config: DocumentGeneratorConfig, *, seed: int | None = None) -> str:
@@ -133,8 +150,63 @@ def generate_document(config: DocumentGeneratorConfig, *, seed: int | None = Non
     :return: 文档内容字符串
     """
     config.validate()
-    rng = random.Random(seed)
+    return _generate_document(config, seed)
+
+
+def write_document(config: DocumentGeneratorConfig, out: TextIO, *, seed: int | None = None) -> int:
+    """
+    生成单个文档并直接写入文本流，适合数十 MB 以上的大文档。
+
+    补充内容按 FILL_BLOCK_LENGTH 分块拼装、写出，配合累计长度计数恰好停在目标长度，
+    耗时与长度成线性关系，内存只与块大小有关；相同 seed 下写出的内容与 generate_document 一致。
 
+    :param config: 文档生成配置
+    :param out: 可写的文本流，例如以 "w" 模式打开的文件
+    :param seed: 可选随机种子，便于复现
+    :return: 写出的字符数
+    """
+    config.validate()
+    return _write_document(config, seed, out)
+
+
+def _generate_document(config: DocumentGeneratorConfig, seed: int | None) -> str:
+    # 调用方负责校验配置，批量生成时只校验一次
+    buffer = io.StringIO()
+    _write_document(config, seed, buffer)
+    return buffer.getvalue()
+
+
+def _write_document(config: DocumentGeneratorConfig, seed: int | None, out: TextIO) -> int:
+    rng = random.Random(seed)
+    head = _document_head(config, rng)
+
+    # 不足目标长度时，从句子库按子集和凑出恰好缺少的字符数（含换行），不再逐段追加后截断
+    fill_length = config.target_length - len(head) - 1
+    if fill_length <= 0:
+        text = _truncate_text(head, config.target_length) + "\n"
+        out.write(text)
+        return len(text)
+
+    out.write(head)
+    written = len(head)
+    # remaining 包含每块前面的换行
+    remaining = fill_length + 1
+    while remaining > 0:
+        block_length = remaining - 1
+        if block_length - FILL_BLOCK_LENGTH >= 2:
+            # 保证剩余部分至少还能放下换行加一个字符
+            block_length = FILL_BLOCK_LENGTH
+        block = _fill_text(block_length, config, rng)
+        out.write("\n")
+        out.write(block)
+        remaining -= block_length + 1
+        written += len(block) + 1
+
+    out.write("\n")
+    return written + 1
+
+
+def _document_head(config: DocumentGeneratorConfig, rng: random.Random) -> str:
     title = f"{rng.choice(config.file_types)} 编号：{rng.randint(10000, 99999)}"
     content: List[str] = [title, ""]
 
@@ -152,20 +224,14 @@ def generate_document(config: DocumentGeneratorConfig, *, seed: int | None = Non
 
     if rng.random() < config.sign_off_probability:
         content.append("")
-        date_str = datetime.now().strftime("%Y年%m月%d日")
+        date_str = _sign_off_date(config, rng)
         for line in config.sign_offs:
             content.append(line.format(date_str) if "{}" in line else line)
     else:
         content.append("")
         content.append("本文档内容为参考资料，未经授权不得擅自修改或外传。")
 
-    full_text = "\n".join(content).strip()
-
-    while len(full_text) < config.target_length:
-        full_text = (full_text + "\n" + _generate_paragraph(config, rng)).strip()
-
-    full_text = _truncate_text(full_text, config.target_length)
-    return full_text + "\n"
+    return "\n".join(content).strip()
 
 
 def generate_documents(config: DocumentGeneratorConfig, count: int, *, seed: int | None = None) -> List[str]:
@@ -177,10 +243,108 @@ def generate_documents(config: DocumentGeneratorConfig, count: int, *, seed: int
     :param seed: 可选随机种子
     :return: 文本列表
     """
+    return list(iter_documents(config, count, seed=seed))
+
+
+def iter_documents(config: DocumentGeneratorConfig, count: int, *, seed: int | None = None) -> Iterator[str]:
+    """
+    逐个生成文档，内存中只保留当前文档；相同 seed 下与 generate_documents 的结果逐项一致。
+
+    :param config: 文档生成配置（只校验一次）
+    :param count: 生成数量
+    :param seed: 可选随机种子
+    :return: 文档迭代器
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    config.validate()
+    for document_seed in _document_seeds(count, seed):
+        yield _generate_document(config, document_seed)
+
+
+def write_documents(
+    config: DocumentGeneratorConfig,
+    count: int,
+    sink: Callable[[int, str], None],
+    *,
+    seed: int | None = None,
+    processes: int | None = None,
+    chunk_size: int = 256,
+    ordered: bool = True,
+) -> int:
+    """
+    用进程池批量生成文档并逐个交给 sink，适合百万级语料。
+
+    主进程按串行顺序预先算出每个文档的种子，按 chunk_size 切成连续的种子区间分发给各进程，
+    因此相同 seed 下每个文档的内容与 iter_documents 完全一致，与进程数和完成顺序无关。
+    同时在途的区间数不超过进程数的两倍，内存占用与文档总数无关。
+
+    :param config: 文档生成配置（只校验一次）
+    :param count: 生成数量
+    :param sink: 接收 (序号, 文档) 的回调，序号为该文档在串行结果中的位置
+    :param seed: 可选随机种子
+    :param processes: 进程数，默认使用 CPU 核数；为 1 时在当前进程内串行生成
+    :param chunk_size: 每个任务包含的文档数
+    :param ordered: 为 True 时按序号顺序调用 sink，否则按完成顺序调用
+    :return: 生成的文档数量
+    """
     if count <= 0:
         raise ValueError("count 必须为正整数")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须为正整数")
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 0:
+        raise ValueError("processes 必须为正整数")
+    config.validate()
+
+    seeds = _document_seeds(count, seed)
+    if processes == 1:
+        for index, document_seed in enumerate(seeds):
+            sink(index, _generate_document(config, document_seed))
+        return count
+
+    def chunks() -> Iterator[Tuple[int, List[int]]]:
+        for start in range(0, count, chunk_size):
+            yield start, [next(seeds) for _ in range(min(chunk_size, count - start))]
+
+    def emit(start: int, documents: List[str]) -> None:
+        for offset, document in enumerate(documents):
+            sink(start + offset, document)
+
+    pending = chunks()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        in_flight: deque = deque()
+
+        def submit() -> None:
+            for start, chunk_seeds in pending:
+                in_flight.append((start, executor.submit(_generate_chunk, config, chunk_seeds)))
+                if len(in_flight) >= 2 * processes:
+                    return
+
+        submit()
+        while in_flight:
+            if ordered:
+                start, future = in_flight.popleft()
+                emit(start, future.result())
+            else:
+                done, _ = wait([future for _, future in in_flight], return_when=FIRST_COMPLETED)
+                for item in [item for item in in_flight if item[1] in done]:
+                    in_flight.remove(item)
+                    emit(item[0], item[1].result())
+            submit()
+    return count
+
+
+def _generate_chunk(config: DocumentGeneratorConfig, seeds: List[int]) -> List[str]:
+    # 进程池任务入口，需为模块级函数以便序列化
+    return [_generate_document(config, document_seed) for document_seed in seeds]
+
+
+def _document_seeds(count: int, seed: int | None) -> Iterator[int]:
     rng = random.Random(seed)
-    return [generate_document(config, seed=rng.randint(0, 1_000_000_000)) for _ in range(count)]
+    for _ in range(count):
+        yield rng.randint(0, 1_000_000_000)
 
 
 def _generate_paragraphs(count: int, config: DocumentGeneratorConfig, rng: random.Random) -> List[str]:
@@ -208,6 +372,47 @@ def _generate_paragraph(config: DocumentGeneratorConfig, rng: random.Random) ->
     return paragraph
 
 
+def _sign_off_date(config: DocumentGeneratorConfig, rng: random.Random) -> str:
+    if config.sign_off_date_range is None:
+        return datetime.now().strftime("%Y年%m月%d日")
+    calendar, low, high = _sign_off_ranks(*config.sign_off_date_range)
+    return calendar.select(rng.randrange(low, high)).item().strftime("%Y年%m月%d日")
+
+
+def _sign_off_ranks(start: str, end: str):
+    """返回覆盖落款日期范围的工作日历及范围内工作日的 rank 区间。"""
+    date_range = datetime_range(start, end, resolution="D")
+    calendar = work_calendar(date_range.start.item().year, date_range.end.item().year)
+    low, high = calendar.rank_range(date_range.start, date_range.end)
+    return calendar, low, high
+
+
+def _fill_text(length: int, config: DocumentGeneratorConfig, rng: random.Random) -> str:
+    """
+    拼出长度恰好为 length 的补充段落：句内以空格、段间以换行分隔，两者都占一个字符。
+    """
+    sentences = _sentence_bank(tuple(config.sentences_pool), tuple(config.connectors)).assemble(
+        length, rng=rng, separator=" "
+    )
+    min_sentences, max_sentences = config.sentences_per_paragraph
+    paragraphs = []
+    start = 0
+    while start < len(sentences):
+        stop = start + rng.randint(min_sentences, max_sentences)
+        paragraphs.append(" ".join(sentences[start:stop]))
+        start = stop
+    return "\n".join(paragraphs)
+
+
+@lru_cache(maxsize=32)
+def _sentence_bank(sentences_pool: Tuple[str, ...], connectors: Tuple[str, ...]) -> SentenceBank:
+    # 与 _generate_paragraph 一致：每个句子既可原样出现，也可带上任一连接词
+    variants = list(sentences_pool)
+    for connector in connectors:
+        variants.extend(connector + sentence[0].lower() + sentence[1:] for sentence in sentences_pool)
+    return build_sentence_bank(variants)
+
+
 def _truncate_text(text: str, target_length: int) -> str:
     if target_length <= 0:
         return ""
@@ -0,0 +1,17 @@
+import random
+
+from DataGenerator.Content.sentence_bank import build_sentence_bank
+
+if __name__ == "__main__":
+    bank = build_sentence_bank(["春眠不觉晓。", "处处闻啼鸟。", "夜来风雨声，花落知多少。", "床前明月光，疑是地上霜。举头望明月。"])
+    rng = random.Random(0)
+
+    # 逐个目标长度检查拼装结果恰好等长，覆盖子集和无解时的截断补齐分支
+    for separator in ("", " ", "，"):
+        for target in range(1, 2000):
+            text = separator.join(bank.assemble(target, rng=rng, separator=separator))
+            if len(text) != target:
+                raise SystemExit(f"长度不符: separator={separator!r} target={target} length={len(text)}")
+
+    print("，".join(bank.assemble(40, rng=rng, separator="，")))
+    print("assemble 长度检查通过")
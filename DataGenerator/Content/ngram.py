@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+NGRAM_LEVELS: tuple[str, ...] = ("char", "word")
+
+# 句首填充与句尾标记在词表中的编号
+_BEGIN = 0
+_END = 1
+
+
+@dataclass(frozen=True)
+class NGramModel:
+    """
+    编译为 CSR 结构的 n 元转移表。
+
+    状态为前 order 个词元的混合进制编码；第 i 个状态的候选后继位于
+    next_tokens[offsets[i]:offsets[i + 1]]，cumulative 为全部转移计数的全局前缀和，
+    因此一次随机游走只需两次 searchsorted 与若干数组索引。
+    """
+
+    vocab: np.ndarray
+    """词表，前两项为句首填充与句尾标记。"""
+
+    order: int
+    """状态长度（前文词元数）。"""
+
+    level: str
+    """"char" 按字切分，"word" 按空白切分。"""
+
+    states: np.ndarray
+    """升序排列的状态编码（int64）。"""
+
+    offsets: np.ndarray
+    """每个状态的后继区间起点，长度为 len(states) + 1。"""
+
+    next_tokens: np.ndarray
+    """后继词元编号（int32）。"""
+
+    cumulative: np.ndarray
+    """转移计数的全局前缀和（int64）。"""
+
+    mean_tokens: float
+    """训练语料的平均句长（词元数）。"""
+
+    @property
+    def separator(self) -> str:
+        """拼接词元时使用的分隔符。"""
+        return "" if self.level == "char" else " "
+
+    def generate(self, count: int, *, max_tokens: int = 200, seed: int | None = None) -> List[str]:
+        """
+        批量生成句子，所有句子同步游走。
+
+        参数:
+            count: 句子数量。
+        关键字参数:
+            max_tokens: 单句最多词元数，超过时截断。
+            seed: 可选随机种子，便于复现。
+
+        返回:
+            句子列表。
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        if max_tokens <= 0:
+            raise ValueError("max_tokens 必须为正整数")
+
+        rng = np.random.default_rng(seed)
+        size = len(self.vocab)
+        tail = size ** (self.order - 1)
+        tokens = np.full((count, max_tokens), _END, dtype=np.int32)
+        keys = np.zeros(count, dtype=np.int64)
+        active = np.arange(count)
+
+        for step in range(max_tokens):
+            rows = np.searchsorted(self.states, keys)
+            start = np.where(self.offsets[rows] > 0, self.cumulative[self.offsets[rows] - 1], 0)
+            total = self.cumulative[self.offsets[rows + 1] - 1] - start
+            targets = start + (rng.random(len(active)) * total).astype(np.int64)
+            picks = self.next_tokens[np.searchsorted(self.cumulative, targets, side="right")]
+
+            tokens[active, step] = picks
+            going = picks != _END
+            active = active[going]
+            if active.size == 0:
+                break
+            keys = (keys[going] % tail) * size + picks[going]
+
+        vocab = self.vocab.tolist()
+        separator = self.separator
+        sentences = []
+        for row in tokens.tolist():
+            end = row.index(_END) if _END in row else max_tokens
+            sentences.append(separator.join(vocab[token] for token in row[:end]))
+        return sentences
+
+    def save(self, path: str) -> None:
+        """
+        以 npz 格式保存模型，供其它进程用 load_ngram_model 直接加载。
+        """
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                vocab=self.vocab,
+                meta=np.asarray([self.order, NGRAM_LEVELS.index(self.level)], dtype=np.int64),
+                states=self.states,
+                offsets=self.offsets,
+                next_tokens=self.next_tokens,
+                cumulative=self.cumulative,
+                mean_tokens=np.asarray(self.mean_tokens),
+            )
+
+
+def build_ngram_model(
+    corpus: Iterable[str],
+    *,
+    order: int = 2,
+    level: str = "char",
+    chunk_tokens: int = 1_000_000,
+) -> NGramModel:
+    """
+    由语料编译 n 元模型。
+
+    语料遍历两遍：第一遍收集词表，第二遍按约 chunk_tokens 个词元分块切分、编号并计数后合并。
+    分词结果与编号数组只与块大小有关，不会产生与全文等长的词元列表或中间数组；
+    可重复迭代的序列（如列表）直接遍历两遍，一次性迭代器会先保存为句子字符串列表。
+
+    参数:
+        corpus: 语料句子序列，每项为一句。
+    关键字参数:
+        order: 状态长度，越大越贴近原文。
+        level: "char" 按字切分（适合中文），"word" 按空白切分。
+        chunk_tokens: 每块计数的词元数。
+
+    返回:
+        NGramModel。
+
+    异常:
+        ValueError: 当参数非法、语料为空或词表过大导致状态编码溢出时抛出。
+    """
+    if order <= 0:
+        raise ValueError("order 必须为正整数")
+    if level not in NGRAM_LEVELS:
+        raise ValueError(f"未知的切分方式: {level}，可选值为 {NGRAM_LEVELS}")
+    if chunk_tokens <= 0:
+        raise ValueError("chunk_tokens 必须为正整数")
+
+    if not isinstance(corpus, Sequence):
+        corpus = list(corpus)
+    tokens_seen: set = set()
+    sentence_count = 0
+    token_count = 0
+    for sentence in corpus:
+        tokens = _tokenize(sentence, level)
+        if tokens:
+            tokens_seen.update(tokens)
+            sentence_count += 1
+            token_count += len(tokens)
+    if not sentence_count:
+        raise ValueError("corpus 不能为空")
+
+    vocab = ["", ""] + sorted(tokens_seen)
+    size = len(vocab)
+    if size ** (order + 1) >= 2 ** 63:
+        raise ValueError(f"词表大小 {size} 在 order={order} 时超出状态编码范围，请减小 order")
+    index = {token: position for position, token in enumerate(vocab)}
+
+    pair_keys: List[np.ndarray] = []
+    pair_counts: List[np.ndarray] = []
+    for chunk in _chunks(corpus, level, chunk_tokens):
+        ids = np.fromiter(
+            (token_id for tokens in chunk for token_id in _padded_ids(tokens, index, order)),
+            dtype=np.int64,
+        )
+        keys, counts = _count_pairs(ids, [len(tokens) for tokens in chunk], order, size)
+        pair_keys.append(keys)
+        pair_counts.append(counts)
+        if len(pair_keys) > 1:
+            # 逐块合并，始终只保留一份去重后的计数
+            merged, inverse = np.unique(np.concatenate(pair_keys), return_inverse=True)
+            pair_counts = [np.bincount(inverse, weights=np.concatenate(pair_counts)).astype(np.int64)]
+            pair_keys = [merged]
+
+    keys, counts = pair_keys[0], pair_counts[0]
+    state_keys = keys // size
+    states, first = np.unique(state_keys, return_index=True)
+    return NGramModel(
+        vocab=np.asarray(vocab),
+        order=order,
+        level=level,
+        states=states,
+        offsets=np.append(first, len(keys)).astype(np.int64),
+        next_tokens=(keys % size).astype(np.int32),
+        cumulative=np.cumsum(counts).astype(np.int64),
+        mean_tokens=token_count / sentence_count,
+    )
+
+
+def load_ngram_model(path: str) -> NGramModel:
+    """
+    加载 NGramModel.save 保存的模型。
+    """
+    with np.load(path) as data:
+        order, level = data["meta"].tolist()
+        return NGramModel(
+            vocab=data["vocab"],
+            order=int(order),
+            level=NGRAM_LEVELS[level],
+            states=data["states"],
+            offsets=data["offsets"],
+            next_tokens=data["next_tokens"],
+            cumulative=data["cumulative"],
+            mean_tokens=float(data["mean_tokens"]),
+        )
+
+
+def _tokenize(sentence: str, level: str) -> List[str]:
+    return list(sentence.strip()) if level == "char" else sentence.split()
+
+
+def _padded_ids(tokens: Sequence[str], index: dict, order: int) -> Iterator[int]:
+    yield from [_BEGIN] * order
+    for token in tokens:
+        yield index[token]
+    yield _END
+
+
+def _chunks(corpus: Iterable[str], level: str, chunk_tokens: int) -> Iterator[List[List[str]]]:
+    """逐句切分语料，每累计约 chunk_tokens 个词元产出一块非空句子的词元列表。"""
+    chunk: List[List[str]] = []
+    used = 0
+    for sentence in corpus:
+        tokens = _tokenize(sentence, level)
+        if not tokens:
+            continue
+        chunk.append(tokens)
+        used += len(tokens)
+        if used >= chunk_tokens:
+            yield chunk
+            chunk = []
+            used = 0
+    if chunk:
+        yield chunk
+
+
+def _count_pairs(ids: np.ndarray, lengths: Sequence[int], order: int, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    在拼接后的编号序列上滑动窗口，得到 (状态, 后继) 编码及其出现次数。
+    """
+    # 每句占 order + len + 1 个位置，后继位置为每句填充之后的 len + 1 个位置
+    spans = np.asarray(lengths, dtype=np.int64) + order + 1
+    starts = np.concatenate(([0], np.cumsum(spans)[:-1]))
+    successors = np.concatenate([np.arange(start + order, start + span) for start, span in zip(starts, spans)])
+
+    keys = np.zeros(len(successors), dtype=np.int64)
+    for back in range(order, 0, -1):
+        keys = keys * size + ids[successors - back]
+    keys = keys * size + ids[successors]
+    return np.unique(keys, return_counts=True)
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+# 转义字符类
+_ESCAPE_CLASSES = {
+    "d": string.digits,
+    "w": string.ascii_letters + string.digits + "_",
+    "l": string.ascii_lowercase,
+    "u": string.ascii_uppercase,
+}
+
+# 组合空间不超过该值时，不重复模式按整数秩抽样，否则按整串去重
+_RANK_LIMIT = 2 ** 63 - 1
+
+
+@dataclass(frozen=True)
+class StringPattern:
+    """
+    编译后的定长模板：每个位置一张候选字符表，生成时逐位置整列抽取下标。
+
+    模板语法（类正则的子集，只描述定长串）：
+      - 普通字符按原样输出，\\ 转义特殊字符；
+      - [A-Z0-9_] 字符类，支持区间与转义；
+      - \\d 数字、\\w 字母数字下划线、\\l 小写字母、\\u 大写字母；
+      - (...) 分组；
+      - {n} 将前一个字符、字符类或分组重复 n 次。
+    例如 "ORD-[0-9]{8}"、"[A-Z0-9]{5}(-[A-Z0-9]{5}){4}"、"[京沪粤][A-HJ-NP-Z]·[A-HJ-NP-Z0-9]{5}"。
+    """
+
+    pattern: str
+    """原始模板。"""
+
+    tables: np.ndarray
+    """(长度, 最大候选数) 的 uint32 码点矩阵，每行前 sizes[i] 项有效。"""
+
+    sizes: np.ndarray
+    """每个位置的候选字符数。"""
+
+    @property
+    def length(self) -> int:
+        """匹配串的长度。"""
+        return len(self.sizes)
+
+    @property
+    def space(self) -> int:
+        """匹配串的取值空间大小，即各位置候选字符数之积。"""
+        total = 1
+        for size in self.sizes.tolist():
+            total *= size
+        return total
+
+    def generate(self, count: int, *, unique: bool = False, seed: int | None = None) -> np.ndarray:
+        """
+        批量生成匹配串。
+
+        参数:
+            count: 数量。
+        关键字参数:
+            unique: 是否保证结果不重复。
+            seed: 可选随机种子，便于复现。
+
+        返回:
+            定长 Unicode 字符串数组（dtype 为 U{length}）。
+
+        异常:
+            ValueError: 当 count 非法或不重复模式下超出取值空间时抛出。
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+
+        rng = np.random.default_rng(seed)
+        if not unique:
+            return self._draw(rng, count)
+
+        space = self.space
+        if count > space:
+            raise ValueError(f"模板的取值空间只有 {space} 个，无法生成 {count} 个不重复匹配串")
+        if space <= _RANK_LIMIT:
+            return self._render(self._digits(_unique_ranks(rng, count, space)))
+
+        # 取值空间极大时碰撞概率可以忽略，整串去重后补抽即可
+        values = self._draw(rng, count)
+        while True:
+            _, first = np.unique(values, return_index=True)
+            if len(first) == count:
+                return values
+            kept = values[np.sort(first)]
+            values = np.concatenate([kept, self._draw(rng, count - len(kept))])
+
+    def _draw(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        return self._render(rng.integers(0, self.sizes, size=(count, self.length), dtype=np.int32))
+
+    def _digits(self, ranks: np.ndarray) -> np.ndarray:
+        """把 [0, space) 内的整数秩按混合进制拆成各位置的下标。"""
+        digits = np.empty((len(ranks), self.length), dtype=np.int64)
+        ranks = ranks.copy()
+        for position in range(self.length - 1, -1, -1):
+            size = int(self.sizes[position])
+            digits[:, position] = ranks % size
+            ranks //= size
+        return digits
+
+    def _render(self, digits: np.ndarray) -> np.ndarray:
+        codes = self.tables[np.arange(self.length), digits]
+        return np.ascontiguousarray(codes, dtype=np.uint32).view(f"U{self.length}").ravel()
+
+
+@lru_cache(maxsize=128)
+def compile_pattern(pattern: str) -> StringPattern:
+    """
+    将模板编译为逐位置的抽样计划，相同模板只编译一次。
+
+    参数:
+        pattern: 模板字符串，语法见 StringPattern。
+
+    返回:
+        StringPattern。
+
+    异常:
+        ValueError: 当模板为空或包含不支持的语法时抛出。
+    """
+    positions, end = _parse_sequence(pattern, 0)
+    if end != len(pattern):
+        raise ValueError(f"模板第 {end + 1} 个字符处有多余的 ')'：{pattern}")
+    if not positions:
+        raise ValueError("pattern 不能为空")
+
+    sizes = np.asarray([len(choices) for choices in positions], dtype=np.int64)
+    tables = np.zeros((len(positions), int(sizes.max())), dtype=np.uint32)
+    for row, choices in enumerate(positions):
+        tables[row, : len(choices)] = [ord(char) for char in choices]
+    return StringPattern(pattern=pattern, tables=tables, sizes=sizes)
+
+
+def generate_pattern_strings(
+    pattern: str,
+    count: int,
+    *,
+    unique: bool = False,
+    seed: int | None = None,
+) -> List[str]:
+    """
+    按模板批量生成字符串，例如订单号 "ORD-[0-9]{8}"。
+
+    参数:
+        pattern: 模板字符串，语法见 StringPattern。
+        count: 数量。
+    关键字参数:
+        unique: 是否保证结果不重复。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        字符串列表。
+
+    异常:
+        ValueError: 当模板非法或不重复模式下超出取值空间时抛出。
+    """
+    return compile_pattern(pattern).generate(count, unique=unique, seed=seed).tolist()
+
+
+def _unique_ranks(rng: np.random.Generator, count: int, total: int) -> np.ndarray:
+    if 2 * count > total:
+        # 稠密抽取：直接截取整个空间的随机排列
+        return rng.permutation(total)[:count]
+
+    ranks = rng.integers(0, total, size=count)
+    while True:
+        _, first = np.unique(ranks, return_index=True)
+        if len(first) == count:
+            return ranks
+        kept = ranks[np.sort(first)]
+        ranks = np.concatenate([kept, rng.integers(0, total, size=count - len(kept))])
+
+
+def _parse_sequence(pattern: str, index: int) -> Tuple[List[str], int]:
+    """
+    解析到模板结尾或未配对的 ')' 为止，返回逐位置的候选字符串与停止位置。
+    """
+    positions: List[str] = []
+    while index < len(pattern) and pattern[index] != ")":
+        char = pattern[index]
+        if char == "(":
+            atom, index = _parse_sequence(pattern, index + 1)
+            if index >= len(pattern):
+                raise ValueError(f"模板缺少 ')'：{pattern}")
+            index += 1
+        elif char == "[":
+            choices, index = _parse_class(pattern, index + 1)
+            atom = [choices]
+        elif char == "\\":
+            escaped, index = _parse_escape(pattern, index + 1)
+            atom = [escaped]
+        elif char in "|*+?.":
+            raise ValueError(f"模板只描述定长串，不支持 '{char}'：{pattern}")
+        elif char in "]{}":
+            raise ValueError(f"模板第 {index + 1} 个字符 '{char}' 需要转义：{pattern}")
+        else:
+            atom = [char]
+            index += 1
+
+        repeat, index = _parse_repeat(pattern, index)
+        positions.extend(atom * repeat)
+    return positions, index
+
+
+def _parse_class(pattern: str, index: int) -> Tuple[str, int]:
+    chars: List[str] = []
+    while index < len(pattern) and pattern[index] != "]":
+        if pattern[index] == "\\":
+            member, index = _parse_escape(pattern, index + 1)
+            chars.extend(member)
+            continue
+        start = pattern[index]
+        if index + 2 < len(pattern) and pattern[index + 1] == "-" and pattern[index + 2] != "]":
+            stop = pattern[index + 2]
+            if ord(stop) < ord(start):
+                raise ValueError(f"字符区间 {start}-{stop} 非法：{pattern}")
+            chars.extend(chr(code) for code in range(ord(start), ord(stop) + 1))
+            index += 3
+        else:
+            chars.append(start)
+            index += 1
+    if index >= len(pattern):
+        raise ValueError(f"模板缺少 ']'：{pattern}")
+    choices = "".join(dict.fromkeys(chars))
+    if not choices:
+        raise ValueError(f"字符类不能为空：{pattern}")
+    return choices, index + 1
+
+
+def _parse_escape(pattern: str, index: int) -> Tuple[str, int]:
+    if index >= len(pattern):
+        raise ValueError(f"模板不能以 '\\' 结尾：{pattern}")
+    char = pattern[index]
+    return _ESCAPE_CLASSES.get(char, char), index + 1
+
+
+def _parse_repeat(pattern: str, index: int) -> Tuple[int, int]:
+    if index >= len(pattern) or pattern[index] != "{":
+        return 1, index
+    end = pattern.find("}", index)
+    body = pattern[index + 1 : end] if end != -1 else ""
+    if not body.isdigit():
+        raise ValueError(f"只支持定长重复 {{n}}：{pattern}")
+    return int(body), end + 1
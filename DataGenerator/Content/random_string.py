@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import random
 import string
-from typing import List, Sequence
+from functools import lru_cache
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
 
 
 DEFAULT_CHARSET: Sequence[str] = tuple(string.ascii_letters + string.digits)
@@ -61,7 +64,7 @@ def random_strings(
         max_length: 每个字符串的最大长度，必须为正整数。
     关键字参数:
         min_length: 每个字符串的最小长度，默认 0。
-        charset: 可选字符集，默认包含大小写字母及数字。
+        charset: 可选字符集，默认包含大小写字母及数字；元素也可以是多字符片段，此时长度按片段计。
         seed: 可选随机种子，用于复现。
 
     返回:
@@ -81,13 +84,174 @@ def random_strings(
     if not charset:
         raise ValueError("charset 不能为空")
 
-    rng = random.Random(seed)
-    return [
-        random_string(
-            max_length,
-            min_length=min_length,
-            charset=charset,
-            seed=rng.randint(0, 1_000_000_000),
-        )
-        for _ in range(count)
-    ]
+    rng = np.random.default_rng(seed)
+    if any(len(token) != 1 for token in charset):
+        # 含多字符片段时无法按字符码批量解码，按片段逐串拼接
+        lengths = rng.integers(min_length, max_length + 1, size=count)
+        tokens = np.asarray(charset, dtype=object)[rng.integers(0, len(charset), size=int(lengths.sum()))].tolist()
+        ends = np.cumsum(lengths).tolist()
+        return ["".join(tokens[end - length : end]) for end, length in zip(ends, lengths.tolist())]
+
+    codes, lengths = _draw_strings(count, max_length, min_length, charset, rng)
+    text = _decode(codes)
+    ends = np.cumsum(lengths).tolist()
+    return [text[end - length : end] for end, length in zip(ends, lengths.tolist())]
+
+
+def random_strings_blob(
+    count: int,
+    max_length: int,
+    *,
+    min_length: int = 0,
+    charset: Sequence[str] = DEFAULT_CHARSET,
+    seed: int | None = None,
+) -> bytes:
+    """
+    批量生成随机字符串并直接返回 UTF-8 字节串，每个字符串后跟一个换行符，可直接写入文件。
+    整个过程只在一个缓冲区上操作，不为单个字符串分配对象；相同 seed 下行内容与 random_strings 一致。
+
+    参数:
+        count: 需要生成的字符串数量，必须为正整数。
+        max_length: 每个字符串的最大长度，必须为正整数。
+    关键字参数:
+        min_length: 每个字符串的最小长度，默认 0。
+        charset: 可选字符集，每个元素须为单个字符。
+        seed: 可选随机种子，用于复现。
+
+    返回:
+        以换行分隔（含末尾换行）的字节串。
+
+    异常:
+        ValueError: 当参数非法、字符集为空或 charset 含多字符元素时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    codes, lengths = _draw_strings(count, max_length, min_length, charset, np.random.default_rng(seed))
+    return _join_lines(codes, lengths)
+
+
+def iter_random_string_blobs(
+    count: int,
+    max_length: int,
+    *,
+    min_length: int = 0,
+    charset: Sequence[str] = DEFAULT_CHARSET,
+    chunk_size: int = 1_000_000,
+    seed: int | None = None,
+) -> Iterator[bytes]:
+    """
+    分块生成 random_strings_blob 格式的字节串，每块最多 chunk_size 个字符串，适合流式写入千万级数据。
+
+    参数:
+        count: 需要生成的字符串总数，必须为正整数。
+        max_length: 每个字符串的最大长度，必须为正整数。
+    关键字参数:
+        min_length: 每个字符串的最小长度，默认 0。
+        charset: 可选字符集，每个元素须为单个字符。
+        chunk_size: 每块字符串数量。
+        seed: 可选随机种子，用于复现。
+
+    返回:
+        字节串迭代器。
+
+    异常:
+        ValueError: 当参数非法、字符集为空或 charset 含多字符元素时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须为正整数")
+
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, chunk_size):
+        codes, lengths = _draw_strings(min(chunk_size, count - start), max_length, min_length, charset, rng)
+        yield _join_lines(codes, lengths)
+
+
+def _draw_strings(
+    count: int,
+    max_length: int,
+    min_length: int,
+    charset: Sequence[str],
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    一次抽取全部字符串的长度与字符，返回拼接后的字符码数组及每个字符串的长度。
+    """
+    if max_length <= 0:
+        raise ValueError("max_length 必须为正整数")
+    if min_length < 0:
+        raise ValueError("min_length 不能为负数")
+    if min_length > max_length:
+        raise ValueError("min_length 不能大于 max_length")
+    if not charset:
+        raise ValueError("charset 不能为空")
+
+    lengths = rng.integers(min_length, max_length + 1, size=count)
+    return _draw_codes(rng, int(lengths.sum()), tuple(charset)), lengths
+
+
+def _draw_codes(rng: np.random.Generator, size: int, charset: Tuple[str, ...]) -> np.ndarray:
+    """
+    无偏地抽取 size 个字符码：字符集不超过 256 个时按随机字节查 256 项查找表，
+    大小为 2 的幂时每个字节都可用（无拒绝），否则丢弃落在 256 除以字符集大小的余数区间内的字节；
+    超过 256 个时交给 Generator.integers。
+    """
+    table, byte_table = _charset_tables(charset)
+    if byte_table is None:
+        return table[rng.integers(0, len(table), size=size)]
+
+    limit = 256 - 256 % len(table)
+    if limit == 256:
+        return byte_table[np.frombuffer(rng.bytes(size), dtype=np.uint8)]
+
+    codes = np.empty(size, dtype=table.dtype)
+    filled = 0
+    while filled < size:
+        # 按接受率多抽一些字节，通常一轮即可凑够
+        wanted = size - filled
+        raw = np.frombuffer(rng.bytes(int(wanted * 256 / limit) + 64), dtype=np.uint8)
+        accepted = byte_table[raw[raw < limit][:wanted]]
+        codes[filled : filled + len(accepted)] = accepted
+        filled += len(accepted)
+    return codes
+
+
+@lru_cache(maxsize=32)
+def _charset_tables(charset: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray | None]:
+    """
+    返回 (字符码表, 按字节值索引的 256 项查找表)；字符码全部为 ASCII 时为 uint8，否则为 uint32。
+    字符集超过 256 个字符时没有字节查找表。
+    """
+    if any(len(char) != 1 for char in charset):
+        raise ValueError("批量生成要求 charset 的每个元素为单个字符")
+    table = np.asarray([ord(char) for char in charset], dtype=np.uint32)
+    if table.max() < 128:
+        table = table.astype(np.uint8)
+    if len(table) > 256:
+        return table, None
+    return table, table[np.arange(256) % len(table)]
+
+
+def _decode(codes: np.ndarray) -> str:
+    if codes.dtype == np.uint8:
+        return codes.tobytes().decode("ascii")
+    return codes.astype("<u4").tobytes().decode("utf-32-le")
+
+
+def _join_lines(codes: np.ndarray, lengths: np.ndarray) -> bytes:
+    buffer = np.empty(len(codes) + len(lengths), dtype=codes.dtype)
+    if lengths.min() == lengths.max():
+        # 定长时按 (count, length + 1) 矩阵整列写入，省去掩码
+        rows = buffer.reshape(len(lengths), -1)
+        rows[:, :-1] = codes.reshape(len(lengths), -1)
+        rows[:, -1] = ord("\n")
+    else:
+        newlines = np.cumsum(lengths + 1) - 1
+        is_char = np.ones(len(buffer), dtype=bool)
+        is_char[newlines] = False
+        buffer[newlines] = ord("\n")
+        buffer[is_char] = codes
+    if buffer.dtype == np.uint8:
+        return buffer.tobytes()
+    return _decode(buffer).encode("utf-8")
@@ -1,6 +1,16 @@
 # pip install markovify
+from __future__ import annotations
+
+import hashlib
+import os
 import random
-from typing import Tuple
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Sequence, Tuple
+
+from DataGenerator.Content.ngram import NGramModel, build_ngram_model, load_ngram_model
+from DataGenerator.Content.sentence_bank import SentenceBank, build_sentence_bank
 
 try:
     import markovify
@@ -136,19 +146,269 @@ _DEFAULT_CORPUS = [
 ]
 
 
-def _build_default_model(state_size: int = 2):
-    text = "\n".join(_DEFAULT_CORPUS)
-    return markovify.Text(text, state_size=state_size) if markovify else None
+@dataclass
+class MarkovModelStats:
+    """文本模型（马尔可夫 / n 元）缓存的命中与耗时统计。"""
+
+    hits: int = 0
+    """直接复用内存中模型的次数。"""
+
+    builds: int = 0
+    """从语料重新训练模型的次数。"""
+
+    loads: int = 0
+    """从磁盘加载已编译模型的次数。"""
+
+    build_seconds: float = 0.0
+    """训练（含编译）模型累计耗时（秒）。"""
+
+    load_seconds: float = 0.0
+    """从磁盘加载模型累计耗时（秒）。"""
+
+
+TEXT_ENGINES: tuple[str, ...] = ("ngram", "markov")
 
+# 每个模型预生成的句子数，拼装文本时只从句子库中抽取
+SENTENCE_BANK_SIZE = 2048
 
-def generate_coherent_text(target_length: int = 200, state_size: int = 2) -> Tuple[str, int]:
+_models: Dict[Tuple, object] = {}
+_banks: Dict[Tuple, SentenceBank] = {}
+_models_lock = threading.Lock()
+_stats = MarkovModelStats()
+
+
+def corpus_fingerprint(corpus: Sequence[str]) -> str:
     """
-    随机生成一段具有上下文连续性的文本。
-    若安装了 markovify 则使用马尔可夫链生成；否则退化为简单拼接默认段落。
+    计算语料的指纹，作为模型缓存键与持久化文件名的一部分。
 
     参数:
-      target_length: 目标字符数（大约值，最终结果可能略有偏差）。
-      state_size: 马尔可夫模型的状态长度，影响句子连贯程度。
+      corpus: 语料句子列表。
+
+    返回:
+      32 位十六进制字符串。
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for sentence in corpus:
+        digest.update(sentence.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def get_markov_model(
+    corpus: Sequence[str] | None = None,
+    *,
+    state_size: int = 2,
+    cache_dir: str | None = None,
+):
+    """
+    获取按 (语料指纹, state_size) 缓存的已编译马尔可夫模型。
+
+    首次使用时依次尝试：内存缓存 → cache_dir 中持久化的模型 → 重新训练并编译；
+    重新训练后若指定了 cache_dir，会以 markovify 的 JSON 格式写入磁盘，供其它进程直接加载。
+
+    参数:
+      corpus: 语料句子列表，默认使用内置语料。
+      state_size: 马尔可夫模型的状态长度。
+      cache_dir: 可选的模型持久化目录。
+
+    返回:
+      markovify.Text 模型；未安装 markovify 时返回 None。
+    """
+    if markovify is None:
+        return None
+    if state_size <= 0:
+        raise ValueError("state_size 必须为正整数")
+
+    corpus = _DEFAULT_CORPUS if corpus is None else corpus
+    fingerprint = corpus_fingerprint(corpus)
+    path = None if cache_dir is None else os.path.join(cache_dir, f"markov_{fingerprint}_{state_size}.json")
+
+    def save(model, target: str) -> None:
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(model.to_json())
+
+    def load(source: str):
+        with open(source, encoding="utf-8") as f:
+            return markovify.Text.from_json(f.read())
+
+    return _cached_model(
+        ("markov", fingerprint, state_size),
+        lambda: markovify.Text("\n".join(corpus), state_size=state_size).compile(inplace=True),
+        path=path,
+        load=load,
+        save=save,
+    )
+
+
+def get_ngram_model(
+    corpus: Sequence[str] | None = None,
+    *,
+    state_size: int = 2,
+    level: str = "char",
+    cache_dir: str | None = None,
+) -> NGramModel:
+    """
+    获取按 (语料指纹, state_size, level) 缓存的内置 n 元模型，缓存规则同 get_markov_model。
+
+    参数:
+      corpus: 语料句子列表，默认使用内置语料。
+      state_size: n 元模型的状态长度。
+      level: "char" 按字切分（适合中文），"word" 按空白切分。
+      cache_dir: 可选的模型持久化目录（npz 格式）。
+
+    返回:
+      NGramModel。
+    """
+    corpus = _DEFAULT_CORPUS if corpus is None else corpus
+    fingerprint = corpus_fingerprint(corpus)
+    path = None if cache_dir is None else os.path.join(cache_dir, f"ngram_{fingerprint}_{state_size}_{level}.npz")
+    return _cached_model(
+        ("ngram", fingerprint, state_size, level),
+        lambda: build_ngram_model(corpus, order=state_size, level=level),
+        path=path,
+        load=load_ngram_model,
+        save=lambda model, target: model.save(target),
+    )
+
+
+def _cached_model(
+    key: Tuple,
+    build: Callable[[], object],
+    *,
+    path: str | None,
+    load: Callable[[str], object],
+    save: Callable[[object, str], None],
+):
+    """
+    依次尝试内存缓存、磁盘持久化文件与重新构建，并记录命中与耗时。
+
+    加载与构建在锁外进行，不阻塞其它语料的缓存命中与构建；同一 key 并发构建时以先写入缓存的为准。
+    """
+    with _models_lock:
+        model = _models.get(key)
+        if model is not None:
+            _stats.hits += 1
+            return model
+
+    started = time.perf_counter()
+    if path is not None and os.path.exists(path):
+        model = load(path)
+        with _models_lock:
+            _stats.load_seconds += time.perf_counter() - started
+            _stats.loads += 1
+    else:
+        model = build()
+        with _models_lock:
+            _stats.build_seconds += time.perf_counter() - started
+            _stats.builds += 1
+        if path is not None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 先写临时文件再改名，避免并发进程或线程读到不完整的模型
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            save(model, temp_path)
+            os.replace(temp_path, path)
+
+    with _models_lock:
+        return _models.setdefault(key, model)
+
+
+def markov_model_stats() -> MarkovModelStats:
+    """
+    返回模型缓存统计的快照。
+    """
+    with _models_lock:
+        return replace(_stats)
+
+
+def clear_markov_model_cache() -> None:
+    """
+    清空内存中缓存的模型、句子库与统计数据（不删除磁盘上的持久化文件）。
+    """
+    global _stats
+    with _models_lock:
+        _models.clear()
+        _banks.clear()
+        _stats = MarkovModelStats()
+
+
+def get_sentence_bank(
+    corpus: Sequence[str] | None = None,
+    *,
+    state_size: int = 2,
+    engine: str = "ngram",
+    cache_dir: str | None = None,
+) -> SentenceBank:
+    """
+    获取按 (引擎, 语料指纹, state_size) 缓存的句子库：由对应模型预生成 SENTENCE_BANK_SIZE 句并按长度索引；
+    engine="markov" 且未安装 markovify 时直接使用语料句子。
+
+    参数:
+      corpus: 语料句子列表，默认使用内置语料。
+      state_size: 模型的状态长度。
+      engine: "ngram" 或 "markov"。
+      cache_dir: 可选的模型持久化目录，见 get_markov_model。
+
+    返回:
+      SentenceBank。
+    """
+    if engine not in TEXT_ENGINES:
+        raise ValueError(f"未知的文本引擎: {engine}，可选值为 {TEXT_ENGINES}")
+
+    corpus = _DEFAULT_CORPUS if corpus is None else corpus
+    key = (engine, corpus_fingerprint(corpus), state_size)
+    with _models_lock:
+        bank = _banks.get(key)
+    if bank is not None:
+        return bank
+
+    if engine == "ngram":
+        model = get_ngram_model(corpus, state_size=state_size, cache_dir=cache_dir)
+        # 限制单句长度并丢弃被截断的句子；固定种子使各进程得到相同的句子库
+        max_tokens = int(3 * model.mean_tokens) + 1
+        sentences = [
+            sentence
+            for sentence in model.generate(SENTENCE_BANK_SIZE, max_tokens=max_tokens, seed=0)
+            if len(sentence) < max_tokens
+        ]
+    elif markovify:
+        model = get_markov_model(corpus, state_size=state_size, cache_dir=cache_dir)
+        # markovify 使用 random 模块：固定种子生成后恢复原状态，使各进程得到相同的句子库
+        state = random.getstate()
+        random.seed(0)
+        try:
+            sentences = [model.make_sentence() or random.choice(corpus) for _ in range(SENTENCE_BANK_SIZE)]
+        finally:
+            random.setstate(state)
+    else:
+        sentences = list(corpus)
+
+    bank = build_sentence_bank(sentences)
+    with _models_lock:
+        return _banks.setdefault(key, bank)
+
+
+def generate_coherent_text(
+    target_length: int = 200,
+    state_size: int = 2,
+    *,
+    corpus: Sequence[str] | None = None,
+    cache_dir: str | None = None,
+    engine: str = "ngram",
+    seed: int | None = None,
+) -> Tuple[str, int]:
+    """
+    随机生成一段具有上下文连续性、长度恰好为 target_length 的文本。
+    默认使用内置的字级 n 元模型；engine="markov" 时使用 markovify
+    （按空白切词，对无空格的中文语料基本只会原样返回整句），未安装 markovify 时退化为拼接语料句子。
+    句子取自按长度索引的句子库（见 get_sentence_bank），按子集和凑足目标长度，不再生成后截断。
+
+    参数:
+      target_length: 目标字符数。
+      state_size: 模型的状态长度，影响句子连贯程度。
+      corpus: 可选的自定义语料句子列表，默认使用内置语料。
+      cache_dir: 可选的模型持久化目录，见 get_markov_model。
+      engine: "ngram"（默认）或 "markov"。
+      seed: 可选随机种子，便于复现。
 
     返回:
       (text, actual_length): 文本内容及实际字符数。
@@ -156,22 +416,14 @@ def generate_coherent_text(target_length: int = 200, state_size: int = 2) -> Tup
     if target_length <= 0:
         return "", 0
 
-    if markovify:
-        model = _build_default_model(state_size)
-        sentences = []
-        current_length = 0
-        while current_length < target_length:
-            sentence = model.make_sentence() or random.choice(_DEFAULT_CORPUS)
-            sentences.append(sentence)
-            current_length += len(sentence)
-        text = " ".join(sentences)
-    else:
-        random.shuffle(_DEFAULT_CORPUS)
-        text = " ".join(_DEFAULT_CORPUS)
-        while len(text) < target_length:
-            text += " " + random.choice(_DEFAULT_CORPUS)
+    corpus = _DEFAULT_CORPUS if corpus is None else list(corpus)
+    if not corpus:
+        raise ValueError("corpus 不能为空")
 
-    text = text[:target_length] if len(text) > target_length + 50 else text
+    bank = get_sentence_bank(corpus, state_size=state_size, engine=engine, cache_dir=cache_dir)
+    # n 元模型按字生成中文句子，直接相连；马尔可夫及退化路径沿用空格分隔
+    separator = "" if engine == "ngram" else " "
+    text = separator.join(bank.assemble(target_length, rng=random.Random(seed), separator=separator))
     return text, len(text)
 
 
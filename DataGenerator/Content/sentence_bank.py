@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class SentenceBank:
+    """
+    按字符长度建立索引的句子库。
+
+    buckets 为 长度 → 句子编号 的分桶（即长度直方图），拼装时先整批随机抽句，
+    剩余长度较小时再按桶做一/二句的子集和精确匹配，不需要先生成多余文本再截断。
+    """
+
+    sentences: Tuple[str, ...]
+    """句子素材。"""
+
+    buckets: Dict[int, Tuple[int, ...]]
+    """长度 → 该长度的句子编号。"""
+
+    lengths: Tuple[int, ...]
+    """升序排列的不同句长。"""
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def assemble(self, target_length: int, *, rng: random.Random, separator: str = "") -> List[str]:
+        """
+        选出若干句子，使其以 separator 连接后的长度恰好为 target_length。
+
+        先按库内自然分布整批抽句，直到剩余长度不超过两句最大长度；之后依次尝试
+        一句或两句恰好补齐，否则抽一句仍留有余量的句子继续，最后仍差的几个字符
+        由一句截断的句子补齐（仅在子集和无解时出现）。
+
+        参数:
+            target_length: 目标字符数。
+        关键字参数:
+            rng: 随机数生成器。
+            separator: 句子之间的连接符。
+
+        返回:
+            句子列表，"separator".join(结果) 的长度等于 target_length。
+        """
+        if target_length <= 0:
+            return []
+
+        gap = len(separator)
+        shortest, longest = self.lengths[0] + gap, self.lengths[-1] + gap
+        # 每句连同其后的连接符计长，末尾多出的一个连接符计入目标
+        remaining = target_length + gap
+        picked: List[str] = []
+
+        while remaining > 2 * longest:
+            # 每句最多占 longest，本批抽完仍不会越过两句最大长度的余量
+            batch = rng.choices(self.sentences, k=max(1, (remaining - 2 * longest) // longest))
+            picked.extend(batch)
+            remaining -= sum(len(sentence) for sentence in batch) + gap * len(batch)
+
+        while remaining > 0:
+            ending = self._exact(remaining - gap, rng) or self._exact_pair(remaining - 2 * gap, rng)
+            if ending:
+                picked.extend(ending)
+                break
+
+            roomy = [length for length in self.lengths if length + gap <= remaining - shortest]
+            fitting = roomy or [length for length in self.lengths if length + 2 * gap < remaining]
+            if not fitting:
+                # 剩余不足以再放一整句：从最长的句子截取补齐；最长句仍差不到一个连接符时，
+                # 以连接符补足，保证结果恰好等长
+                longest_sentence = self.sentences[rng.choice(self.buckets[self.lengths[-1]])]
+                picked.append((longest_sentence + separator)[: remaining - gap])
+                break
+            sentence = self.sentences[rng.choice(self.buckets[rng.choice(fitting)])]
+            picked.append(sentence)
+            remaining -= len(sentence) + gap
+
+        return picked
+
+    def _exact(self, length: int, rng: random.Random) -> List[str]:
+        bucket = self.buckets.get(length)
+        return [self.sentences[rng.choice(bucket)]] if bucket else []
+
+    def _exact_pair(self, length: int, rng: random.Random) -> List[str]:
+        firsts = [first for first in self.lengths if length - first in self.buckets]
+        if not firsts:
+            return []
+        first = rng.choice(firsts)
+        return [
+            self.sentences[rng.choice(self.buckets[first])],
+            self.sentences[rng.choice(self.buckets[length - first])],
+        ]
+
+
+def build_sentence_bank(sentences: Iterable[str]) -> SentenceBank:
+    """
+    由句子素材建立长度索引，空句会被忽略。
+
+    异常:
+        ValueError: 当素材为空时抛出。
+    """
+    pool = tuple(sentence for sentence in sentences if sentence)
+    if not pool:
+        raise ValueError("sentences 不能为空")
+
+    buckets: Dict[int, List[int]] = {}
+    for position, sentence in enumerate(pool):
+        buckets.setdefault(len(sentence), []).append(position)
+    return SentenceBank(
+        sentences=pool,
+        buckets={length: tuple(positions) for length, positions in buckets.items()},
+        lengths=tuple(sorted(buckets)),
+    )
+
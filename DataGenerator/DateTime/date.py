@@ -1,42 +1,61 @@
 import random
-from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
 
-def generate_date_range(start_date: str, end_date: str, date_format: str = "%Y-%m-%d", quantity: Optional[int] = None) -> list[str]:
+from DataGenerator.DateTime.timestamp import DateTimeRange, datetime_range
+
+
+def generate_date_range(
+    start_date: str,
+    end_date: str,
+    date_format: str = "%Y-%m-%d",
+    quantity: Optional[int] = None,
+    *,
+    seed: Optional[int] = None,
+) -> list[str]:
     """
     返回给定起止日期（包含端点）的日期列表。
 
-    :param start_date: 起始日期字符串，例如 "2024-01-01"
+    :param start_date: 起始日期字符串，例如 "2024-01-01"；格式中含时分秒时，各日期保留起始时刻的时分秒
     :param end_date: 结束日期字符串，例如 "2024-01-10"
     :param date_format: 日期字符串格式，默认 "%Y-%m-%d"
     :param quantity: 需要返回的日期数量，默认返回全部；当数量超过区间长度时会随机重复日期
+    :param seed: 可选随机种子；未指定时由 random 模块派生，random.seed() 同样可以复现结果
     :return: 日期字符串列表
     :raises ValueError: 当起始日期在结束日期之后时抛出
     :raises ValueError: 当 quantity 非正整数时抛出
     """
-    start = datetime.strptime(start_date, date_format)
-    end = datetime.strptime(end_date, date_format)
-    if start > end:
-        raise ValueError("start_date 不能晚于 end_date")
-    total_days = (end - start).days + 1
+    if quantity is not None and quantity <= 0:
+        raise ValueError("quantity 必须为正整数")
+    # 起止日期按 (起止, 格式) 只解析一次，随后整批抽样与格式化
+    date_range = datetime_range(start_date, end_date, resolution="s", fmt=date_format)
+    rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
     if quantity is not None:
-        if quantity <= 0:
-            raise ValueError("quantity 必须为正整数")
-        offsets = [random.randrange(total_days) for _ in range(quantity)]
+        offsets = rng.integers(0, _day_count(date_range), size=quantity)
     else:
-        offsets = list(range(total_days))
-        random.shuffle(offsets)
-    return [(start + timedelta(days=offset)).strftime(date_format) for offset in offsets]
+        offsets = rng.permutation(_day_count(date_range))
+    values = date_range.start + offsets.astype("m8[D]")
+    return date_range.format(values, date_format).tolist()
 
-def generate_date(start_date: str, end_date: str, date_format: str = "%Y-%m-%d") -> str:
+def generate_date(start_date: str, end_date: str, date_format: str = "%Y-%m-%d", *, seed: Optional[int] = None) -> str:
     """
     返回给定区间内的单个随机日期字符串。
 
     :param start_date: 起始日期字符串，例如 "2024-01-01"
     :param end_date: 结束日期字符串，例如 "2024-01-10"
     :param date_format: 日期字符串格式，默认 "%Y-%m-%d"
+    :param seed: 可选随机种子；未指定时使用 random 模块
     :return: 单个随机日期字符串
     :raises ValueError: 当起始日期在结束日期之后时抛出
     """
-    return generate_date_range(start_date, end_date, date_format, quantity=1)[0]
\ No newline at end of file
+    # 单个日期不走批量路径，避免为一个值创建数组与随机数生成器
+    date_range = datetime_range(start_date, end_date, resolution="s", fmt=date_format)
+    offset = (random if seed is None else random.Random(seed)).randrange(_day_count(date_range))
+    value = date_range.start + np.timedelta64(offset, "D")
+    return value.item().strftime(date_format)
+
+
+def _day_count(date_range: DateTimeRange) -> int:
+    """从起始时刻起按整天偏移、不超过结束时刻的日期个数。"""
+    return int((date_range.end - date_range.start) // np.timedelta64(1, "D")) + 1
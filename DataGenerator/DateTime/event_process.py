@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Iterator, List, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from DataGenerator.DateTime.timestamp import DEFAULT_DATETIME_FORMAT, format_datetimes
+
+# 支持的事件到达过程：泊松（指数间隔）、突发（Pareto 重尾间隔）、按一天 24 小时强度调制的泊松过程
+EVENT_PROCESSES: tuple[str, ...] = ("poisson", "bursty", "diurnal")
+
+# 工作日典型的逐小时相对强度：凌晨低谷，上午与下午两个高峰
+DEFAULT_DIURNAL_PROFILE: tuple[float, ...] = (
+    0.2, 0.1, 0.1, 0.1, 0.1, 0.2, 0.4, 0.8, 1.5, 2.0, 2.2, 1.8,
+    1.2, 1.6, 2.0, 2.1, 1.9, 1.5, 1.1, 0.9, 0.8, 0.6, 0.4, 0.3,
+)
+
+_SECONDS_PER_DAY = 86_400
+_SECONDS_PER_HOUR = 3_600
+
+
+@dataclass(frozen=True)
+class EventProcess:
+    """
+    事件到达过程，批量生成单调不减的事件时间戳（UNIX 秒，float64）。
+
+    - poisson：间隔服从均值 1/rate 的指数分布；
+    - bursty：间隔服从形状参数 shape 的 Pareto（Lomax）分布并缩放到均值 1/rate，
+      大量极短间隔与少量长静默交替，形成突发；
+    - diurnal：强度随一天中的小时按 profile 变化、全天平均为 rate 的非齐次泊松过程，
+      用时间变换法生成：先在“累计强度”轴上生成单位速率泊松点，再按分段线性的累计强度函数反解回时间。
+
+    时间戳以 float64 表示，整批由间隔的前缀和得到；分块生成时只在块之间携带最后一个时刻，
+    因此可以流式生成任意数量的事件。
+    """
+
+    kind: str
+    """过程类型，取值见 EVENT_PROCESSES。"""
+
+    rate: float
+    """平均事件速率（每秒事件数）。"""
+
+    shape: float = 1.5
+    """bursty 的 Pareto 形状参数（须大于 1，越接近 1 越突发）。"""
+
+    profile: Tuple[float, ...] = DEFAULT_DIURNAL_PROFILE
+    """diurnal 的 24 个逐小时相对强度，会按全天平均值归一化。"""
+
+    utc_offset: int = 0
+    """diurnal 中 profile 所在时区相对 UTC 的偏移（秒），例如北京时间为 28800。"""
+
+    def times(self, count: int, *, start: float = 0.0, seed: int | np.random.Generator | None = None) -> np.ndarray:
+        """
+        生成 count 个事件时间戳，首个事件发生在 start 之后一个随机间隔处。
+
+        :param count: 数量
+        :param start: 起始时刻（UNIX 秒）
+        :param seed: 可选随机种子或 numpy Generator
+        :return: 单调不减的 float64 数组
+        :raises ValueError: 当 count 非正整数时抛出
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        rng = np.random.default_rng(seed)
+        if self.kind == "diurnal":
+            return self._diurnal_times(rng, count, float(start))
+        return float(start) + np.cumsum(self._gaps(rng, count))
+
+    def gaps(self, count: int, *, start: float = 0.0, seed: int | np.random.Generator | None = None) -> np.ndarray:
+        """
+        生成从 start 起的 count 个相邻事件间隔，适合逐包累加时间的生成器直接消费。
+
+        :param count: 数量
+        :param start: 起始时刻（UNIX 秒），diurnal 的间隔取决于所处时段
+        :param seed: 可选随机种子或 numpy Generator
+        :return: 非负 float64 数组
+        """
+        return np.diff(self.times(count, start=start, seed=seed), prepend=float(start))
+
+    def iter_times(
+        self,
+        count: int,
+        *,
+        start: float = 0.0,
+        chunk_size: int = 1_000_000,
+        seed: int | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        分块生成 count 个事件时间戳，块与块首尾相接，内存占用只与 chunk_size 有关。
+
+        :param count: 总数量
+        :param start: 起始时刻（UNIX 秒）
+        :param chunk_size: 每块数量
+        :param seed: 可选随机种子
+        :return: float64 数组迭代器
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size 必须为正整数")
+        rng = np.random.default_rng(seed)
+        last = float(start)
+        for offset in range(0, count, chunk_size):
+            chunk = self.times(min(chunk_size, count - offset), start=last, seed=rng)
+            last = float(chunk[-1])
+            yield chunk
+
+    def _gaps(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        if self.kind == "bursty":
+            # Lomax(shape) 的均值为 1 / (shape - 1)
+            return rng.pareto(self.shape, size=count) * ((self.shape - 1.0) / self.rate)
+        return rng.exponential(1.0 / self.rate, size=count)
+
+    def _diurnal_times(self, rng: np.random.Generator, count: int, start: float) -> np.ndarray:
+        cumulative, hourly = _diurnal_tables(self.profile, self.rate)
+        per_day = cumulative[-1]
+
+        # 正变换：起点在累计强度轴上的位置
+        local = start + self.utc_offset
+        day, second = divmod(local, _SECONDS_PER_DAY)
+        hour = min(int(second // _SECONDS_PER_HOUR), 23)
+        origin = day * per_day + cumulative[hour] + (second - hour * _SECONDS_PER_HOUR) * hourly[hour]
+
+        # 单位速率泊松点，再逐点反解：整天数 + 小时段（searchsorted）+ 段内线性插值
+        levels = origin + np.cumsum(rng.standard_exponential(count))
+        days, remainder = np.divmod(levels, per_day)
+        hours = np.searchsorted(cumulative, remainder, side="right") - 1
+        np.minimum(hours, 23, out=hours)
+        seconds = hours * _SECONDS_PER_HOUR + (remainder - cumulative[hours]) / hourly[hours]
+        times = days * _SECONDS_PER_DAY + seconds - self.utc_offset
+        # 浮点舍入可能使首个时刻略早于 start 或相邻时刻轻微倒序，夹回单调
+        np.maximum(times, start, out=times)
+        return np.maximum.accumulate(times)
+
+
+def event_process(
+    kind: str = "poisson",
+    rate: float = 1.0,
+    *,
+    shape: float = 1.5,
+    profile: Sequence[float] | None = None,
+    utc_offset: int = 0,
+) -> EventProcess:
+    """
+    校验参数并构造 EventProcess。
+
+    :param kind: 过程类型，"poisson"、"bursty" 或 "diurnal"
+    :param rate: 平均事件速率（每秒事件数）
+    :param shape: bursty 的 Pareto 形状参数，须大于 1
+    :param profile: diurnal 的 24 个逐小时相对强度，默认 DEFAULT_DIURNAL_PROFILE
+    :param utc_offset: diurnal 中 profile 所在时区相对 UTC 的偏移（秒）
+    :return: EventProcess
+    :raises ValueError: 当参数非法时抛出
+    """
+    if kind not in EVENT_PROCESSES:
+        raise ValueError(f"未知的事件过程: {kind}，可选值为 {EVENT_PROCESSES}")
+    if not rate > 0:
+        raise ValueError("rate 必须为正数")
+    if kind == "bursty" and not shape > 1:
+        raise ValueError("shape 必须大于 1")
+
+    profile = DEFAULT_DIURNAL_PROFILE if profile is None else tuple(float(value) for value in profile)
+    if len(profile) != 24:
+        raise ValueError("profile 必须包含 24 个逐小时强度")
+    if min(profile) < 0 or not sum(profile) > 0:
+        raise ValueError("profile 的强度不能为负且不能全为 0")
+    return EventProcess(kind=kind, rate=float(rate), shape=float(shape), profile=profile, utc_offset=int(utc_offset))
+
+
+def generate_event_times(
+    start: str | date,
+    count: int,
+    *,
+    kind: str = "poisson",
+    rate: float = 1.0,
+    fmt: str = DEFAULT_DATETIME_FORMAT,
+    tz: str | tzinfo | None = None,
+    seed: int | None = None,
+) -> List[str]:
+    """
+    从 start 起按事件过程生成 count 个升序时间字符串，适合日志、访问记录等时间线。
+
+    :param start: 起始时间，ISO 8601 字符串、date 或 datetime；不带时区时按 tz 的当地时间理解，未指定 tz 时按 UTC
+    :param count: 数量
+    :param kind: 过程类型，见 EVENT_PROCESSES；diurnal 的强度曲线按 tz 在 start 处的偏移对齐当地时间
+    :param rate: 平均事件速率（每秒事件数）
+    :param fmt: 输出格式，默认 "%Y-%m-%d %H:%M:%S"
+    :param tz: 可选时区，输出为该时区的当地时间
+    :param seed: 可选随机种子
+    :return: 时间字符串列表
+    """
+    if isinstance(tz, str):
+        tz = ZoneInfo(tz)
+    start_time = _epoch_seconds(start, tz)
+    offset = 0
+    if tz is not None:
+        offset = int(datetime.fromtimestamp(start_time, tz).utcoffset().total_seconds())
+    process = event_process(kind, rate, utc_offset=offset)
+    return format_datetimes(to_datetime64(process.times(count, start=start_time, seed=seed)), fmt, tz=tz).tolist()
+
+
+def to_datetime64(times: np.ndarray, resolution: str = "ms") -> np.ndarray:
+    """
+    将 UNIX 秒时间戳转换为 datetime64（UTC），可交给 format_datetimes 批量格式化。
+
+    :param times: float 时间戳数组
+    :param resolution: 目标精度，"s"、"ms" 或 "us"
+    :return: datetime64 数组
+    """
+    scale = {"s": 1, "ms": 1_000, "us": 1_000_000}.get(resolution)
+    if scale is None:
+        raise ValueError(f"未知的时间精度: {resolution}")
+    return np.floor(np.asarray(times, dtype=np.float64) * scale).astype(np.int64).astype(f"M8[{resolution}]")
+
+
+@lru_cache(maxsize=64)
+def _diurnal_tables(profile: Tuple[float, ...], rate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    返回 (每小时起点的累计强度, 每小时的强度)，强度按全天平均为 rate 归一化。
+    """
+    weights = np.asarray(profile, dtype=np.float64)
+    hourly = weights * (rate * 24 / weights.sum())
+    cumulative = np.concatenate(([0.0], np.cumsum(hourly * _SECONDS_PER_HOUR)))
+    return cumulative, hourly
+
+
+def _epoch_seconds(value: str | date, tz: tzinfo | None) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz or timezone.utc)
+    return value.timestamp()
@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+# 支持的时间精度（numpy datetime64 单位）：天、秒、毫秒
+DATETIME_RESOLUTIONS: tuple[str, ...] = ("D", "s", "ms")
+
+DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 可批量格式化的指令及其输出宽度，其余指令逐个调用 strftime
+_DIRECTIVE_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2, "f": 6, "j": 3, "z": 5}
+
+_DIGIT_TENS = np.repeat(np.arange(ord("0"), ord("9") + 1, dtype=np.uint8), 10)
+_DIGIT_ONES = np.tile(np.arange(ord("0"), ord("9") + 1, dtype=np.uint8), 10)
+
+# 不超过该数量时逐个 strftime 比构建字符矩阵更快
+_SMALL_BATCH = 16
+
+# 1000 年以前的年份 strftime 不补零（999 而非 0999），这类批次逐个格式化
+_YEAR_1000_DAY = int(np.datetime64("1000-01-01", "D").astype(np.int64))
+
+_SECONDS_PER_DAY = 86_400
+_MICROSECONDS_PER_SECOND = 1_000_000
+
+
+@dataclass(frozen=True)
+class DateTimeRange:
+    """
+    解析一次、可反复抽样的时间区间。
+
+    start / end 为不带时区的 datetime64：未指定时区时即为本地时间，指定时区时为 UTC 时刻，
+    格式化时再按时区（含夏令时）换算回当地时间。
+    """
+
+    start: np.datetime64
+    """起始时刻（含）。"""
+
+    end: np.datetime64
+    """结束时刻（含）。"""
+
+    resolution: str
+    """时间精度，取值见 DATETIME_RESOLUTIONS。"""
+
+    tz: tzinfo | None = None
+    """输出时区，None 表示不处理时区。"""
+
+    @property
+    def span(self) -> int:
+        """区间内按精度计的可选时刻数量。"""
+        return int((self.end - self.start) // np.timedelta64(1, self.resolution)) + 1
+
+    def sample(self, count: int, *, sort: bool = False, seed: int | np.random.Generator | None = None) -> np.ndarray:
+        """
+        均匀抽取 count 个时刻。
+
+        :param count: 数量
+        :param sort: 是否按时间升序返回
+        :param seed: 可选随机种子或 numpy Generator
+        :return: datetime64 数组，单位为 resolution
+        :raises ValueError: 当 count 非正整数时抛出
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        rng = np.random.default_rng(seed)
+        offsets = rng.integers(0, self.span, size=count)
+        if sort:
+            offsets.sort()
+        return self.start + offsets.astype(f"m8[{self.resolution}]")
+
+    def all(self) -> np.ndarray:
+        """
+        按时间顺序返回区间内的全部时刻。
+        """
+        return np.arange(self.start, self.end + np.timedelta64(1, self.resolution), np.timedelta64(1, self.resolution))
+
+    def format(self, values: np.ndarray, fmt: str = DEFAULT_DATETIME_FORMAT) -> np.ndarray:
+        """
+        按本区间的时区批量格式化，见 format_datetimes。
+        """
+        return format_datetimes(values, fmt, tz=self.tz)
+
+    def iter_strings(
+        self,
+        count: int,
+        fmt: str = DEFAULT_DATETIME_FORMAT,
+        *,
+        sort: bool = False,
+        chunk_size: int = 1_000_000,
+        seed: int | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        分块抽样并格式化，适合千万级时间戳；sort=True 时每块内部升序。
+
+        :param count: 总数量
+        :param fmt: 输出格式
+        :param sort: 是否在块内按时间升序
+        :param chunk_size: 每块数量
+        :param seed: 可选随机种子
+        :return: 字符串数组迭代器
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size 必须为正整数")
+        rng = np.random.default_rng(seed)
+        for start in range(0, count, chunk_size):
+            yield self.format(self.sample(min(chunk_size, count - start), sort=sort, seed=rng), fmt)
+
+
+@lru_cache(maxsize=256)
+def datetime_range(
+    start: str | date,
+    end: str | date,
+    *,
+    resolution: str = "s",
+    fmt: str | None = None,
+    tz: str | tzinfo | None = None,
+) -> DateTimeRange:
+    """
+    解析起止时间并返回可复用的 DateTimeRange，相同参数只解析一次。
+
+    :param start: 起始时间，字符串、date 或 datetime
+    :param end: 结束时间（含）；只给出日期时包含当天的全部时刻
+    :param resolution: 时间精度，"D"（天）、"s"（秒）或 "ms"（毫秒）
+    :param fmt: 解析字符串边界使用的 strptime 格式，默认按 ISO 8601 解析
+    :param tz: 时区名称（如 "Asia/Shanghai"）或 tzinfo；不带时区的边界按该时区的当地时间理解
+    :return: DateTimeRange
+    :raises ValueError: 当参数非法或起始时间晚于结束时间时抛出
+    """
+    if resolution not in DATETIME_RESOLUTIONS:
+        raise ValueError(f"未知的时间精度: {resolution}，可选值为 {DATETIME_RESOLUTIONS}")
+    if isinstance(tz, str):
+        tz = ZoneInfo(tz)
+    if tz is not None and resolution == "D":
+        raise ValueError("按天生成日期时不支持时区")
+
+    start_value = _parse_bound(start, fmt, tz, resolution, is_end=False)
+    end_value = _parse_bound(end, fmt, tz, resolution, is_end=True)
+    if start_value > end_value:
+        raise ValueError("start 不能晚于 end")
+    return DateTimeRange(start=start_value, end=end_value, resolution=resolution, tz=tz)
+
+
+def generate_datetimes(
+    start: str | date,
+    end: str | date,
+    count: int,
+    *,
+    fmt: str = DEFAULT_DATETIME_FORMAT,
+    resolution: str = "s",
+    tz: str | tzinfo | None = None,
+    sort: bool = False,
+    seed: int | None = None,
+) -> List[str]:
+    """
+    在区间内随机生成 count 个带时分秒的时间字符串。
+
+    :param start: 起始时间
+    :param end: 结束时间（含）
+    :param count: 数量
+    :param fmt: 输出格式，默认 "%Y-%m-%d %H:%M:%S"
+    :param resolution: 时间精度，"D"、"s" 或 "ms"
+    :param tz: 可选时区，输出为该时区的当地时间，可配合 %z 输出偏移
+    :param sort: 是否按时间升序
+    :param seed: 可选随机种子
+    :return: 时间字符串列表
+    """
+    time_range = datetime_range(start, end, resolution=resolution, tz=tz)
+    return time_range.format(time_range.sample(count, sort=sort, seed=seed), fmt).tolist()
+
+
+def format_datetimes(values: np.ndarray, fmt: str = DEFAULT_DATETIME_FORMAT, *, tz: str | tzinfo | None = None) -> np.ndarray:
+    """
+    批量格式化 datetime64 数组。
+
+    格式只包含 %Y %m %d %H %M %S %f %j %z %% 与普通字符且数量较多时按缓存的格式计划处理：
+    日期部分只为出现过的每一天渲染一次，时分秒部分查 86400 行的缓存表，再按行拼合，
+    不为单个时间创建 Python 对象；其它格式退化为逐个 strftime。
+
+    :param values: datetime64 数组；指定 tz 时视为 UTC 时刻
+    :param fmt: strftime 风格的格式
+    :param tz: 可选时区名称或 tzinfo，输出该时区的当地时间
+    :return: Unicode 字符串数组
+    """
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.datetime64):
+        raise ValueError("values 必须为 datetime64 数组")
+    if isinstance(tz, str):
+        tz = ZoneInfo(tz)
+
+    offsets = _utc_offsets(values, tz)
+    local = (values if offsets is None else values + offsets.astype("m8[s]")).ravel()
+    plan = _format_plan(fmt, offsets is not None)
+    if plan is None or local.size <= _SMALL_BATCH:
+        return _strftime(local, offsets, fmt).reshape(values.shape)
+
+    days = local.astype("M8[D]")
+    day_numbers = days.astype(np.int64)
+    first_day, last_day = int(day_numbers.min()), int(day_numbers.max())
+    if first_day < _YEAR_1000_DAY and any(directive == "Y" for _, directive in _directive_columns(plan)):
+        return _strftime(local, offsets, fmt).reshape(values.shape)
+    if last_day - first_day < local.size:
+        distinct = np.arange(first_day, last_day + 1)
+        day_rows = day_numbers - first_day
+    else:
+        distinct, day_rows = np.unique(day_numbers, return_inverse=True)
+
+    # 先按天取整行（日期列与字面量），再覆盖时分秒、微秒与偏移列
+    codes = _render_days(plan, distinct.astype("M8[D]"))[day_rows]
+    microseconds = (local - days).astype("m8[us]").astype(np.int64)
+    time_columns, time_table = _seconds_table(plan)
+    if time_columns:
+        codes[:, time_columns] = time_table[microseconds // _MICROSECONDS_PER_SECOND]
+    for column, directive in _directive_columns(plan):
+        if directive == "f":
+            _write_digits(codes, column, 6, microseconds % _MICROSECONDS_PER_SECOND)
+        elif directive == "z":
+            minutes = np.zeros(local.size, dtype=np.int64) if offsets is None else offsets.ravel() // 60
+            codes[:, column] = np.where(minutes < 0, ord("-"), ord("+"))
+            minutes = np.abs(minutes)
+            _write_digits(codes, column + 1, 2, minutes // 60)
+            _write_digits(codes, column + 3, 2, minutes % 60)
+
+    width = codes.shape[1]
+    return codes.astype(np.uint32, copy=False).view(f"U{width}").reshape(values.shape)
+
+
+def _render_days(plan: Tuple[Tuple[str, str], ...], days: np.ndarray) -> np.ndarray:
+    """渲染每一天的字面量与日期列（%Y %m %d %j），其余列留待覆盖。"""
+    months = days.astype("M8[M]")
+    years = days.astype("M8[Y]")
+    fields = {
+        "Y": years.astype(np.int64) + 1970,
+        "m": months.astype(np.int64) % 12 + 1,
+        "d": (days - months.astype("M8[D]")).astype(np.int64) + 1,
+        "j": (days - years.astype("M8[D]")).astype(np.int64) + 1,
+    }
+    return _render(plan, fields, len(days))
+
+
+@lru_cache(maxsize=32)
+def _seconds_table(plan: Tuple[Tuple[str, str], ...]) -> Tuple[List[int], np.ndarray]:
+    """一天内每一秒对应的时分秒列（%H %M %S），返回 (列号, 86400 行字符码表)。"""
+    columns = [
+        column + offset
+        for column, directive in _directive_columns(plan)
+        if directive in "HMS"
+        for offset in range(_DIRECTIVE_WIDTHS[directive])
+    ]
+    seconds = np.arange(_SECONDS_PER_DAY, dtype=np.int64)
+    fields = {"H": seconds // 3600, "M": seconds // 60 % 60, "S": seconds % 60}
+    return columns, _render(plan, fields, _SECONDS_PER_DAY)[:, columns]
+
+
+def _render(plan: Tuple[Tuple[str, str], ...], fields: dict, count: int) -> np.ndarray:
+    # 格式全为 ASCII 时使用单字节矩阵，最后一次性转换为 Unicode
+    ascii_only = all(kind == "directive" or text.isascii() for kind, text in plan)
+    width = sum(len(text) if kind == "literal" else _DIRECTIVE_WIDTHS[text] for kind, text in plan)
+    codes = np.zeros((count, width), dtype=np.uint8 if ascii_only else np.uint32)
+    column = 0
+    for kind, text in plan:
+        if kind == "literal":
+            codes[:, column : column + len(text)] = [ord(char) for char in text]
+            column += len(text)
+            continue
+        if text in fields:
+            _write_digits(codes, column, _DIRECTIVE_WIDTHS[text], fields[text])
+        column += _DIRECTIVE_WIDTHS[text]
+    return codes
+
+
+@lru_cache(maxsize=128)
+def _directive_columns(plan: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[int, str], ...]:
+    """每个指令在输出中的起始列。"""
+    columns = []
+    column = 0
+    for kind, text in plan:
+        if kind == "literal":
+            column += len(text)
+        else:
+            columns.append((column, text))
+            column += _DIRECTIVE_WIDTHS[text]
+    return tuple(columns)
+
+
+@lru_cache(maxsize=128)
+def _format_plan(fmt: str, with_offset: bool) -> Tuple[Tuple[str, str], ...] | None:
+    """
+    将格式拆分为 ("literal", 文本) 与 ("directive", 指令) 序列；含不支持的指令时返回 None。
+    with_offset 为 False（不带时区）时 %z 与 strftime 一致输出空串。
+    """
+    plan: List[Tuple[str, str]] = []
+    literal: List[str] = []
+    index = 0
+    while index < len(fmt):
+        char = fmt[index]
+        if char != "%":
+            literal.append(char)
+            index += 1
+            continue
+        if index + 1 >= len(fmt):
+            return None
+        directive = fmt[index + 1]
+        index += 2
+        if directive == "%":
+            literal.append("%")
+            continue
+        if directive == "z" and not with_offset:
+            continue
+        if directive not in _DIRECTIVE_WIDTHS:
+            return None
+        if literal:
+            plan.append(("literal", "".join(literal)))
+            literal = []
+        plan.append(("directive", directive))
+    if literal:
+        plan.append(("literal", "".join(literal)))
+    return tuple(plan)
+
+
+def _write_digits(codes: np.ndarray, column: int, width: int, numbers: np.ndarray) -> None:
+    # 从右往左每次写两位，十位与个位分别查 00-99 的字符码表
+    tens, ones = _DIGIT_TENS.astype(codes.dtype), _DIGIT_ONES.astype(codes.dtype)
+    numbers = numbers.astype(np.int32)
+    position = column + width
+    while position - column >= 2:
+        pair = numbers % 100
+        codes[:, position - 2] = tens[pair]
+        codes[:, position - 1] = ones[pair]
+        numbers = numbers // 100
+        position -= 2
+    if position > column:
+        codes[:, column] = ones[numbers % 10]
+
+
+def _strftime(local: np.ndarray, offsets: np.ndarray | None, fmt: str) -> np.ndarray:
+    moments = local.astype("M8[us]").ravel().tolist()
+    if offsets is None:
+        texts = [moment.strftime(fmt) for moment in moments]
+    else:
+        texts = [
+            moment.replace(tzinfo=timezone(timedelta(seconds=offset))).strftime(fmt)
+            for moment, offset in zip(moments, offsets.ravel().tolist())
+        ]
+    return np.asarray(texts).reshape(local.shape)
+
+
+def _utc_offsets(values: np.ndarray, tz: tzinfo | None) -> np.ndarray | None:
+    """
+    返回每个 UTC 时刻在 tz 下的偏移秒数；固定偏移时区直接广播，其余按区间内的切换点查表。
+    """
+    if tz is None:
+        return None
+    if isinstance(tz, timezone):
+        return np.full(values.shape, int(tz.utcoffset(None).total_seconds()), dtype=np.int64)
+    if values.size == 0:
+        return np.zeros(values.shape, dtype=np.int64)
+
+    seconds = values.astype("M8[s]").astype(np.int64)
+    first_day = int(seconds.min()) // _SECONDS_PER_DAY
+    last_day = int(seconds.max()) // _SECONDS_PER_DAY
+    instants, offsets = _offset_transitions(tz, first_day, last_day)
+    return offsets[np.searchsorted(instants, seconds, side="right") - 1]
+
+
+@lru_cache(maxsize=64)
+def _offset_transitions(tz: tzinfo, first_day: int, last_day: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    逐日探测 tz 的 UTC 偏移，偏移变化的那天再二分到秒，得到 (切换时刻, 偏移) 表。
+    """
+
+    def offset_at(second: int) -> int:
+        return int(datetime.fromtimestamp(second, tz).utcoffset().total_seconds())
+
+    instants = [first_day * _SECONDS_PER_DAY]
+    offsets = [offset_at(instants[0])]
+    for day in range(first_day + 1, last_day + 2):
+        second = day * _SECONDS_PER_DAY
+        offset = offset_at(second)
+        if offset == offsets[-1]:
+            continue
+        low, high = second - _SECONDS_PER_DAY, second
+        while high - low > 1:
+            middle = (low + high) // 2
+            if offset_at(middle) == offsets[-1]:
+                low = middle
+            else:
+                high = middle
+        instants.append(high)
+        offsets.append(offset)
+    return np.asarray(instants, dtype=np.int64), np.asarray(offsets, dtype=np.int64)
+
+
+def _parse_bound(
+    value: str | date,
+    fmt: str | None,
+    tz: tzinfo | None,
+    resolution: str,
+    *,
+    is_end: bool,
+) -> np.datetime64:
+    if isinstance(value, str):
+        if fmt is None:
+            parsed = datetime.fromisoformat(value.strip())
+            date_only = len(value.strip()) <= 10
+        else:
+            parsed = datetime.strptime(value, fmt)
+            date_only = not any(directive in fmt for directive in ("%H", "%I", "%M", "%S", "%f"))
+    elif isinstance(value, datetime):
+        parsed, date_only = value, False
+    elif isinstance(value, date):
+        parsed, date_only = datetime(value.year, value.month, value.day), True
+    else:
+        raise ValueError(f"无法解析的时间边界: {value!r}")
+
+    # 只给出日期的结束边界包含当天全部时刻：取次日零点再退一个精度单位
+    inclusive_day = is_end and date_only
+    if inclusive_day:
+        parsed += timedelta(days=1)
+    if parsed.tzinfo is None and tz is not None:
+        parsed = parsed.replace(tzinfo=tz)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+    result = np.datetime64(parsed, resolution)
+    return result - np.timedelta64(1, resolution) if inclusive_day else result
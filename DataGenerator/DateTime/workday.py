@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from DataGenerator.DateTime.timestamp import datetime_range, format_datetimes
+from DataGenerator.Numerical.sampling import build_alias_table
+
+# 日类型编码
+WORKDAY = 0
+WEEKEND = 1
+HOLIDAY = 2
+MAKEUP_WORKDAY = 3
+
+DAY_TYPES: tuple[str, ...] = ("workday", "weekend", "holiday", "makeup")
+
+# 国务院办公厅公布的法定节假日放假安排：年份 → (放假日期, 调休上班日期)，
+# "MM-DD~MM-DD" 表示含端点的连续区间，跨年的元旦假期计入所在自然年
+CN_HOLIDAY_SCHEDULES: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    2019: (
+        ("01-01", "02-04~02-10", "04-05~04-07", "05-01~05-04", "06-07~06-09", "09-13~09-15", "10-01~10-07"),
+        ("02-02", "02-03", "04-28", "05-05", "09-29", "10-12"),
+    ),
+    2020: (
+        ("01-01", "01-24~02-02", "04-04~04-06", "05-01~05-05", "06-25~06-27", "10-01~10-08"),
+        ("01-19", "04-26", "05-09", "06-28", "09-27", "10-10"),
+    ),
+    2021: (
+        ("01-01~01-03", "02-11~02-17", "04-03~04-05", "05-01~05-05", "06-12~06-14", "09-19~09-21", "10-01~10-07"),
+        ("02-07", "02-20", "04-25", "05-08", "09-18", "09-26", "10-09"),
+    ),
+    2022: (
+        ("01-01~01-03", "01-31~02-06", "04-03~04-05", "04-30~05-04", "06-03~06-05", "09-10~09-12", "10-01~10-07"),
+        ("01-29", "01-30", "04-02", "04-24", "05-07", "10-08", "10-09"),
+    ),
+    2023: (
+        ("01-01~01-02", "01-21~01-27", "04-05", "04-29~05-03", "06-22~06-24", "09-29~10-06"),
+        ("01-28", "01-29", "04-23", "05-06", "06-25", "10-07", "10-08"),
+    ),
+    2024: (
+        ("01-01", "02-10~02-17", "04-04~04-06", "05-01~05-05", "06-10", "09-15~09-17", "10-01~10-07"),
+        ("02-04", "02-18", "04-07", "04-28", "05-11", "09-14", "09-29", "10-12"),
+    ),
+    2025: (
+        ("01-01", "01-28~02-04", "04-04~04-06", "05-01~05-05", "05-31~06-02", "10-01~10-08"),
+        ("01-26", "02-08", "04-27", "09-28", "10-11"),
+    ),
+    2026: (
+        ("01-01~01-03", "02-15~02-23", "04-04~04-06", "05-01~05-05", "06-19~06-21", "09-25~09-27", "10-01~10-07"),
+        ("01-04", "02-14", "02-28", "05-09", "09-20", "10-10"),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class WorkCalendar:
+    """
+    按整年预先计算的日类型表及工作日的 rank/select 索引。
+
+    rank(日期) 为该日期之前的工作日数，select(k) 为第 k 个工作日（从 0 开始），
+    两者都是一次数组索引，因此在任意区间内均匀或加权抽取工作日的代价与区间长度无关。
+    收录年份之外按周末规则处理，不区分节假日。
+    """
+
+    first_day: np.datetime64
+    """首日（datetime64[D]，为 first_year 的 1 月 1 日）。"""
+
+    day_types: np.ndarray
+    """逐日的日类型编码（uint8），取值见 DAY_TYPES。"""
+
+    workdays: np.ndarray
+    """select 表：按时间顺序排列的工作日相对首日的天数（int32）。"""
+
+    ranks: np.ndarray
+    """rank 表：ranks[i] 为首日起前 i 天中的工作日数，长度为天数 + 1。"""
+
+    @property
+    def last_day(self) -> np.datetime64:
+        """末日（含）。"""
+        return self.first_day + np.timedelta64(len(self.day_types) - 1, "D")
+
+    @property
+    def workday_bitmap(self) -> np.ndarray:
+        """按位压缩的工作日位图（np.packbits 格式），每年约 46 字节。"""
+        return np.packbits(np.isin(self.day_types, (WORKDAY, MAKEUP_WORKDAY)))
+
+    def day_type(self, dates: np.ndarray) -> np.ndarray:
+        """
+        查询日期的日类型编码。
+
+        :param dates: datetime64 数组，须落在日历范围内
+        :return: uint8 日类型数组
+        """
+        return self.day_types[self._positions(dates)]
+
+    def is_workday(self, dates: np.ndarray) -> np.ndarray:
+        """
+        判断日期是否为工作日（含调休上班日）。
+        """
+        positions = self._positions(dates)
+        return self.ranks[positions + 1] > self.ranks[positions]
+
+    def rank(self, dates: np.ndarray) -> np.ndarray:
+        """
+        返回每个日期之前（不含当天）的工作日数量。
+        """
+        return self.ranks[self._positions(dates)]
+
+    def select(self, ranks: np.ndarray | int) -> np.ndarray:
+        """
+        返回第 ranks 个工作日（从 0 开始计）。
+        """
+        return self.first_day + self.workdays[ranks].astype("m8[D]")
+
+    def next_workday(self, dates: np.ndarray) -> np.ndarray:
+        """
+        返回不早于给定日期的第一个工作日。
+        """
+        return self.select(self.rank(dates))
+
+    def rank_range(self, start: np.datetime64, end: np.datetime64) -> Tuple[int, int]:
+        """
+        返回 [start, end] 内工作日的 rank 区间 [low, high)。
+
+        :raises ValueError: 当区间内没有工作日时抛出
+        """
+        first, last = self._positions(np.asarray([start, end]))
+        low, high = int(self.ranks[first]), int(self.ranks[last + 1])
+        if low >= high:
+            raise ValueError(f"{start} 至 {end} 之间没有工作日")
+        return low, high
+
+    def sample_workdays(
+        self,
+        start: np.datetime64,
+        end: np.datetime64,
+        count: int,
+        *,
+        weight: Callable[[np.ndarray], np.ndarray] | None = None,
+        seed: int | np.random.Generator | None = None,
+    ) -> np.ndarray:
+        """
+        在 [start, end] 内抽取 count 个工作日。
+
+        :param start: 起始日期（含）
+        :param end: 结束日期（含）
+        :param count: 数量
+        :param weight: 可选权重函数，接收区间内全部工作日（datetime64[D]）返回同长度的权重，
+            例如 month_end_weight；按权重建别名表后抽样，与均匀抽样一样每个样本 O(1)
+        :param seed: 可选随机种子或 numpy Generator
+        :return: datetime64[D] 数组
+        :raises ValueError: 当 count 非正整数或区间内没有工作日时抛出
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        low, high = self.rank_range(start, end)
+        rng = np.random.default_rng(seed)
+        if weight is None:
+            return self.select(rng.integers(low, high, size=count))
+        table = build_alias_table(weight(self.select(np.arange(low, high))))
+        return self.select(low + table.sample(rng, count))
+
+    def _positions(self, dates: np.ndarray) -> np.ndarray:
+        positions = (np.asarray(dates, dtype="M8[D]") - self.first_day).astype(np.int64)
+        if positions.size and (positions.min() < 0 or positions.max() >= len(self.day_types)):
+            raise ValueError(f"日期超出日历范围 {self.first_day} 至 {self.last_day}")
+        return positions
+
+
+@lru_cache(maxsize=16)
+def work_calendar(first_year: int, last_year: int) -> WorkCalendar:
+    """
+    构建覆盖 [first_year, last_year] 整年的工作日历，相同年份范围只构建一次。
+
+    :param first_year: 起始年份
+    :param last_year: 结束年份（含）
+    :return: WorkCalendar
+    :raises ValueError: 当年份范围非法时抛出
+    """
+    if first_year > last_year:
+        raise ValueError("first_year 不能大于 last_year")
+
+    first_day = np.datetime64(f"{first_year:04d}-01-01", "D")
+    days = np.arange(first_day, np.datetime64(f"{last_year + 1:04d}-01-01", "D"))
+    # 1970-01-01 为星期四，换算为周一 = 0
+    weekdays = (days.astype(np.int64) + 3) % 7
+    day_types = np.where(weekdays >= 5, WEEKEND, WORKDAY).astype(np.uint8)
+
+    for year in range(first_year, last_year + 1):
+        holidays, makeups = CN_HOLIDAY_SCHEDULES.get(year, ((), ()))
+        for day in _schedule_days(year, holidays):
+            day_types[(day - first_day).astype(np.int64)] = HOLIDAY
+        for day in _schedule_days(year, makeups):
+            day_types[(day - first_day).astype(np.int64)] = MAKEUP_WORKDAY
+
+    working = (day_types == WORKDAY) | (day_types == MAKEUP_WORKDAY)
+    return WorkCalendar(
+        first_day=first_day,
+        day_types=day_types,
+        workdays=np.flatnonzero(working).astype(np.int32),
+        ranks=np.concatenate(([0], np.cumsum(working))).astype(np.int32),
+    )
+
+
+def month_end_weight(boost: float = 3.0, last_workdays: int = 3) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    返回一个权重函数：每月最后 last_workdays 个工作日的权重为 boost，其余为 1，
+    用于模拟集中在月末的付款、报销等日期。
+
+    :param boost: 月末工作日的权重
+    :param last_workdays: 每月计入月末的工作日数量
+    :return: 可传给 sample_workdays 的权重函数
+    """
+    if boost <= 0:
+        raise ValueError("boost 必须为正数")
+    if last_workdays <= 0:
+        raise ValueError("last_workdays 必须为正整数")
+
+    def weight(workdays: np.ndarray) -> np.ndarray:
+        months = workdays.astype("M8[M]").astype(np.int64)
+        # workdays 升序，同月工作日连续：按月分组计算每天距月末还有几个工作日
+        boundaries = np.flatnonzero(np.diff(months)) + 1
+        month_ends = np.append(boundaries, len(workdays))
+        group_end = month_ends[np.searchsorted(month_ends, np.arange(len(workdays)), side="right")]
+        remaining = group_end - np.arange(len(workdays))
+        return np.where(remaining <= last_workdays, boost, 1.0)
+
+    return weight
+
+
+def generate_workdays(
+    start_date: str | date,
+    end_date: str | date,
+    count: int,
+    *,
+    date_format: str = "%Y-%m-%d",
+    weight: Callable[[np.ndarray], np.ndarray] | None = None,
+    seed: int | None = None,
+) -> List[str]:
+    """
+    在区间内随机生成落在中国工作日（跳过周末与法定节假日，计入调休上班日）的日期字符串。
+
+    :param start_date: 起始日期，例如 "2024-01-01"
+    :param end_date: 结束日期（含），例如 "2024-12-31"
+    :param count: 数量
+    :param date_format: 解析与输出使用的日期格式
+    :param weight: 可选权重函数，见 WorkCalendar.sample_workdays 与 month_end_weight
+    :param seed: 可选随机种子
+    :return: 日期字符串列表
+    """
+    date_range = datetime_range(start_date, end_date, resolution="D", fmt=date_format)
+    calendar = work_calendar(_year(date_range.start), _year(date_range.end))
+    dates = calendar.sample_workdays(date_range.start, date_range.end, count, weight=weight, seed=seed)
+    return format_datetimes(dates, date_format).tolist()
+
+
+def _schedule_days(year: int, entries: Tuple[str, ...]) -> List[np.datetime64]:
+    days: List[np.datetime64] = []
+    for entry in entries:
+        first, _, last = entry.partition("~")
+        start = np.datetime64(f"{year:04d}-{first}", "D")
+        end = np.datetime64(f"{year:04d}-{last or first}", "D")
+        days.extend(np.arange(start, end + np.timedelta64(1, "D")))
+    return days
+
+
+def _year(day: np.datetime64) -> int:
+    return int(day.astype("M8[Y]").astype(np.int64)) + 1970
@@ -1,5 +1,14 @@
-import random
-from typing import List
+from __future__ import annotations
+
+from typing import Iterator, List
+
+import numpy as np
+
+# 布尔序列的生成方式：精确比例（不放回抽取 True 的位置）或逐位独立的伯努利抽样
+BOOLEAN_MODES: tuple[str, ...] = ("exact", "bernoulli")
+
+# numpy 的超几何分布要求两类数量均小于 10^9，超出时改用二项分布近似每块的 True 数量
+_HYPERGEOMETRIC_LIMIT = 10 ** 9
 
 
 def generate_boolean_sequence(
@@ -7,6 +16,7 @@ def generate_boolean_sequence(
     true_ratio: float,
     *,
     shuffle: bool = True,
+    seed: int | None = None,
 ) -> List[bool]:
     """
     生成长度为 n 的布尔序列，其中 True 大致占据指定比例。
@@ -16,6 +26,7 @@ def generate_boolean_sequence(
         true_ratio: True 值的占比，范围 [0.0, 1.0]。
     关键字参数:
         shuffle: 是否打乱 True/False 的位置，默认打乱。
+        seed: 可选随机种子，便于复现。
 
     返回:
         包含 n 个布尔值的列表。
@@ -23,18 +34,149 @@ def generate_boolean_sequence(
     异常:
         ValueError: 当 n 不大于 0 或 true_ratio 不在合法范围内时抛出。
     """
+    _check(n, true_ratio)
+    if not shuffle:
+        true_count = _true_count(n, true_ratio)
+        return [True] * true_count + [False] * (n - true_count)
+    return generate_boolean_array(n, true_ratio, seed=seed).tolist()
+
+
+def generate_boolean_array(
+    n: int,
+    true_ratio: float,
+    *,
+    mode: str = "exact",
+    packed: bool = False,
+    chunk_size: int = 1 << 20,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    生成长度为 n 的布尔数组，十亿级长度也只需按位或按字节存储。
+
+    参数:
+        n: 序列长度，必须为正整数。
+        true_ratio: True 值的占比，范围 [0.0, 1.0]。
+    关键字参数:
+        mode: "exact" 时 True 恰好为 round(n * true_ratio) 个，位置均匀随机；
+            "bernoulli" 时每一位独立以 true_ratio 的概率为 True。
+        packed: 为 True 时返回 np.packbits 格式的 uint8 缓冲区（每字节 8 位，高位在前，
+            末尾不足 8 位的部分补 0），内存为布尔数组的 1/8、Python 列表的 1/64。
+        chunk_size: 内部分块大小，必须为 8 的倍数。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        长度为 n 的 bool 数组，或长度为 ceil(n / 8) 的 uint8 数组。
+        bool 数组可直接传给 add_column_to_csv 作为标记列，写出的 True/False 能被按布尔解析。
+
+    异常:
+        ValueError: 当参数非法时抛出。
+    """
+    chunks = iter_boolean_chunks(n, true_ratio, mode=mode, packed=packed, chunk_size=chunk_size, seed=seed)
+    result = np.empty((n + 7) // 8 if packed else n, dtype=np.uint8 if packed else np.bool_)
+    offset = 0
+    for chunk in chunks:
+        result[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    return result
+
+
+def iter_boolean_chunks(
+    n: int,
+    true_ratio: float,
+    *,
+    mode: str = "exact",
+    packed: bool = False,
+    chunk_size: int = 1 << 20,
+    seed: int | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    分块生成布尔序列，内存占用只与 chunk_size 有关。
+
+    精确模式下按剩余长度与剩余 True 数量逐块抽取本块的 True 数量（超几何分布），
+    再在块内不放回地抽取位置，因此总数恰好为 round(n * true_ratio)，且所有排列等可能。
+
+    参数:
+        n: 序列长度，必须为正整数。
+        true_ratio: True 值的占比，范围 [0.0, 1.0]。
+    关键字参数:
+        mode: 生成方式，见 BOOLEAN_MODES。
+        packed: 是否输出 np.packbits 格式的字节块，每块对应 chunk_size 位。
+        chunk_size: 每块的位数，必须为 8 的倍数。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        bool 数组或 uint8 数组的迭代器。
+
+    异常:
+        ValueError: 当参数非法时抛出。
+    """
+    _check(n, true_ratio)
+    if mode not in BOOLEAN_MODES:
+        raise ValueError(f"未知的生成方式: {mode}，可选值为 {BOOLEAN_MODES}")
+    if chunk_size <= 0 or chunk_size % 8:
+        raise ValueError("chunk_size 必须为 8 的正整数倍")
+
+    rng = np.random.default_rng(seed)
+    remaining, remaining_true = n, _true_count(n, true_ratio)
+    while remaining:
+        size = min(chunk_size, remaining)
+        if mode == "bernoulli":
+            chunk = rng.random(size) < true_ratio
+        else:
+            k = _chunk_true_count(rng, size, remaining, remaining_true)
+            chunk = _place(rng, size, k)
+            remaining_true -= k
+        remaining -= size
+        yield np.packbits(chunk) if packed else chunk
+
+
+def unpack_booleans(packed: np.ndarray, n: int) -> np.ndarray:
+    """
+    将 packed=True 得到的字节缓冲区还原为长度为 n 的 bool 数组。
+
+    参数:
+        packed: np.packbits 格式的 uint8 数组。
+        n: 原序列长度。
+
+    返回:
+        bool 数组。
+    """
+    return np.unpackbits(np.asarray(packed, dtype=np.uint8), count=n).view(np.bool_)
+
+
+def _check(n: int, true_ratio: float) -> None:
     if n <= 0:
         raise ValueError("n 必须为正整数")
     if not 0.0 <= true_ratio <= 1.0:
         raise ValueError("true_ratio 必须在 [0.0, 1.0] 之间")
 
-    true_count = int(round(n * true_ratio))
-    true_count = min(max(true_count, 0), n)
-    false_count = n - true_count
 
-    sequence = [True] * true_count + [False] * false_count
+def _true_count(n: int, true_ratio: float) -> int:
+    return min(max(int(round(n * true_ratio)), 0), n)
+
+
+def _chunk_true_count(rng: np.random.Generator, size: int, remaining: int, remaining_true: int) -> int:
+    """
+    从剩余 remaining 位（其中 remaining_true 个 True）中取前 size 位时，抽取其中的 True 数量。
+    """
+    remaining_false = remaining - remaining_true
+    if size == remaining:
+        return remaining_true
+    if remaining_true == 0:
+        return 0
+    if remaining_false == 0:
+        return size
+    if remaining_true < _HYPERGEOMETRIC_LIMIT and remaining_false < _HYPERGEOMETRIC_LIMIT:
+        return int(rng.hypergeometric(remaining_true, remaining_false, size))
+    # 二项近似后夹到可行区间，剩余总数仍精确，最后一块恰好补齐
+    k = int(rng.binomial(size, remaining_true / remaining))
+    return min(max(k, size - remaining_false), remaining_true, size)
 
-    if shuffle and n > 1:
-        random.shuffle(sequence)
 
-    return sequence
+def _place(rng: np.random.Generator, size: int, k: int) -> np.ndarray:
+    """在 size 位中不放回地随机选出 k 位置为 True，较少的一方作为被选位置。"""
+    minority = min(k, size - k)
+    chunk = np.full(size, minority != k, dtype=np.bool_)
+    if minority:
+        chunk[rng.choice(size, minority, replace=False)] = minority == k
+    return chunk
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from DataGenerator.Numerical.sampling import AliasTable, build_alias_table
+
+# 参数名与默认值，按位置存放在 NumericDistribution.params 中
+_PARAMETERS = {
+    "uniform": (("low", 0.0), ("high", 1.0)),
+    "normal": (("mean", 0.0), ("std", 1.0)),
+    "lognormal": (("mean", 0.0), ("sigma", 1.0)),
+    "exponential": (("scale", 1.0),),
+    "pareto": (("shape", 2.0), ("scale", 1.0)),
+    "zipf": (("a", 2.0), ("n", 0.0)),
+}
+
+DISTRIBUTIONS: tuple[str, ...] = tuple(_PARAMETERS) + ("histogram",)
+
+# 有界 Zipf 按秩建别名表，秩的数量上限
+_MAX_ZIPF_RANKS = 10_000_000
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+@dataclass(frozen=True)
+class NumericDistribution:
+    """
+    构建一次、可反复抽样的数值分布：整批由 numpy Generator 抽取，再向量化地截断、
+    按小数位量化并转换为目标 dtype，每个元素的代价接近 numpy 本身。
+
+    - uniform(low, high)、normal(mean, std)、exponential(scale)；整数 dtype 的 uniform 在 [low, high] 内的整数上等概率取值；
+    - lognormal(mean, sigma)：mean / sigma 为对数的均值与标准差，适合订单金额等右偏数据；
+    - pareto(shape, scale)：取值不小于 scale 的经典 Pareto 分布，适合延迟长尾；
+    - zipf(a, n)：n 为 0 时是 a > 1 的无界 Zipf，否则为 1..n 上按 k^-a 加权的有界 Zipf；
+    - histogram：按直方图各桶权重抽桶，桶内均匀，见 histogram_distribution / empirical_distribution。
+    """
+
+    kind: str
+    """分布类型，取值见 DISTRIBUTIONS。"""
+
+    params: Tuple[float, ...]
+    """分布参数，顺序见 _PARAMETERS；histogram 为空。"""
+
+    lower: float | None = None
+    """下界，小于下界的值截断到下界。"""
+
+    upper: float | None = None
+    """上界，大于上界的值截断到上界。"""
+
+    decimals: int | None = None
+    """保留的小数位数（四舍五入），None 表示不量化；整数 dtype 总是取整。"""
+
+    dtype: np.dtype = np.dtype(np.float64)
+    """输出的 numpy dtype。"""
+
+    table: AliasTable | None = None
+    """histogram 的桶别名表或有界 zipf 的秩别名表。"""
+
+    edges: np.ndarray | None = None
+    """histogram 的桶边界（长度为桶数 + 1）。"""
+
+    def sample(self, count: int, *, seed: int | np.random.Generator | None = None) -> np.ndarray:
+        """
+        抽取 count 个数值。
+
+        :param count: 数量
+        :param seed: 可选随机种子或 numpy Generator
+        :return: dtype 为 self.dtype 的数组
+        :raises ValueError: 当 count 非正整数时抛出
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        rng = np.random.default_rng(seed)
+        return self._finish(self._draw(rng, count))
+
+    def iter_chunks(
+        self,
+        count: int,
+        *,
+        chunk_size: int = 1_000_000,
+        seed: int | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        分块抽取 count 个数值，内存占用只与 chunk_size 有关，适合十亿级数据。
+
+        :param count: 总数量
+        :param chunk_size: 每块数量
+        :param seed: 可选随机种子
+        :return: 数组迭代器
+        """
+        if count <= 0:
+            raise ValueError("count 必须为正整数")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size 必须为正整数")
+        rng = np.random.default_rng(seed)
+        for start in range(0, count, chunk_size):
+            yield self.sample(min(chunk_size, count - start), seed=rng)
+
+    def _draw(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        kind, params = self.kind, self.params
+        if kind == "uniform" and self.dtype.kind != "f":
+            # 整数输出直接在 [ceil(low), floor(high)] 上等概率抽取，避免取整后两端点概率减半
+            low, high = math.ceil(params[0]), math.floor(params[1])
+            if low <= high and _INT64_MIN <= low and high <= _INT64_MAX:
+                return rng.integers(low, high, size=count, endpoint=True)
+        if kind == "uniform":
+            return rng.uniform(params[0], params[1], size=count)
+        if kind == "normal":
+            return rng.normal(params[0], params[1], size=count)
+        if kind == "lognormal":
+            return rng.lognormal(params[0], params[1], size=count)
+        if kind == "exponential":
+            return rng.exponential(params[0], size=count)
+        if kind == "pareto":
+            values = rng.pareto(params[0], size=count)
+            values += 1.0
+            values *= params[1]
+            return values
+        if kind == "zipf" and self.table is None:
+            return rng.zipf(params[0], size=count)
+        if kind == "zipf":
+            return self.table.sample(rng, count) + 1
+
+        bins = self.table.sample(rng, count)
+        values = rng.random(count)
+        values *= np.diff(self.edges)[bins]
+        values += self.edges[bins]
+        return values
+
+    def _finish(self, values: np.ndarray) -> np.ndarray:
+        if values.dtype.kind != "f" and (self.dtype.kind == "f" or self.lower is not None or self.upper is not None):
+            # zipf 抽出的是整数秩，截断与转换统一在 float64 上进行
+            values = values.astype(np.float64)
+        if self.lower is not None or self.upper is not None:
+            np.clip(values, self.lower, self.upper, out=values)
+        if self.dtype.kind == "f":
+            if self.decimals is not None:
+                np.round(values, self.decimals, out=values)
+            return values.astype(self.dtype, copy=False)
+
+        if values.dtype.kind == "f":
+            np.rint(values, out=values)
+        # 先截断到 dtype 的表示范围，避免转换时溢出回绕
+        info = np.iinfo(self.dtype)
+        if values.dtype.kind == "f":
+            top = float(info.max)
+            if int(top) > info.max:
+                # int64 / uint64 的最大值不能用 float64 精确表示，取其下方最近的浮点数
+                top = float(np.nextafter(top, 0))
+            np.clip(values, float(info.min), top, out=values)
+        else:
+            np.clip(values, max(info.min, np.iinfo(values.dtype).min), min(info.max, np.iinfo(values.dtype).max), out=values)
+        return values.astype(self.dtype, copy=False)
+
+
+def numeric_distribution(
+    kind: str = "uniform",
+    *,
+    lower: float | None = None,
+    upper: float | None = None,
+    decimals: int | None = None,
+    dtype: str | np.dtype = "float64",
+    **params: float,
+) -> NumericDistribution:
+    """
+    校验参数并构造参数化的数值分布。
+
+    :param kind: 分布类型，"uniform"、"normal"、"lognormal"、"exponential"、"pareto" 或 "zipf"
+    :param lower: 可选下界，超出的值截断到边界
+    :param upper: 可选上界，超出的值截断到边界
+    :param decimals: 可选小数位数，按位数四舍五入
+    :param dtype: 输出类型，例如 "float32"、"int64"
+    :param params: 分布参数，例如 mean=100, std=15；未给出的参数取默认值
+    :return: NumericDistribution
+    :raises ValueError: 当分布类型或参数非法时抛出
+    """
+    if kind not in _PARAMETERS:
+        raise ValueError(f"未知的分布类型: {kind}，可选值为 {tuple(_PARAMETERS)}")
+    names = [name for name, _ in _PARAMETERS[kind]]
+    unknown = set(params) - set(names)
+    if unknown:
+        raise ValueError(f"{kind} 分布不支持参数 {sorted(unknown)}，可选参数为 {names}")
+    values = tuple(float(params.get(name, default)) for name, default in _PARAMETERS[kind])
+
+    table = None
+    if kind == "uniform" and values[0] > values[1]:
+        raise ValueError("low 不能大于 high")
+    if kind in ("normal", "lognormal") and values[1] < 0:
+        raise ValueError("标准差不能为负")
+    if kind in ("exponential", "pareto") and not values[-1] > 0:
+        raise ValueError("scale 必须为正数")
+    if kind == "pareto" and not values[0] > 0:
+        raise ValueError("shape 必须为正数")
+    if kind == "zipf":
+        a, n = values
+        if n != int(n) or n < 0 or n > _MAX_ZIPF_RANKS:
+            raise ValueError(f"n 必须为 0 到 {_MAX_ZIPF_RANKS} 之间的整数")
+        if n:
+            if not a > 0:
+                raise ValueError("有界 Zipf 的 a 必须为正数")
+            table = build_alias_table(np.arange(1, int(n) + 1, dtype=np.float64) ** -a)
+        elif not a > 1:
+            raise ValueError("无界 Zipf 的 a 必须大于 1，或通过 n 指定最大秩")
+
+    return _checked(NumericDistribution(kind=kind, params=values, table=table), lower, upper, decimals, dtype)
+
+
+def histogram_distribution(
+    edges: Sequence[float] | np.ndarray,
+    weights: Sequence[float] | np.ndarray,
+    *,
+    lower: float | None = None,
+    upper: float | None = None,
+    decimals: int | None = None,
+    dtype: str | np.dtype = "float64",
+) -> NumericDistribution:
+    """
+    按直方图构造经验分布：先按桶权重抽桶（别名表，O(1)），再在桶内均匀取值。
+
+    :param edges: 单调递增的桶边界，长度为桶数 + 1
+    :param weights: 各桶的权重（频数或概率）
+    :param lower: 可选下界
+    :param upper: 可选上界
+    :param decimals: 可选小数位数
+    :param dtype: 输出类型
+    :return: NumericDistribution
+    :raises ValueError: 当边界与权重不匹配或权重非法时抛出
+    """
+    edges = np.asarray(edges, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    if edges.ndim != 1 or len(edges) != len(weights) + 1:
+        raise ValueError("edges 的长度必须比 weights 多 1")
+    if np.any(np.diff(edges) < 0):
+        raise ValueError("edges 必须单调递增")
+    if np.any(weights < 0) or not weights.sum() > 0:
+        raise ValueError("weights 不能为负且不能全为 0")
+    distribution = NumericDistribution(kind="histogram", params=(), table=build_alias_table(weights), edges=edges)
+    return _checked(distribution, lower, upper, decimals, dtype)
+
+
+def empirical_distribution(
+    samples: Sequence[float] | np.ndarray,
+    *,
+    bins: int = 64,
+    lower: float | None = None,
+    upper: float | None = None,
+    decimals: int | None = None,
+    dtype: str | np.dtype = "float64",
+) -> NumericDistribution:
+    """
+    由样本数据（例如线上导出的金额、耗时）统计直方图，生成形状相同的合成数据。
+
+    :param samples: 样本数据
+    :param bins: 桶数量
+    :return: NumericDistribution
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.size == 0:
+        raise ValueError("samples 不能为空")
+    counts, edges = np.histogram(samples, bins=bins)
+    return histogram_distribution(edges, counts, lower=lower, upper=upper, decimals=decimals, dtype=dtype)
+
+
+def generate_numbers(
+    kind: str,
+    count: int,
+    *,
+    lower: float | None = None,
+    upper: float | None = None,
+    decimals: int | None = None,
+    dtype: str | np.dtype = "float64",
+    seed: int | None = None,
+    **params: float,
+) -> List[float]:
+    """
+    按指定分布生成 count 个数值，例如 generate_numbers("lognormal", 1000, mean=4, sigma=0.8, decimals=2)。
+
+    :param kind: 分布类型，见 numeric_distribution
+    :param count: 数量
+    :param lower: 可选下界
+    :param upper: 可选上界
+    :param decimals: 可选小数位数
+    :param dtype: 输出类型
+    :param seed: 可选随机种子
+    :param params: 分布参数
+    :return: 数值列表
+    """
+    distribution = numeric_distribution(kind, lower=lower, upper=upper, decimals=decimals, dtype=dtype, **params)
+    return distribution.sample(count, seed=seed).tolist()
+
+
+def _checked(
+    distribution: NumericDistribution,
+    lower: float | None,
+    upper: float | None,
+    decimals: int | None,
+    dtype: str | np.dtype,
+) -> NumericDistribution:
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iuf":
+        raise ValueError(f"dtype 必须为整数或浮点类型: {dtype}")
+    if lower is not None and upper is not None and lower > upper:
+        raise ValueError("lower 不能大于 upper")
+    if decimals is not None and decimals != int(decimals):
+        raise ValueError("decimals 必须为整数")
+    return replace(
+        distribution,
+        lower=lower,
+        upper=upper,
+        decimals=None if decimals is None else int(decimals),
+        dtype=dtype,
+    )
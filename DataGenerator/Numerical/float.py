@@ -1,8 +1,9 @@
-import random
-from typing import List
+from typing import List, Optional
 
+from DataGenerator.Numerical.distribution import numeric_distribution
 
-def generate_random_floats(n: int, lower: float, upper: float, decimals: int) -> List[float]:
+
+def generate_random_floats(n: int, lower: float, upper: float, decimals: int, *, seed: Optional[int] = None) -> List[float]:
     """
     返回包含 n 个随机浮点数的列表，浮点数范围在 [lower, upper]（含端点），并控制小数位数。
 
@@ -10,6 +11,7 @@ def generate_random_floats(n: int, lower: float, upper: float, decimals: int) ->
     :param lower: 随机浮点数的下限
     :param upper: 随机浮点数的上限
     :param decimals: 小数位数（四舍五入），必须为非负整数
+    :param seed: 可选随机种子
     :return: 随机浮点数列表
     :raises ValueError: 当参数无效时抛出
     """
@@ -19,4 +21,5 @@ def generate_random_floats(n: int, lower: float, upper: float, decimals: int) ->
         raise ValueError("lower 不能大于 upper")
     if decimals < 0:
         raise ValueError("decimals 必须为非负整数")
-    return [round(random.uniform(lower, upper), decimals) for _ in range(n)]
+    distribution = numeric_distribution("uniform", low=lower, high=upper, decimals=decimals)
+    return distribution.sample(n, seed=seed).tolist()
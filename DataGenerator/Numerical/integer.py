@@ -1,19 +1,49 @@
 import random
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 
-def generate_random_integers(n: int, lower: int, upper: int) -> List[int]:
+from DataGenerator.Numerical.unique import sample_unique_integers
+
+
+def generate_random_integers(
+    n: int,
+    lower: int,
+    upper: int,
+    *,
+    unique: bool = False,
+    seed: Optional[int] = None,
+) -> List[int]:
     """
     返回包含 n 个随机整数的列表，整数范围在 [lower, upper]（含端点）。
 
     :param n: 需要生成的随机整数数量
     :param lower: 随机整数的下限
     :param upper: 随机整数的上限
+    :param unique: 是否保证结果互不相同，见 DataGenerator.Numerical.unique
+    :param seed: 可选随机种子
     :return: 随机整数列表
-    :raises ValueError: 当 n <= 0 或 lower > upper 时抛出
+    :raises ValueError: 当 n <= 0、lower > upper 或不重复模式下 n 超过区间内整数个数时抛出
     """
     if n <= 0:
         raise ValueError("n 必须为正整数")
     if lower > upper:
         raise ValueError("lower 不能大于 upper")
-    return [random.randint(lower, upper) for _ in range(n)]
+    if unique and n > upper - lower + 1:
+        raise ValueError(f"区间内只有 {upper - lower + 1} 个整数，无法抽取 {n} 个不重复值")
+    if -2**63 <= lower and upper < 2**63:
+        if unique:
+            return sample_unique_integers(n, lower, upper, seed=seed).tolist()
+        return np.random.default_rng(seed).integers(lower, upper, size=n, endpoint=True).tolist()
+    # 超出 int64 的范围退回 Python 大整数
+    if unique and upper - lower < 2**63:
+        # 区间本身不长时按偏移量不重复抽样，再平移回原区间
+        return [lower + offset for offset in sample_unique_integers(n, 0, upper - lower, seed=seed).tolist()]
+    rng = random.Random(seed)
+    if unique:
+        # 区间长度超过 2^63，碰撞极少，去重后补抽即可
+        values = dict.fromkeys(rng.randint(lower, upper) for _ in range(n))
+        while len(values) < n:
+            values[rng.randint(lower, upper)] = None
+        return list(values)
+    return [rng.randint(lower, upper) for _ in range(n)]
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Mapping, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class AliasTable:
+    """
+    Walker/Vose 别名表：构建一次后每次抽样只需一次均匀整数和一次均匀浮点数，
+    与类别数量无关。
+    """
+
+    probability: np.ndarray
+    """各列保留自身类别的概率。"""
+
+    alias: np.ndarray
+    """各列未保留时改取的类别。"""
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """
+        批量抽取类别索引。
+
+        参数:
+            rng: NumPy 随机数生成器。
+            size: 抽取数量。
+
+        返回:
+            长度为 size 的类别索引数组。
+        """
+        columns = rng.integers(0, len(self.probability), size=size)
+        keep = rng.random(size) < self.probability[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+
+@dataclass(frozen=True)
+class ConditionalAliasTable:
+    """
+    条件别名表：每个分组一行别名表，按行内分组索引一次性向量化抽样。
+    """
+
+    probability: np.ndarray
+    """形状为 (分组数, 类别数) 的保留概率。"""
+
+    alias: np.ndarray
+    """形状为 (分组数, 类别数) 的别名类别。"""
+
+    def sample(self, rng: np.random.Generator, groups: np.ndarray) -> np.ndarray:
+        """
+        按每行所属分组批量抽取类别索引。
+
+        参数:
+            rng: NumPy 随机数生成器。
+            groups: 每行的分组索引。
+
+        返回:
+            与 groups 等长的类别索引数组。
+        """
+        groups = np.asarray(groups, dtype=np.intp)
+        columns = rng.integers(0, self.probability.shape[1], size=len(groups))
+        keep = rng.random(len(groups)) < self.probability[groups, columns]
+        return np.where(keep, columns, self.alias[groups, columns])
+
+
+def build_alias_table(weights: Sequence[float] | np.ndarray) -> AliasTable:
+    """
+    由非负权重构建别名表。
+
+    参数:
+        weights: 各类别的权重，允许为 0，但总和必须为正。
+
+    返回:
+        AliasTable 实例。
+
+    异常:
+        ValueError: 当权重为空、含负数或总和不为正时抛出。
+    """
+    probability, alias = _vose(np.asarray(weights, dtype=np.float64))
+    return AliasTable(probability=probability, alias=alias)
+
+
+def build_conditional_alias_table(weight_rows: Sequence[Sequence[float]] | np.ndarray) -> ConditionalAliasTable:
+    """
+    由每个分组的一行权重构建条件别名表，各行的类别顺序必须一致。
+
+    参数:
+        weight_rows: 形状为 (分组数, 类别数) 的权重矩阵。
+
+    返回:
+        ConditionalAliasTable 实例。
+
+    异常:
+        ValueError: 当矩阵为空或任意一行权重非法时抛出。
+    """
+    matrix = np.asarray(weight_rows, dtype=np.float64)
+    if matrix.ndim != 2 or matrix.shape[0] == 0:
+        raise ValueError("weight_rows 必须为非空的二维权重矩阵")
+    rows = [_vose(row) for row in matrix]
+    return ConditionalAliasTable(
+        probability=np.stack([probability for probability, _ in rows]),
+        alias=np.stack([alias for _, alias in rows]),
+    )
+
+
+def flatten_hierarchy(
+    paths: Sequence[Tuple[str, ...]],
+    *,
+    top_weights: Mapping[str, float] | None = None,
+) -> np.ndarray:
+    """
+    把层级表（如 省 → 市 → 区县）展平为叶子层的权重。
+
+    每个节点的概率质量在其直接子节点间平均分配；顶层节点的质量取自 top_weights，
+    未指定时各顶层节点相等。
+
+    参数:
+        paths: 每个叶子从顶层到自身的路径，例如 ("广东省", "广州市", "天河区")。
+    关键字参数:
+        top_weights: 可选的顶层权重，例如各省人口；未列出的顶层节点权重为 0。
+
+    返回:
+        与 paths 等长的叶子权重数组，可直接用于 build_alias_table。
+
+    异常:
+        ValueError: 当 paths 为空、路径深度不一致或 top_weights 非法时抛出。
+    """
+    if not paths:
+        raise ValueError("paths 不能为空")
+    depth = len(paths[0])
+    if depth == 0 or any(len(path) != depth for path in paths):
+        raise ValueError("所有路径的层级深度必须一致且不为 0")
+
+    if top_weights is None:
+        weights = np.ones(len(paths), dtype=np.float64)
+    else:
+        if any(weight < 0 for weight in top_weights.values()):
+            raise ValueError("top_weights 不能包含负数")
+        weights = np.asarray([top_weights.get(path[0], 0.0) for path in paths], dtype=np.float64)
+        if weights.sum() <= 0:
+            raise ValueError("top_weights 未覆盖任何顶层节点")
+
+    # 第 level-1 层节点的质量平均分给其第 level 层的子节点
+    for level in range(1, depth):
+        children = {}
+        for path in paths:
+            children.setdefault(path[:level], set()).add(path[level])
+        weights /= np.asarray([len(children[path[:level]]) for path in paths], dtype=np.float64)
+
+    leaves = Counter(paths)
+    return weights / np.asarray([leaves[path] for path in paths], dtype=np.float64)
+
+
+def _vose(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if weights.ndim != 1 or weights.size == 0:
+        raise ValueError("weights 不能为空")
+    if (weights < 0).any() or not np.isfinite(weights).all():
+        raise ValueError("weights 必须为非负有限数")
+    total = weights.sum()
+    if total <= 0:
+        raise ValueError("weights 总和必须为正数")
+
+    size = weights.size
+    scaled = weights * (size / total)
+    probability = np.ones(size, dtype=np.float64)
+    alias = np.arange(size, dtype=np.intp)
+
+    small = [index for index in range(size) if scaled[index] < 1.0]
+    large = [index for index in range(size) if scaled[index] >= 1.0]
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+    # 剩余列只因浮点误差偏离 1，直接保留自身
+    return probability, alias
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, Tuple
+
+import numpy as np
+
+# 不重复抽样的方式：自动选择、Feistel 置换（稀疏，O(1) 内存）、部分洗牌（稠密）
+UNIQUE_METHODS: tuple[str, ...] = ("auto", "permutation", "shuffle")
+
+# Feistel 轮数；轮函数为 splitmix64 混合，4 轮以上即可得到统计上均匀的置换
+_FEISTEL_ROUNDS = 6
+
+# auto 模式下选择洗牌的条件：区间不超过该长度，且不超过抽取数量的 _DENSE_FACTOR 倍
+_DENSE_MAX_SPAN = 1 << 26
+_DENSE_FACTOR = 4
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+_UINT64_MASK = 2 ** 64 - 1
+
+_MIX_MULTIPLIER_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_MULTIPLIER_2 = np.uint64(0x94D049BB133111EB)
+
+
+@dataclass(frozen=True)
+class FeistelPermutation:
+    """
+    [0, domain) 上由种子决定的伪随机置换。
+
+    把下标拆成高低两半做平衡 Feistel 网络得到 [0, 4^half_bits) 上的双射，
+    落在 domain 之外的结果继续迭代（cycle walking）直到回到 domain 内，
+    因此 domain 不必是 2 的幂。第 i 个输出只依赖 i 与密钥，可以任意分块、乱序计算，
+    不需要保存已经输出的值。
+    """
+
+    domain: int
+    """置换的定义域大小，1 到 2^64。"""
+
+    half_bits: int
+    """Feistel 每一半的位数，4^half_bits 不小于 domain。"""
+
+    keys: Tuple[int, ...]
+    """各轮的 64 位轮密钥。"""
+
+    def apply(self, indices: np.ndarray) -> np.ndarray:
+        """
+        计算 indices（均须小于 domain）在置换下的像。
+
+        :param indices: 非负整数数组
+        :return: uint64 数组，与 indices 一一对应且互不相同
+        """
+        values = self._encrypt(np.asarray(indices, dtype=np.uint64))
+        if self.domain == 2 ** 64:
+            return values
+        # 4^half_bits 至多约为 domain 的 4 倍，平均每个值迭代不到 4 次
+        limit = np.uint64(self.domain)
+        outside = np.flatnonzero(values >= limit)
+        while outside.size:
+            values[outside] = self._encrypt(values[outside])
+            outside = outside[values[outside] >= limit]
+        return values
+
+    def _encrypt(self, values: np.ndarray) -> np.ndarray:
+        shift = np.uint64(self.half_bits)
+        mask = np.uint64((1 << self.half_bits) - 1)
+        left, right = values >> shift, values & mask
+        for key in self.keys:
+            left, right = right, left ^ (mix64(right + np.uint64(key)) & mask)
+        return (left << shift) | right
+
+
+def feistel_permutation(domain: int, *, seed: int | np.random.Generator | None = None) -> FeistelPermutation:
+    """
+    构造 [0, domain) 上的伪随机置换，相同种子得到相同置换。
+
+    :param domain: 定义域大小，1 到 2^64
+    :param seed: 可选随机种子或 numpy Generator
+    :return: FeistelPermutation
+    :raises ValueError: 当 domain 超出范围时抛出
+    """
+    if not 1 <= domain <= 2 ** 64:
+        raise ValueError("domain 必须在 1 到 2^64 之间")
+    half_bits = max(1, ((domain - 1).bit_length() + 1) // 2)
+    keys = np.random.default_rng(seed).integers(0, 2 ** 64, size=_FEISTEL_ROUNDS, dtype=np.uint64)
+    return FeistelPermutation(domain=domain, half_bits=half_bits, keys=tuple(int(key) for key in keys))
+
+
+def sample_unique_integers(
+    count: int,
+    lower: int,
+    upper: int,
+    *,
+    method: str = "auto",
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    在 [lower, upper]（含端点，均在 int64 范围内）中不放回地抽取 count 个互不相同的整数。
+
+    :param count: 数量
+    :param lower: 下限
+    :param upper: 上限
+    :param method: "permutation" 用 Feistel 置换，内存只与 count 有关、与区间长度无关；
+        "shuffle" 用 numpy 的不放回抽样（Floyd / 部分洗牌），适合抽取量占区间比例较大的情况；
+        "auto" 按区间长度与抽取量自动选择
+    :param seed: 可选随机种子
+    :return: 随机顺序的 int64 数组
+    :raises ValueError: 当参数非法或 count 超过区间内整数个数时抛出
+    """
+    span = _check(count, lower, upper, method)
+    if _resolve(method, count, span) == "shuffle":
+        offsets = np.random.default_rng(seed).choice(span, size=count, replace=False)
+        return offsets.astype(np.int64) + lower
+    return _shift(feistel_permutation(span, seed=seed).apply(np.arange(count, dtype=np.uint64)), lower)
+
+
+def iter_unique_integers(
+    count: int,
+    lower: int,
+    upper: int,
+    *,
+    method: str = "auto",
+    chunk_size: int = 1_000_000,
+    seed: int | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    分块输出 sample_unique_integers 的结果，所有块合起来互不相同。
+
+    置换模式下每块按下标区间独立计算，内存占用只与 chunk_size 有关，可以流式生成上亿个主键；
+    洗牌模式需要先整体抽样，再按块切分。
+
+    :param count: 总数量
+    :param lower: 下限
+    :param upper: 上限
+    :param method: 抽样方式，见 UNIQUE_METHODS
+    :param chunk_size: 每块数量
+    :param seed: 可选随机种子
+    :return: int64 数组迭代器
+    """
+    span = _check(count, lower, upper, method)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须为正整数")
+    if _resolve(method, count, span) == "shuffle":
+        values = sample_unique_integers(count, lower, upper, method="shuffle", seed=seed)
+        for start in range(0, count, chunk_size):
+            yield values[start : start + chunk_size]
+        return
+
+    permutation = feistel_permutation(span, seed=seed)
+    for start in range(0, count, chunk_size):
+        indices = np.arange(start, min(start + chunk_size, count), dtype=np.uint64)
+        yield _shift(permutation.apply(indices), lower)
+
+
+def _check(count: int, lower: int, upper: int, method: str) -> int:
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    if lower > upper:
+        raise ValueError("lower 不能大于 upper")
+    if lower < _INT64_MIN or upper > _INT64_MAX:
+        raise ValueError("lower 与 upper 必须在 int64 范围内")
+    if method not in UNIQUE_METHODS:
+        raise ValueError(f"未知的抽样方式: {method}，可选值为 {UNIQUE_METHODS}")
+    span = upper - lower + 1
+    if count > span:
+        raise ValueError(f"区间内只有 {span} 个整数，无法抽取 {count} 个不重复值")
+    if method == "shuffle" and span > _INT64_MAX:
+        raise ValueError("shuffle 方式要求区间长度不超过 2^63 - 1，请改用 permutation")
+    return span
+
+
+def _resolve(method: str, count: int, span: int) -> str:
+    if method != "auto":
+        return method
+    return "shuffle" if span <= min(_DENSE_MAX_SPAN, _DENSE_FACTOR * count) else "permutation"
+
+
+def _shift(offsets: np.ndarray, lower: int) -> np.ndarray:
+    """uint64 偏移加下限，按 2^64 回绕后解释为 int64，覆盖整个 int64 区间。"""
+    return (offsets + np.uint64(lower & _UINT64_MASK)).view(np.int64)
+
+
+def mix64(values: np.ndarray) -> np.ndarray:
+    """
+    splitmix64 终结函数，把 64 位整数打散为均匀分布的散列值（uint64 乘法按 2^64 回绕）。
+
+    :param values: 整数数组
+    :return: 新的 uint64 数组
+    """
+    with np.errstate(over="ignore"):
+        z = np.asarray(values).astype(np.uint64, copy=True)
+        z ^= z >> np.uint64(30)
+        z *= _MIX_MULTIPLIER_1
+        z ^= z >> np.uint64(27)
+        z *= _MIX_MULTIPLIER_2
+        z ^= z >> np.uint64(31)
+    return z
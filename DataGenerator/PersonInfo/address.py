@@ -1,53 +1,258 @@
+from __future__ import annotations
+
 import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from DataGenerator.PersonInfo.location import REGION_CODES
+
+
+# 街道名由“词根 + 后缀”组合而成，例如“人民路”“建设北路”
+STREET_ROOTS: tuple[str, ...] = (
+    "人民", "建设", "解放", "中山", "和平", "文化", "新华", "学府", "长江", "黄河",
+    "胜利", "光明", "幸福", "朝阳", "友谊", "团结", "工业", "科技", "青年", "迎宾",
+    "滨江", "环城", "府前", "振兴", "育才", "东风", "红旗", "复兴", "金桥", "花园",
+)
+STREET_SUFFIXES: tuple[str, ...] = ("路", "街", "大道", "东路", "西路", "南路", "北路", "中路")
+
+# 小区名由“词根 + 后缀”组合而成，例如“阳光花园”“锦绣家园”
+COMMUNITY_ROOTS: tuple[str, ...] = (
+    "阳光", "锦绣", "翠苑", "金色", "华府", "御景", "书香", "碧水", "绿城", "紫荆",
+    "丽景", "名都", "春晓", "康乐", "恒大", "万科", "天成", "龙湖", "怡和", "凤凰",
+)
+COMMUNITY_SUFFIXES: tuple[str, ...] = ("花园", "小区", "家园", "公寓", "苑", "新村", "雅居", "名邸")
+
+# 楼栋格式：字母座号或 1~50 的号楼/单元/栋
+BUILDING_LABELS: tuple[str, ...] = (
+    tuple(f"{letter}座" for letter in string.ascii_uppercase)
+    + tuple(f"{num}{unit}" for unit in ("号楼", "单元", "栋") for num in range(1, 51))
+)
+
+STREET_NUMBER_RANGE = (1, 999)
+FLOOR_RANGE = (1, 33)
+ROOMS_PER_FLOOR = 4
+
+
+@dataclass(frozen=True)
+class _AddressTables:
+    codes: np.ndarray
+    provinces: np.ndarray
+    cities: np.ndarray
+    districts: np.ndarray
+    streets: np.ndarray
+    communities: np.ndarray
+    buildings: np.ndarray
+
+
+@dataclass
+class AddressBatch:
+    """
+    批量生成的结构化地址，以组件表索引保存，各数组按行一一对应。
+    """
+
+    region_index: np.ndarray
+    """区县在组件表中的索引。"""
+
+    street_index: np.ndarray
+    """街道名索引。"""
+
+    street_numbers: np.ndarray
+    """门牌号（int64）。"""
+
+    community_index: np.ndarray
+    """小区名索引。"""
+
+    building_index: np.ndarray
+    """楼栋索引。"""
 
-from faker import Faker
-import random
-import re
+    rooms: np.ndarray
+    """房间号（int64），楼层 * 100 + 户号。"""
 
-fake = Faker("zh_CN")
+    region_code: str | None = None
+    """生成时使用的区划代码前缀，决定区县组件表。"""
 
-def generate_home_addresses(n: int) -> list[str]:
+    def __len__(self) -> int:
+        return len(self.region_index)
+
+    @property
+    def region_codes(self) -> np.ndarray:
+        """6 位行政区划代码（int64），与 location.REGION_CODES 一致。"""
+        return self._tables.codes[self.region_index]
+
+    @property
+    def provinces(self) -> np.ndarray:
+        """省级名称。"""
+        return self._tables.provinces[self.region_index]
+
+    @property
+    def cities(self) -> np.ndarray:
+        """地级名称。"""
+        return self._tables.cities[self.region_index]
+
+    @property
+    def districts(self) -> np.ndarray:
+        """区县名称。"""
+        return self._tables.districts[self.region_index]
+
+    @property
+    def streets(self) -> np.ndarray:
+        """街道名称。"""
+        return self._tables.streets[self.street_index]
+
+    @property
+    def communities(self) -> np.ndarray:
+        """小区名称。"""
+        return self._tables.communities[self.community_index]
+
+    @property
+    def buildings(self) -> np.ndarray:
+        """楼栋，例如“A座”“12号楼”。"""
+        return self._tables.buildings[self.building_index]
+
+    @property
+    def _tables(self) -> _AddressTables:
+        return _address_tables(self.region_code)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """按列名返回全部结构化列。"""
+        return {
+            "region_code": self.region_codes,
+            "province": self.provinces,
+            "city": self.cities,
+            "district": self.districts,
+            "street": self.streets,
+            "street_number": self.street_numbers,
+            "community": self.communities,
+            "building": self.buildings,
+            "room": self.rooms,
+        }
+
+    def to_strings(self) -> List[str]:
+        """
+        返回拼接后的完整地址列表，直辖市等省市同名时省略地级名称。
+        """
+        area_streets, numbered_communities, building_rooms = _joined_tables(self.region_code)
+        streets = len(self._tables.streets)
+        communities = len(self._tables.communities)
+        rooms_per_floor = ROOMS_PER_FLOOR * (FLOOR_RANGE[1] - FLOOR_RANGE[0] + 1)
+        room_index = (self.rooms // 100 - FLOOR_RANGE[0]) * ROOMS_PER_FLOOR + self.rooms % 100 - 1
+
+        joined = np.char.add(
+            area_streets[self.region_index * streets + self.street_index],
+            numbered_communities[(self.street_numbers - STREET_NUMBER_RANGE[0]) * communities + self.community_index],
+        )
+        joined = np.char.add(joined, building_rooms[self.building_index * rooms_per_floor + room_index])
+        return joined.tolist()
+
+
+def generate_home_addresses(n: int, *, region_code: str | None = None, seed: int | None = None) -> list[str]:
     """
     批量生成家庭地址
 
     Args:
         n (int): 生成的数量
+        region_code (str | None): 可选的区划代码前缀（2 位省级、4 位地级或 6 位区县）
+        seed (int | None): 可选随机种子，便于复现
 
     Returns:
         list[str]: 生成的家庭住址列表
     """
+    return generate_address_batch(n, region_code=region_code, seed=seed).to_strings()
 
-    return [_generate_custom_address() for _ in range(n)]
 
-# 移除邮编（末尾的六位数字）
-def _clean_faker_address(raw_address: str) -> str:
-    return re.sub(r'\s*\d{6}$', '', raw_address)
+def generate_address_batch(
+    count: int,
+    *,
+    region_code: str | None = None,
+    region_rows: np.ndarray | None = None,
+    seed: int | None = None,
+) -> AddressBatch:
+    """
+    由预编译的组件表批量组合 省/市/区县/街道/门牌/小区/楼栋/房间 结构化地址。
 
-# 随机生成楼栋号
-def _random_building_suffix():
-    formats = [
-        "{letter}座",
-        "{num}号楼",
-        "{num}单元",
-        "{num}栋"
-    ]
-    fmt = random.choice(formats)
+    省市区县取自 location.REGION_CODES，因此与身份证区划代码一致；
+    各组件均以向量化的索引抽样生成，不做逐行的字符串处理。
 
-    # 随机生成字母（A~Z）或数字（1~50）
-    letter = random.choice(string.ascii_uppercase)
-    num = random.randint(1, 50)
+    参数:
+        count: 需要生成的数量。
+    关键字参数:
+        region_code: 可选的区划代码前缀，2 位限定省级、4 位限定地级、6 位限定区县。
+        region_rows: 可选的逐行区县（location.REGION_CODES 的行索引），用于与上游已抽取的
+            区划保持一致；不能与 region_code 同时指定。
+        seed: 可选随机种子，便于复现。
 
-    return fmt.format(letter=letter, num=num)
+    返回:
+        AddressBatch，可通过 columns() 获取结构化列或 to_strings() 获取完整地址。
 
-# 拼接地址
-def _generate_custom_address() -> str:
-    raw = fake.address()
-    base = re.sub(r'\s*\d{6}$', '', raw)
+    异常:
+        ValueError: 当参数非法或 region_code 没有匹配的区划时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
 
-    building = _random_building_suffix()
-    door = f"{random.randint(100, 999)}号"
+    if region_rows is not None:
+        if region_code is not None:
+            raise ValueError("region_code 与 region_rows 不能同时指定")
+        if len(region_rows) != count:
+            raise ValueError("region_rows 的长度必须与 count 一致")
 
-    return re.sub(r'[a-zA-Z]', lambda m: m.group().upper(), f"{base}{building}{door}")
+    tables = _address_tables(region_code)
+    rng = np.random.default_rng(seed)
+    if region_rows is None:
+        region_index = rng.integers(0, len(tables.codes), size=count)
+    else:
+        region_index = np.asarray(region_rows, dtype=np.intp)
+    floors = rng.integers(FLOOR_RANGE[0], FLOOR_RANGE[1] + 1, size=count, dtype=np.int64)
+    return AddressBatch(
+        region_index=region_index,
+        street_index=rng.integers(0, len(tables.streets), size=count),
+        street_numbers=rng.integers(STREET_NUMBER_RANGE[0], STREET_NUMBER_RANGE[1] + 1, size=count, dtype=np.int64),
+        community_index=rng.integers(0, len(tables.communities), size=count),
+        building_index=rng.integers(0, len(tables.buildings), size=count),
+        rooms=floors * 100 + rng.integers(1, ROOMS_PER_FLOOR + 1, size=count, dtype=np.int64),
+        region_code=region_code,
+    )
 
 
+@lru_cache(maxsize=64)
+def _address_tables(region_code: str | None) -> _AddressTables:
+    if region_code is not None and (len(region_code) not in (2, 4, 6) or not region_code.isdigit()):
+        raise ValueError("region_code 须为 2、4 或 6 位数字")
 
+    rows = [row for row in REGION_CODES if region_code is None or row[0].startswith(region_code)]
+    if not rows:
+        raise ValueError(f"没有与区划代码 {region_code} 匹配的区县")
+    codes, provinces, cities, districts = zip(*rows)
+    return _AddressTables(
+        codes=np.asarray([int(code) for code in codes], dtype=np.int64),
+        provinces=np.asarray(provinces),
+        cities=np.asarray(cities),
+        districts=np.asarray(districts),
+        streets=np.asarray([root + suffix for root in STREET_ROOTS for suffix in STREET_SUFFIXES]),
+        communities=np.asarray([root + suffix for root in COMMUNITY_ROOTS for suffix in COMMUNITY_SUFFIXES]),
+        buildings=np.asarray(BUILDING_LABELS),
+    )
+
+
+@lru_cache(maxsize=8)
+def _joined_tables(region_code: str | None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    把相邻组件两两预先拼接成乘积表，拼接整条地址时只需三次查表和两次向量化相加。
+    """
+    tables = _address_tables(region_code)
+    # 直辖市省市同名、东莞等不设区县的地级市市县同名，同名的一级只写一次
+    areas = np.char.add(
+        np.char.add(tables.provinces, np.where(tables.cities == tables.provinces, "", tables.cities)),
+        np.where(tables.districts == tables.cities, "", tables.districts),
+    )
+    numbers = np.char.add(np.arange(STREET_NUMBER_RANGE[0], STREET_NUMBER_RANGE[1] + 1).astype(str), "号")
+    floors = np.arange(FLOOR_RANGE[0], FLOOR_RANGE[1] + 1)[:, None] * 100
+    rooms = np.char.add((floors + np.arange(1, ROOMS_PER_FLOOR + 1)).ravel().astype(str), "室")
+    return (
+        np.char.add(areas[:, None], tables.streets[None, :]).ravel(),
+        np.char.add(numbers[:, None], tables.communities[None, :]).ravel(),
+        np.char.add(tables.buildings[:, None], rooms[None, :]).ravel(),
+    )
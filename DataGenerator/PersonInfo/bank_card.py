@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import random
-from typing import Iterable, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
 
 
 SUPPORTED_BANK_IDENTIFIERS: tuple[str, ...] = (
@@ -18,6 +22,39 @@ SUPPORTED_BANK_IDENTIFIERS: tuple[str, ...] = (
 )
 
 
+@dataclass(frozen=True)
+class BankIssuer:
+    """发卡行配置：BIN 前缀、抽样权重与卡号总长度。"""
+
+    bin: str
+    """发行方识别号（IIN/BIN），纯数字字符串。"""
+
+    weight: float = 1.0
+    """抽样权重，按各发卡行在批量结果中的相对占比设置。"""
+
+    length: int = 16
+    """卡号总长度（含校验位），13~19 位。"""
+
+    name: str = ""
+    """发卡行名称，仅用于说明。"""
+
+
+DEFAULT_BANK_ISSUERS: tuple[BankIssuer, ...] = (
+    BankIssuer("622202", 18.0, 19, "工商银行"),
+    BankIssuer("622848", 16.0, 19, "农业银行"),
+    BankIssuer("622700", 15.0, 19, "建设银行"),
+    BankIssuer("622588", 6.0, 16, "交通银行"),
+    BankIssuer("622262", 12.0, 19, "中国银行"),
+    BankIssuer("621098", 9.0, 16, "招商银行"),
+    BankIssuer("622155", 5.0, 16, "民生银行"),
+    BankIssuer("622689", 4.0, 16, "广发银行"),
+    BankIssuer("622318", 5.0, 16, "光大银行"),
+    BankIssuer("622908", 6.0, 16, "中信银行"),
+)
+
+_LUHN_DOUBLED = np.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=np.uint8)
+
+
 def generate_bank_card_number(
     *,
     issuer_identifiers: Iterable[str] = SUPPORTED_BANK_IDENTIFIERS,
@@ -97,6 +134,152 @@ def generate_bank_card_numbers(
     ]
 
 
+def generate_bank_card_array(
+    count: int,
+    *,
+    issuers: Sequence[BankIssuer] = DEFAULT_BANK_ISSUERS,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    以矩阵方式批量生成符合 Luhn 校验的银行卡号。
+
+    参数:
+        count: 需要生成的银行卡号数量。
+    关键字参数:
+        issuers: 发卡行配置表，按 weight 加权抽取 BIN，卡号长度取自 length。
+        seed: 可选随机种子，相同种子得到相同结果。
+
+    返回:
+        dtype 为 ``S{最大卡号长度}`` 的定长字节串数组，较短卡号尾部以空字节填充，
+        ``arr.astype(str)`` 或 ``item.decode()`` 可得到普通字符串。
+
+    异常:
+        ValueError: 当 count 非正或发卡行配置非法时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+
+    table = _compile_issuers(tuple(issuers))
+    return _build_card_array(np.random.default_rng(seed), count, table)
+
+
+def iter_bank_card_chunks(
+    count: int,
+    *,
+    issuers: Sequence[BankIssuer] = DEFAULT_BANK_ISSUERS,
+    chunk_size: int = 1_000_000,
+    as_lines: bool = False,
+    seed: int | None = None,
+) -> Iterator[np.ndarray] | Iterator[bytes]:
+    """
+    分块流式生成银行卡号，内存占用只与 chunk_size 有关。
+
+    参数:
+        count: 需要生成的银行卡号总数。
+    关键字参数:
+        issuers: 发卡行配置表。
+        chunk_size: 每块的卡号数量。
+        as_lines: 为 True 时每块产出以换行分隔的 bytes，可直接写入二进制文件。
+        seed: 可选随机种子；相同的 seed 与 chunk_size 产出相同序列。
+
+    返回:
+        逐块产出定长字节串数组（或换行分隔的 bytes）的迭代器。
+
+    异常:
+        ValueError: 当 count、chunk_size 非正或发卡行配置非法时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须为正整数")
+
+    table = _compile_issuers(tuple(issuers))
+    rng = np.random.default_rng(seed)
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        chunk = _build_card_array(rng, size, table)
+        remaining -= size
+        if as_lines:
+            yield b"\n".join(chunk.tolist()) + b"\n"
+        else:
+            yield chunk
+
+
+def luhn_check_digits(payload: np.ndarray) -> np.ndarray:
+    """
+    按列计算一组号码的 Luhn 校验位。
+
+    参数:
+        payload: 形状为 (n, k) 的数字矩阵（不含校验位），每行一个号码。
+
+    返回:
+        长度为 n 的 uint8 校验位数组。
+    """
+    payload = np.asarray(payload, dtype=np.uint8)
+    width = payload.shape[1]
+    # 从右往左数，紧邻校验位的那一位（payload 的最后一位）需要加倍。
+    doubled = (width - 1 - np.arange(width)) % 2 == 0
+    total = payload[:, ~doubled].sum(axis=1, dtype=np.int64)
+    total += _LUHN_DOUBLED[payload[:, doubled]].sum(axis=1, dtype=np.int64)
+    return ((10 - total % 10) % 10).astype(np.uint8)
+
+
+_IssuerTable = Tuple[Tuple[np.ndarray, ...], np.ndarray, np.ndarray, int]
+
+
+@lru_cache(maxsize=32)
+def _compile_issuers(issuers: Tuple[BankIssuer, ...]) -> _IssuerTable:
+    """
+    校验发卡行配置，并预先计算前缀数字、卡号长度与累积权重。
+    """
+    if not issuers:
+        raise ValueError("issuers 不能为空")
+
+    prefixes = []
+    lengths = []
+    weights = []
+    for issuer in issuers:
+        if not issuer.bin.isdigit():
+            raise ValueError("BIN 必须为数字字符串")
+        if issuer.length not in (13, 14, 15, 16, 17, 18, 19):
+            raise ValueError("银行卡长度须在 13~19 位之间")
+        if len(issuer.bin) >= issuer.length:
+            raise ValueError("发行方识别号长度必须小于卡号总长度")
+        if issuer.weight <= 0:
+            raise ValueError("weight 必须为正数")
+        prefixes.append(np.frombuffer(issuer.bin.encode("ascii"), dtype=np.uint8) - ord("0"))
+        lengths.append(issuer.length)
+        weights.append(issuer.weight)
+
+    cumulative = np.cumsum(np.asarray(weights, dtype=np.float64))
+    cumulative /= cumulative[-1]
+    return tuple(prefixes), np.asarray(lengths, dtype=np.int64), cumulative, max(lengths)
+
+
+def _build_card_array(rng: np.random.Generator, count: int, table: _IssuerTable) -> np.ndarray:
+    prefixes, lengths, cumulative, max_length = table
+
+    picks = np.searchsorted(cumulative, rng.random(count), side="right")
+    np.minimum(picks, len(prefixes) - 1, out=picks)
+
+    out = np.zeros(count, dtype=f"S{max_length}")
+    for issuer_index, prefix in enumerate(prefixes):
+        rows = np.flatnonzero(picks == issuer_index)
+        if rows.size == 0:
+            continue
+        length = int(lengths[issuer_index])
+        digits = np.empty((rows.size, length), dtype=np.uint8)
+        digits[:, : prefix.size] = prefix
+        digits[:, prefix.size : length - 1] = rng.integers(
+            0, 10, size=(rows.size, length - prefix.size - 1), dtype=np.uint8
+        )
+        digits[:, -1] = luhn_check_digits(digits[:, :-1])
+        digits += ord("0")
+        out[rows] = digits.view(f"S{length}").ravel()
+    return out
+
+
 def _compute_luhn_check_digit(number: str) -> str:
     """
     根据 Luhn 算法计算校验位。
@@ -1,52 +1,332 @@
-import random
-
-from faker import Faker
-
-
-def generate_unique_emails(count):
-    fake = Faker()
-    emails = set()
-    domains = [
-        "gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "live.com",
-        "icloud.com", "protonmail.com", "aol.com", "msn.com", "mail.com",
-        "zoho.com", "gmx.com", "yandex.com", "qq.com", "163.com", "126.com",
-        "sina.com", "sohu.com", "foxmail.com", "aliyun.com", "yeah.net",
-        "tom.com", "189.cn", "139.com", "21cn.com", "hotmail.co.uk",
-        "btinternet.com", "mail.ru", "inbox.ru", "list.ru", "bk.ru",
-        "web.de", "t-online.de", "orange.fr", "wanadoo.fr", "laposte.net",
-        "libero.it", "virgilio.it", "alice.it", "cox.net", "charter.net",
-        "earthlink.net", "juno.com", "comcast.net", "verizon.net", "att.net",
-        "bellsouth.net", "bigpond.com", "btconnect.com", "cfl.rr.com", "frontier.com",
-        "mac.com", "me.com", "mailinator.com", "rocketmail.com", "safe-mail.net",
-        "wow.com", "y7mail.com", "yahoo.co.in", "yahoo.co.jp", "yahoo.co.uk",
-        "yahoo.com.au", "yahoo.ca", "yahoo.fr", "yahoo.de", "yahoo.it",
-        "yahoo.es", "yahoo.com.sg", "ymail.com", "zoznam.sk", "freemail.hu",
-        "centrum.cz", "seznam.cz", "o2.pl", "wp.pl", "interia.pl", "onet.pl",
-        "student.university.edu", "alumni.university.edu", "companyname.com",
-        "enterprise.org", "business.net", "ngo.org", "government.gov", "edu.cn",
-        "school.edu", "college.edu", "university.edu", "researchlab.org",
-        "consultingfirm.com", "lawfirm.net", "medcenter.org", "hospital.net",
-        "techstartup.io", "devteam.co", "opensource.org", "cloudservice.net",
-        "freemail.org", "temporarymail.com", "throwawaymail.com", "disposablemail.com",
-        "mytempemail.com", "temp-mail.org", "spamgourmet.com", "maildrop.cc",
-        "guerrillamail.com", "10minutemail.com", "sharklasers.com",
-        "posteo.de", "tutanota.com", "lavabit.com", "countermail.com", "mailbox.org",
-        "runbox.com", "fastmail.com", "hushmail.com", "startmail.com",
-        "zoemail.com", "mailfence.com", "kolabnow.com", "posteo.net",
-        "disroot.org", "autistici.org", "safe-mail.net", "mailbox.org",
-        "mail.comcast.net", "protonmail.ch", "cock.li", "seznam.cz",
-        "freenet.de", "bluewin.ch", "hispeed.ch", "gawab.com", "rediffmail.com",
-        "inbox.lv", "latnet.lv", "mail.ee", "mail.bg", "abv.bg",
-        "netscape.net", "hotmail.fr", "outlook.fr", "mail.kz", "rambler.ru",
-        "bk.ru", "list.ru", "inbox.ru", "mail.ru"
-    ]
-
-    while len(emails) < count:
-        username = fake.user_name()
-        domain = random.choice(domains)
-        email = f"{username}@{domain}"
-        emails.add(email.lower())
-    return list(emails)
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Sequence, Tuple
+
+import numpy as np
+
+from DataGenerator.PersonInfo.uniqueness import (
+    CombinationSpace,
+    UniquenessFilter,
+    hash_strings,
+    make_uniqueness_filter,
+    perplexity,
+)
+
+# 邮箱域名及其抽样权重（相对值），重复域名已合并
+EMAIL_DOMAIN_WEIGHTS: tuple[tuple[str, float], ...] = (
+    ("gmail.com", 12.0), ("yahoo.com", 4.0), ("hotmail.com", 4.0), ("outlook.com", 5.0), ("live.com", 2.0),
+    ("icloud.com", 3.0), ("protonmail.com", 1.0), ("aol.com", 1.0), ("msn.com", 1.0),
+    ("mail.com", 1.0), ("zoho.com", 1.0), ("gmx.com", 1.0), ("yandex.com", 1.0), ("qq.com", 12.0),
+    ("163.com", 8.0), ("126.com", 4.0), ("sina.com", 2.0), ("sohu.com", 1.5), ("foxmail.com", 2.0),
+    ("aliyun.com", 1.5), ("yeah.net", 1.0), ("tom.com", 1.0), ("189.cn", 1.0), ("139.com", 1.5),
+    ("21cn.com", 1.0), ("hotmail.co.uk", 1.0), ("btinternet.com", 1.0), ("mail.ru", 2.0),
+    ("inbox.ru", 2.0), ("list.ru", 2.0), ("bk.ru", 2.0), ("web.de", 1.0), ("t-online.de", 1.0),
+    ("orange.fr", 1.0), ("wanadoo.fr", 1.0), ("laposte.net", 1.0), ("libero.it", 1.0),
+    ("virgilio.it", 1.0), ("alice.it", 1.0), ("cox.net", 1.0), ("charter.net", 1.0),
+    ("earthlink.net", 1.0), ("juno.com", 1.0), ("comcast.net", 1.0), ("verizon.net", 1.0),
+    ("att.net", 1.0), ("bellsouth.net", 1.0), ("bigpond.com", 1.0), ("btconnect.com", 1.0),
+    ("cfl.rr.com", 1.0), ("frontier.com", 1.0), ("mac.com", 1.0), ("me.com", 1.0),
+    ("mailinator.com", 1.0), ("rocketmail.com", 1.0), ("safe-mail.net", 2.0), ("wow.com", 1.0),
+    ("y7mail.com", 1.0), ("yahoo.co.in", 1.0), ("yahoo.co.jp", 1.0), ("yahoo.co.uk", 1.0),
+    ("yahoo.com.au", 1.0), ("yahoo.ca", 1.0), ("yahoo.fr", 1.0), ("yahoo.de", 1.0),
+    ("yahoo.it", 1.0), ("yahoo.es", 1.0), ("yahoo.com.sg", 1.0), ("ymail.com", 1.0),
+    ("zoznam.sk", 1.0), ("freemail.hu", 1.0), ("centrum.cz", 1.0), ("seznam.cz", 2.0),
+    ("o2.pl", 1.0), ("wp.pl", 1.0), ("interia.pl", 1.0), ("onet.pl", 1.0),
+    ("student.university.edu", 1.0), ("alumni.university.edu", 1.0), ("companyname.com", 1.0),
+    ("enterprise.org", 1.0), ("business.net", 1.0), ("ngo.org", 1.0), ("government.gov", 1.0),
+    ("edu.cn", 1.0), ("school.edu", 1.0), ("college.edu", 1.0), ("university.edu", 1.0),
+    ("researchlab.org", 1.0), ("consultingfirm.com", 1.0), ("lawfirm.net", 1.0),
+    ("medcenter.org", 1.0), ("hospital.net", 1.0), ("techstartup.io", 1.0), ("devteam.co", 1.0),
+    ("opensource.org", 1.0), ("cloudservice.net", 1.0), ("freemail.org", 1.0),
+    ("temporarymail.com", 1.0), ("throwawaymail.com", 1.0), ("disposablemail.com", 1.0),
+    ("mytempemail.com", 1.0), ("temp-mail.org", 1.0), ("spamgourmet.com", 1.0),
+    ("maildrop.cc", 1.0), ("guerrillamail.com", 1.0), ("10minutemail.com", 1.0),
+    ("sharklasers.com", 1.0), ("posteo.de", 1.0), ("tutanota.com", 1.0), ("lavabit.com", 1.0),
+    ("countermail.com", 1.0), ("mailbox.org", 2.0), ("runbox.com", 1.0), ("fastmail.com", 1.0),
+    ("hushmail.com", 1.0), ("startmail.com", 1.0), ("zoemail.com", 1.0), ("mailfence.com", 1.0),
+    ("kolabnow.com", 1.0), ("posteo.net", 1.0), ("disroot.org", 1.0), ("autistici.org", 1.0),
+    ("mail.comcast.net", 1.0), ("protonmail.ch", 1.0), ("cock.li", 1.0), ("freenet.de", 1.0),
+    ("bluewin.ch", 1.0), ("hispeed.ch", 1.0), ("gawab.com", 1.0), ("rediffmail.com", 1.0),
+    ("inbox.lv", 1.0), ("latnet.lv", 1.0), ("mail.ee", 1.0), ("mail.bg", 1.0), ("abv.bg", 1.0),
+    ("netscape.net", 1.0), ("hotmail.fr", 1.0), ("outlook.fr", 1.0), ("mail.kz", 1.0),
+    ("rambler.ru", 1.0),
+)
+
+_ENGLISH_FIRST_NAMES = (
+    "james", "john", "robert", "michael", "william", "david", "richard", "joseph", "thomas", "charles",
+    "christopher", "daniel", "matthew", "anthony", "mark", "donald", "steven", "paul", "andrew", "joshua",
+    "kevin", "brian", "george", "edward", "ronald", "timothy", "jason", "jeffrey", "ryan", "jacob",
+    "gary", "nicholas", "eric", "jonathan", "stephen", "larry", "justin", "scott", "brandon", "benjamin",
+    "mary", "patricia", "jennifer", "linda", "elizabeth", "barbara", "susan", "jessica", "sarah", "karen",
+    "lisa", "nancy", "betty", "margaret", "sandra", "ashley", "kimberly", "emily", "donna", "michelle",
+    "carol", "amanda", "dorothy", "melissa", "deborah", "stephanie", "rebecca", "sharon", "laura", "cynthia",
+    "kathleen", "amy", "angela", "shirley", "anna", "brenda", "pamela", "emma", "nicole", "helen",
+)
+
+_ENGLISH_LAST_NAMES = (
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller", "davis", "rodriguez", "martinez",
+    "hernandez", "lopez", "gonzalez", "wilson", "anderson", "thomas", "taylor", "moore", "jackson", "martin",
+    "lee", "perez", "thompson", "white", "harris", "sanchez", "clark", "ramirez", "lewis", "robinson",
+    "walker", "young", "allen", "king", "wright", "scott", "torres", "nguyen", "hill", "flores",
+    "green", "adams", "nelson", "baker", "hall", "rivera", "campbell", "mitchell", "carter", "roberts",
+    "gomez", "phillips", "evans", "turner", "diaz", "parker", "cruz", "edwards", "collins", "reyes",
+    "stewart", "morris", "morales", "murphy", "cook", "rogers", "gutierrez", "ortiz", "morgan", "cooper",
+    "peterson", "bailey", "reed", "kelly", "howard", "ramos", "kim", "cox", "ward", "richardson",
+)
+
+_PINYIN_SURNAMES = (
+    "wang", "li", "zhang", "liu", "chen", "yang", "huang", "wu", "zhao", "zhou",
+    "xu", "sun", "ma", "zhu", "hu", "lin", "guo", "he", "gao", "luo",
+    "zheng", "liang", "xie", "song", "tang", "han", "feng", "deng", "cao", "peng",
+    "zeng", "xiao", "tian", "dong", "pan", "yuan", "cai", "jiang", "yu", "du",
+    "ye", "cheng", "wei", "su", "lv", "ding", "ren", "lu", "yao", "shen",
+)
+
+_PINYIN_GIVEN = (
+    "wei", "fang", "na", "min", "jing", "li", "qiang", "lei", "jun", "yang",
+    "yong", "yan", "jie", "juan", "tao", "ming", "chao", "xiu", "xia", "ping",
+    "gang", "gui", "ying", "hua", "yu", "lan", "hong", "jian", "guo", "wen",
+    "hui", "peng", "fei", "xin", "bo", "bin", "hao", "kai", "jia", "chen",
+    "rui", "zhi", "dong", "ting", "mei", "yun", "xue", "qian", "qin", "lin",
+    "xuan", "han", "zi", "yi", "si", "meng", "shu", "tian", "ze", "hang",
+)
+
+_TWO_DIGITS = tuple(f"{value:02d}" for value in range(100))
+_LETTERS = tuple("abcdefghijklmnopqrstuvwxyz")
+
+_USERNAME_POOLS: dict[str, Tuple[str, ...]] = {
+    "first": _ENGLISH_FIRST_NAMES,
+    "last": _ENGLISH_LAST_NAMES,
+    "initial": _LETTERS,
+    "py_surname": _PINYIN_SURNAMES,
+    "py_given": _PINYIN_GIVEN,
+    "n2": _TWO_DIGITS,
+    "year": tuple(str(year) for year in range(1960, 2011)),
+}
+
+
+@dataclass(frozen=True)
+class UsernameTemplate:
+    """邮箱用户名模板：pattern 中的 {0}、{1}… 依次由 slots 填充。"""
+
+    pattern: str
+    """格式串，例如 "{0}.{1}"。"""
+
+    slots: tuple[str | range, ...]
+    """每个占位符的取值来源：用户名词表名称，或整数区间 range。"""
+
+    weight: float = 1.0
+    """模板的抽样权重。"""
+
+
+DEFAULT_USERNAME_TEMPLATES: tuple[UsernameTemplate, ...] = (
+    UsernameTemplate("{0}.{1}", ("first", "last"), 3.0),
+    UsernameTemplate("{0}{1}", ("first", "last"), 3.0),
+    UsernameTemplate("{0}_{1}", ("first", "last"), 1.0),
+    UsernameTemplate("{0}{1}{2}", ("first", "last", "n2"), 2.0),
+    UsernameTemplate("{0}{1}", ("initial", "last"), 1.5),
+    UsernameTemplate("{0}{1}{2}", ("last", "first", "year"), 1.0),
+    UsernameTemplate("{0}{1}", ("py_surname", "py_given"), 2.0),
+    UsernameTemplate("{0}{1}{2}", ("py_given", "py_given", "py_surname"), 2.0),
+    UsernameTemplate("{0}{1}{2}", ("py_surname", "py_given", "year"), 2.0),
+    UsernameTemplate("{0}.{1}{2}", ("py_surname", "py_given", "n2"), 1.0),
+    UsernameTemplate("{0}", (range(10_000, 10_000_000_000),), 2.5),
+)
+
+
+def iter_emails(
+    count: int,
+    *,
+    chunk_size: int = 100_000,
+    domains: Sequence[Tuple[str, float]] = EMAIL_DOMAIN_WEIGHTS,
+    templates: Sequence[UsernameTemplate] = DEFAULT_USERNAME_TEMPLATES,
+    unique: bool = True,
+    uniqueness: str | UniquenessFilter = "exact",
+    seed: int | None = None,
+) -> Iterator[list[str]]:
+    """
+    分块流式生成邮箱地址，可直接写入 CSV/SQLite 等下游。
+
+    Args:
+        count: int, 生成的总数量
+        chunk_size: int, 每块的地址数量
+        domains: (域名, 权重) 序列，重复域名的权重会被合并
+        templates: 用户名模板序列
+        unique: 是否保证所有地址不重复
+        uniqueness: 判重模式 "exact" / "bloom" / "disk"，或自行创建的 UniquenessFilter
+        seed: 可选随机种子，相同参数与种子产出相同序列
+
+    Returns:
+        Iterator[list[str]]: 逐块产出的邮箱地址列表
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须为正整数")
+
+    domain_names, domain_cumulative = _compile_domains(tuple(domains))
+    template_table = _compile_templates(tuple(templates))
+    rng = np.random.default_rng(seed)
+
+    if not unique:
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            remaining -= size
+            yield _draw_emails(rng, size, domain_names, domain_cumulative, template_table)
+        return
+
+    email_space(domains, templates).check(count, label="邮箱地址")
+    seen = uniqueness if isinstance(uniqueness, UniquenessFilter) else make_uniqueness_filter(uniqueness, expected_items=count)
+    try:
+        remaining = count
+        while remaining > 0:
+            wanted = min(chunk_size, remaining)
+            chunk: list[str] = []
+            stalled_rounds = 0
+            while len(chunk) < wanted:
+                batch = _draw_emails(rng, wanted - len(chunk), domain_names, domain_cumulative, template_table)
+                fresh = seen.add_batch(hash_strings(batch)).tolist()
+                added = [email for email, is_new in zip(batch, fresh) if is_new]
+                chunk.extend(added)
+                stalled_rounds = 0 if added else stalled_rounds + 1
+                if stalled_rounds >= 32:
+                    raise ValueError(f"已生成 {count - remaining + len(chunk)} 个邮箱地址，剩余组合过于稀少，无法继续生成")
+            remaining -= wanted
+            yield chunk
+    finally:
+        if seen is not uniqueness:
+            seen.close()
+
+
+def generate_unique_emails(
+    count: int,
+    *,
+    uniqueness: str | UniquenessFilter = "exact",
+    seed: int | None = None,
+) -> list[str]:
+    """
+    批量生成不重复的邮箱地址
+
+    Args:
+        count: int, 生成的数量
+        uniqueness: 判重模式 "exact" / "bloom" / "disk"，或自行创建的 UniquenessFilter
+        seed: 可选随机种子，便于复现
+
+    Returns:
+        list[str]: 不重复邮箱地址列表
+    """
+    emails: list[str] = []
+    for chunk in iter_emails(count, chunk_size=count, uniqueness=uniqueness, seed=seed):
+        emails.extend(chunk)
+    return emails
+
+
+def email_space(
+    domains: Sequence[Tuple[str, float]] = EMAIL_DOMAIN_WEIGHTS,
+    templates: Sequence[UsernameTemplate] = DEFAULT_USERNAME_TEMPLATES,
+) -> CombinationSpace:
+    """
+    估计 用户名 × 域名 的组合空间容量。
+
+    Args:
+        domains: (域名, 权重) 序列
+        templates: 用户名模板序列
+
+    Returns:
+        CombinationSpace: total 为组合数上界，effective 为按模板与域名权重折算的等效数量
+    """
+    domain_names, _ = _compile_domains(tuple(domains))
+    merged: dict[str, float] = {}
+    for name, weight in domains:
+        merged[name] = merged.get(name, 0.0) + weight
+
+    sizes = [_template_size(template) for template in templates]
+    weights = np.asarray([template.weight for template in templates], dtype=np.float64)
+    probabilities = weights / weights.sum()
+    # 有效用户名数 = exp(模板熵 + Σ p_t·log(模板空间))
+    usernames = perplexity(weights) * float(np.exp((probabilities * np.log(sizes)).sum()))
+    return CombinationSpace(
+        total=sum(sizes) * len(domain_names),
+        effective=usernames * perplexity(merged.values()),
+    )
+
+
+_TemplateTable = Tuple[Tuple[UsernameTemplate, ...], np.ndarray]
+
+
+@lru_cache(maxsize=32)
+def _compile_domains(domains: Tuple[Tuple[str, float], ...]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    合并重复域名并预先计算累积权重。
+    """
+    merged: dict[str, float] = {}
+    for name, weight in domains:
+        if weight <= 0:
+            raise ValueError("域名权重必须为正数")
+        merged[name.lower()] = merged.get(name.lower(), 0.0) + weight
+    if not merged:
+        raise ValueError("domains 不能为空")
+
+    cumulative = np.cumsum(np.asarray(list(merged.values()), dtype=np.float64))
+    return tuple(merged), cumulative / cumulative[-1]
+
+
+@lru_cache(maxsize=32)
+def _compile_templates(templates: Tuple[UsernameTemplate, ...]) -> _TemplateTable:
+    if not templates:
+        raise ValueError("templates 不能为空")
+    for template in templates:
+        if template.weight <= 0:
+            raise ValueError("模板权重必须为正数")
+        for slot in template.slots:
+            if isinstance(slot, str) and slot not in _USERNAME_POOLS:
+                raise ValueError(f"未知的用户名词表: {slot}")
+            if isinstance(slot, range) and len(slot) == 0:
+                raise ValueError(f"用户名数字区间不能为空: {slot}")
+
+    cumulative = np.cumsum(np.asarray([template.weight for template in templates], dtype=np.float64))
+    return templates, cumulative / cumulative[-1]
+
+
+def _template_size(template: UsernameTemplate) -> int:
+    size = 1
+    for slot in template.slots:
+        size *= len(slot) if isinstance(slot, range) else len(_USERNAME_POOLS[slot])
+    return size
+
+
+def _draw_emails(
+    rng: np.random.Generator,
+    size: int,
+    domain_names: Tuple[str, ...],
+    domain_cumulative: np.ndarray,
+    template_table: _TemplateTable,
+) -> list[str]:
+    templates, template_cumulative = template_table
+    picks = np.minimum(np.searchsorted(template_cumulative, rng.random(size), side="right"), len(templates) - 1)
+    domain_index = np.minimum(np.searchsorted(domain_cumulative, rng.random(size), side="right"), len(domain_names) - 1)
+
+    local_parts: list[str] = [""] * size
+    for template_index, template in enumerate(templates):
+        rows = np.flatnonzero(picks == template_index)
+        if rows.size == 0:
+            continue
+        columns = []
+        for slot in template.slots:
+            if isinstance(slot, range):
+                # 带步长的区间按下标抽取，保证取值落在 range 内且与 _template_size 的计数一致
+                columns.append((slot.start + slot.step * rng.integers(0, len(slot), size=rows.size)).tolist())
+            else:
+                pool = _USERNAME_POOLS[slot]
+                columns.append([pool[i] for i in rng.integers(0, len(pool), size=rows.size).tolist()])
+        pattern = template.pattern
+        for row, values in zip(rows.tolist(), zip(*columns)):
+            local_parts[row] = pattern.format(*values)
+
+    return [f"{local}@{domain_names[index]}" for local, index in zip(local_parts, domain_index.tolist())]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator, Tuple
+
+from faker import Faker
+
+DEFAULT_LOCALE = "zh_CN"
+
+SHARED_STREAM = "shared"
+"""未指定种子时使用的随机流，沿用 Faker 的全局随机源。"""
+
+SEEDED_STREAM = "seeded"
+"""指定种子时使用的随机流，每次借用前都会重新 seed_instance。"""
+
+
+@dataclass
+class FakerRegistryStats:
+    """Faker 实例注册表的命中统计。"""
+
+    hits: int = 0
+    """复用已有实例的次数。"""
+
+    misses: int = 0
+    """新建实例的次数。"""
+
+    build_seconds: float = 0.0
+    """新建实例累计耗时（秒）。"""
+
+    @property
+    def saved_seconds(self) -> float:
+        """按平均构建耗时估算的、因复用而节省的时间（秒）。"""
+        if self.misses == 0:
+            return 0.0
+        return self.hits * self.build_seconds / self.misses
+
+
+@dataclass
+class _RegistryEntry:
+    faker: Faker
+    lock: threading.RLock
+
+
+_entries: Dict[Tuple[str, str], _RegistryEntry] = {}
+_registry_lock = threading.Lock()
+_stats = FakerRegistryStats()
+
+
+def get_faker(locale: str = DEFAULT_LOCALE, *, stream: str = SHARED_STREAM) -> Faker:
+    """
+    获取进程内共享的 Faker 实例，首次使用时才构建。
+
+    参数:
+        locale: Faker 的语言环境，默认 zh_CN。
+    关键字参数:
+        stream: 随机流名称，不同名称对应相互独立的实例。
+
+    返回:
+        以 (locale, stream) 为键缓存的 Faker 实例。
+    """
+    return _get_entry(locale, stream).faker
+
+
+@contextmanager
+def borrow_faker(
+    locale: str = DEFAULT_LOCALE,
+    *,
+    seed: int | None = None,
+    stream: str | None = None,
+) -> Iterator[Faker]:
+    """
+    独占地借用一个共享 Faker 实例，可在多线程（如 ThreadPoolExecutor）中安全使用。
+
+    参数:
+        locale: Faker 的语言环境，默认 zh_CN。
+    关键字参数:
+        seed: 可选随机种子；指定时借用前会对实例执行 seed_instance，保证结果可复现。
+        stream: 随机流名称；默认未指定种子时为 SHARED_STREAM，指定种子时为 SEEDED_STREAM。
+
+    返回:
+        上下文管理器，进入时持有实例锁并返回 Faker 实例。
+    """
+    if stream is None:
+        stream = SHARED_STREAM if seed is None else SEEDED_STREAM
+
+    entry = _get_entry(locale, stream)
+    with entry.lock:
+        if seed is not None:
+            entry.faker.seed_instance(seed)
+        yield entry.faker
+
+
+def faker_registry_stats() -> FakerRegistryStats:
+    """
+    返回注册表命中统计的快照。
+    """
+    with _registry_lock:
+        return replace(_stats)
+
+
+def clear_faker_registry() -> None:
+    """
+    清空已缓存的实例与统计数据。
+    """
+    global _stats
+    with _registry_lock:
+        _entries.clear()
+        _stats = FakerRegistryStats()
+
+
+def _get_entry(locale: str, stream: str) -> _RegistryEntry:
+    key = (locale, stream)
+    entry = _entries.get(key)
+    if entry is not None:
+        with _registry_lock:
+            _stats.hits += 1
+        return entry
+
+    with _registry_lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _stats.hits += 1
+            return entry
+
+        started = time.perf_counter()
+        entry = _RegistryEntry(faker=Faker(locale), lock=threading.RLock())
+        _stats.build_seconds += time.perf_counter() - started
+        _stats.misses += 1
+        _entries[key] = entry
+        return entry
@@ -1,7 +1,184 @@
-from faker import Faker
+from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Sequence, Tuple
 
-def generate_unique_id_numbers(n: int)->list:
+import numpy as np
+
+from DataGenerator.PersonInfo.location import REGION_CODES
+
+
+# GB 11643 前 17 位加权因子，以及 ISO 7064 MOD 11-2 余数到校验码的映射。
+_ID_WEIGHTS = np.array([7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2], dtype=np.int64)
+_ID_CHECK_CODES = np.frombuffer(b"10X98765432", dtype=np.uint8)
+
+
+@dataclass
+class IdNumberBatch:
+    """
+    批量生成的身份证号及其派生列，各数组按行一一对应。
+    """
+
+    numbers: np.ndarray
+    """dtype 为 S18 的身份证号数组。"""
+
+    region_codes: np.ndarray
+    """6 位行政区划代码（int64）。"""
+
+    years: np.ndarray
+    """出生年份。"""
+
+    months: np.ndarray
+    """出生月份。"""
+
+    days: np.ndarray
+    """出生日。"""
+
+    is_male: np.ndarray
+    """性别列，True 表示男性（顺序码末位为奇数）。"""
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def to_strings(self) -> List[str]:
+        """返回身份证号字符串列表。"""
+        return [number.decode("ascii") for number in self.numbers.tolist()]
+
+    def sexes(self) -> List[str]:
+        """返回“男”/“女”性别列表。"""
+        return ["男" if male else "女" for male in self.is_male.tolist()]
+
+
+def generate_id_number_batch(
+    count: int,
+    *,
+    region_codes: Sequence[str] | None = None,
+    birth_start: str = "1950-01-01",
+    birth_end: str = "2005-12-31",
+    male_ratio: float | None = None,
+    seed: int | None = None,
+) -> IdNumberBatch:
+    """
+    按 GB 11643 规则批量生成互不重复的 18 位身份证号。
+
+    号码由 区划代码(6) + 出生日期(8) + 顺序码(3) + MOD 11-2 校验码(1) 组成。
+    所有 (区划, 出生日期, 顺序码) 组合被编码为一个整数空间，直接在其中无放回抽样，
+    因此结果天然不重复，无需重试。
+
+    参数:
+        count: 需要生成的数量。
+    关键字参数:
+        region_codes: 可选的 6 位区划代码集合，默认使用 location.REGION_CODES。
+        birth_start: 出生日期下限（含），格式 YYYY-MM-DD。
+        birth_end: 出生日期上限（含），格式 YYYY-MM-DD。
+        male_ratio: 男性占比；为 None 时顺序码在 000~999 中均匀抽取（男女约各半）。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        IdNumberBatch，包含号码以及出生年/月/日、性别列。
+
+    异常:
+        ValueError: 当参数非法或 count 超出组合空间时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    if male_ratio is not None and not 0.0 <= male_ratio <= 1.0:
+        raise ValueError("male_ratio 必须在 [0.0, 1.0] 之间")
+
+    codes = tuple(region_codes) if region_codes is not None else tuple(row[0] for row in REGION_CODES)
+    if not codes:
+        raise ValueError("region_codes 不能为空")
+    if any(len(code) != 6 or not code.isdigit() for code in codes):
+        raise ValueError("区划代码必须为 6 位数字")
+    regions = np.asarray([int(code) for code in codes], dtype=np.int64)
+
+    start, total_days = _birth_range(birth_start, birth_end)
+
+    rng = np.random.default_rng(seed)
+    if male_ratio is None:
+        keys = _sample_unique_keys(rng, count, len(regions) * total_days * 1000)
+        sequences = keys % 1000
+        keys //= 1000
+    else:
+        male_count = int(round(count * male_ratio))
+        half_space = len(regions) * total_days * 500
+        male_keys = _sample_unique_keys(rng, male_count, half_space)
+        female_keys = _sample_unique_keys(rng, count - male_count, half_space)
+        keys = np.concatenate((male_keys, female_keys))
+        sequences = 2 * (keys % 500) + (np.arange(count) < male_count)
+        keys //= 500
+        order = rng.permutation(count)
+        keys = keys[order]
+        sequences = sequences[order]
+
+    return _assemble_batch(regions, keys // total_days, start, total_days, keys % total_days, sequences)
+
+
+def generate_id_numbers_for_regions(
+    region_codes: Sequence[int | str] | np.ndarray,
+    *,
+    is_male: Sequence[bool] | np.ndarray | None = None,
+    birth_start: str = "1950-01-01",
+    birth_end: str = "2005-12-31",
+    seed: int | None = None,
+) -> IdNumberBatch:
+    """
+    为每行给定的区划代码（及可选的性别）生成互不重复的身份证号。
+
+    用于区划、性别已由上游确定的场景（例如与地址、民族保持一致的人员记录）：
+    每个 (区划, 性别) 分组在 出生日期 × 顺序码 空间内无放回抽样，性别决定顺序码奇偶。
+
+    参数:
+        region_codes: 每行的 6 位区划代码。
+    关键字参数:
+        is_male: 每行的性别，True 为男性；为 None 时顺序码在 000~999 中均匀抽取。
+        birth_start: 出生日期下限（含），格式 YYYY-MM-DD。
+        birth_end: 出生日期上限（含），格式 YYYY-MM-DD。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        与 region_codes 按行对应的 IdNumberBatch。
+
+    异常:
+        ValueError: 当参数非法或某个分组的数量超出组合空间时抛出。
+    """
+    codes = np.asarray(region_codes).astype(np.int64)
+    count = len(codes)
+    if count == 0:
+        raise ValueError("region_codes 不能为空")
+    if ((codes < 100000) | (codes > 999999)).any():
+        raise ValueError("区划代码必须为 6 位数字")
+    if is_male is not None and len(is_male) != count:
+        raise ValueError("is_male 的长度必须与 region_codes 一致")
+
+    start, total_days = _birth_range(birth_start, birth_end)
+    regions, region_index = np.unique(codes, return_inverse=True)
+
+    # 有性别时每个区划分成男、女两组，每组只使用同一奇偶的 500 个顺序码
+    if is_male is None:
+        groups = region_index
+        per_day = 1000
+    else:
+        male = np.asarray(is_male, dtype=bool)
+        groups = region_index * 2 + male
+        per_day = 500
+
+    rng = np.random.default_rng(seed)
+    keys = np.empty(count, dtype=np.int64)
+    order = np.argsort(groups, kind="stable")
+    bounds = np.flatnonzero(np.diff(groups[order])) + 1
+    for rows in np.split(order, bounds):
+        keys[rows] = _sample_unique_keys(rng, rows.size, total_days * per_day)
+
+    if is_male is None:
+        sequences = keys % 1000
+    else:
+        sequences = 2 * (keys % 500) + male
+    return _assemble_batch(regions, region_index, start, total_days, keys // per_day, sequences)
+
+
+def generate_unique_id_numbers(n: int) -> list:
     """
     批量生成不重复的身份证号
     Args:
@@ -9,21 +186,99 @@ def generate_unique_id_numbers(n: int)->list:
     Returns:
         身份证号码集合
     """
-    fake = Faker("zh_CN")
-    id_set = set()
+    return generate_id_number_batch(n).to_strings()
+
+
+def id_check_codes(digits: np.ndarray) -> np.ndarray:
+    """
+    按 GB 11643（ISO 7064 MOD 11-2）批量计算身份证号的校验码。
 
-    while len(id_set) < n:
-        id_num = fake.ssn()
-        id_set.add(id_num)
+    参数:
+        digits: 形状为 (n, 17) 的整数矩阵，每行为身份证号前 17 位数字。
+
+    返回:
+        长度为 n 的 uint8 数组，元素为校验码字符的 ASCII 码（'0'–'9' 或 'X'）。
+    """
+    return _ID_CHECK_CODES[(np.asarray(digits, dtype=np.int64) @ _ID_WEIGHTS) % 11]
+
+
+def _birth_range(birth_start: str, birth_end: str) -> Tuple[np.datetime64, int]:
+    try:
+        start = np.datetime64(birth_start, "D")
+        end = np.datetime64(birth_end, "D")
+    except ValueError as e:
+        raise ValueError("出生日期须为 YYYY-MM-DD 格式") from e
+    if start > end:
+        raise ValueError("birth_start 不能晚于 birth_end")
+    return start, int((end - start).astype(np.int64)) + 1
+
+
+def _assemble_batch(
+    regions: np.ndarray,
+    region_index: np.ndarray,
+    start: np.datetime64,
+    total_days: int,
+    day_index: np.ndarray,
+    sequences: np.ndarray,
+) -> IdNumberBatch:
+    count = len(region_index)
+    birth_dates = start + np.arange(total_days)
 
-    return list(id_set)
+    years = birth_dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    month_starts = birth_dates.astype("datetime64[M]")
+    months = month_starts.astype(np.int64) % 12 + 1
+    days = (birth_dates - month_starts).astype(np.int64) + 1
 
+    # 三段号码各自只有少量取值，先按段制成数字表与加权和，再按索引拼装。
+    region_digits = _digit_table(regions, 6)
+    date_digits = _digit_table(years * 10000 + months * 100 + days, 8)
+    sequence_digits = _digit_table(np.arange(1000, dtype=np.int64), 3)
+    weighted = (
+        (region_digits @ _ID_WEIGHTS[:6])[region_index]
+        + (date_digits @ _ID_WEIGHTS[6:14])[day_index]
+        + (sequence_digits @ _ID_WEIGHTS[14:])[sequences]
+    )
+
+    chars = np.empty((count, 18), dtype=np.uint8)
+    chars[:, :6] = region_digits.astype(np.uint8)[region_index]
+    chars[:, 6:14] = date_digits.astype(np.uint8)[day_index]
+    chars[:, 14:17] = sequence_digits.astype(np.uint8)[sequences]
+    chars[:, :17] += ord("0")
+    chars[:, 17] = _ID_CHECK_CODES[weighted % 11]
+
+    return IdNumberBatch(
+        numbers=chars.view("S18").ravel(),
+        region_codes=regions[region_index],
+        years=years[day_index],
+        months=months[day_index],
+        days=days[day_index],
+        is_male=sequences % 2 == 1,
+    )
+
+
+def _sample_unique_keys(rng: np.random.Generator, count: int, space: int) -> np.ndarray:
+    if count > space:
+        raise ValueError(f"组合空间仅有 {space} 个号码，无法生成 {count} 个不重复身份证号")
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+    return rng.choice(space, size=count, replace=False).astype(np.int64)
+
+
+def _digit_table(values: np.ndarray, width: int) -> np.ndarray:
+    """
+    将整数拆成定宽的十进制数字矩阵，形状为 (len(values), width)。
+    """
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (np.asarray(values, dtype=np.int64)[:, None] // powers) % 10
 
 
 def parse_birth_ymd_from_id(id_number: str, auto_century: bool = True, century_for_15: int = 1900)->tuple[int, int, int]:
     """
     根据中国身份证号解析出生 年、月、日。
 
+    仅解析单个号码且不核对校验码；批量校验（含 MOD 11-2 校验码）请使用
+    validation.validate_id_numbers。
+
     规则:
     - 18位身份证: 第7-14位为出生日期 YYYYMMDD。
     - 15位身份证: 第7-12位为出生日期 YYMMDD；
@@ -59,8 +314,7 @@ def parse_birth_ymd_from_id(id_number: str, auto_century: bool = True, century_f
         birth = s[6:12]
         yy = int(birth[:2])
         if auto_century:
-            from datetime import datetime
-            cur_yy = datetime.now().year % 100
+            cur_yy = date.today().year % 100
             century = 2000 if yy <= cur_yy else 1900
         else:
             if century_for_15 not in (1900, 2000):
@@ -72,7 +326,6 @@ def parse_birth_ymd_from_id(id_number: str, auto_century: bool = True, century_f
         raise ValueError("身份证号长度应为15或18位")
 
     # 校验日期有效性
-    from datetime import date
     try:
         date(int(year), int(month), int(day))
     except Exception as e:
@@ -1,37 +1,112 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from DataGenerator.PersonInfo.bank_card import luhn_check_digits
+
+# 每个 TAC 下的序列号（SNR）空间
+SERIAL_SPACE = 10 ** 6
+
+
+@dataclass(frozen=True)
+class DeviceModel:
+    """终端型号配置：8 位 TAC（型号核准码）及其厂商、型号与抽样权重。"""
+
+    tac: str
+    """8 位 TAC，IMEI 的前 8 位。"""
+
+    manufacturer: str
+    """厂商名称。"""
+
+    model: str
+    """型号名称。"""
+
+    weight: float = 1.0
+    """抽样权重，大致对应该型号的保有量占比。"""
+
+
+DEFAULT_DEVICE_MODELS: tuple[DeviceModel, ...] = (
+    DeviceModel("35325911", "Apple", "iPhone 13", 6.0),
+    DeviceModel("35391911", "Apple", "iPhone 14", 6.0),
+    DeviceModel("35465633", "Apple", "iPhone 15", 5.0),
+    DeviceModel("35674108", "Apple", "iPhone 15 Pro", 4.0),
+    DeviceModel("35307617", "Apple", "iPhone 12", 4.0),
+    DeviceModel("86769305", "Huawei", "Mate 60 Pro", 5.0),
+    DeviceModel("86820506", "Huawei", "P60", 3.0),
+    DeviceModel("86440105", "Huawei", "nova 11", 3.0),
+    DeviceModel("86861206", "Honor", "Magic5", 2.0),
+    DeviceModel("86923305", "Honor", "X50", 3.0),
+    DeviceModel("86880706", "Xiaomi", "Xiaomi 14", 4.0),
+    DeviceModel("86155205", "Xiaomi", "Redmi K60", 4.0),
+    DeviceModel("86207405", "Xiaomi", "Redmi Note 12", 5.0),
+    DeviceModel("86437806", "OPPO", "Reno10", 4.0),
+    DeviceModel("86954305", "OPPO", "Find X6", 2.0),
+    DeviceModel("86318105", "OPPO", "A2", 3.0),
+    DeviceModel("86089606", "vivo", "X100", 3.0),
+    DeviceModel("86751205", "vivo", "S17", 3.0),
+    DeviceModel("86511305", "vivo", "Y36", 3.0),
+    DeviceModel("86412006", "OnePlus", "OnePlus 12", 1.5),
+    DeviceModel("86290805", "realme", "GT Neo5", 1.5),
+    DeviceModel("35176312", "Samsung", "Galaxy S23", 2.0),
+    DeviceModel("35095815", "Samsung", "Galaxy A54", 1.5),
+    DeviceModel("86733405", "Meizu", "Meizu 20", 0.5),
+    DeviceModel("86201106", "ZTE", "Axon 50", 0.5),
+)
+
+
+@dataclass
+class ImeiBatch:
+    """
+    批量生成的 IMEI 及其设备信息列，各数组按行一一对应。
+    """
+
+    imeis: np.ndarray
+    """dtype 为 S15 的 IMEI 数组（TAC + 序列号 + Luhn 校验位）。"""
+
+    manufacturers: np.ndarray
+    """厂商名称。"""
+
+    models: np.ndarray
+    """型号名称。"""
+
+    imeisvs: np.ndarray | None = None
+    """dtype 为 S16 的 IMEISV 数组（TAC + 序列号 + 2 位软件版本号），未请求时为 None。"""
+
+    def __len__(self) -> int:
+        return len(self.imeis)
 
-from faker import Faker
+    def to_strings(self) -> List[str]:
+        """返回 IMEI 字符串列表。"""
+        return [imei.decode("ascii") for imei in self.imeis.tolist()]
 
-DEFAULT_LOCALE = "zh_CN"
+    def imeisv_strings(self) -> List[str]:
+        """返回 IMEISV 字符串列表。"""
+        if self.imeisvs is None:
+            raise ValueError("该批次未生成 IMEISV，请以 imeisv=True 重新生成")
+        return [imeisv.decode("ascii") for imeisv in self.imeisvs.tolist()]
 
 
-def generate_imei(*, locale: str = DEFAULT_LOCALE, seed: int | None = None) -> str:
+def generate_imei(*, seed: int | None = None) -> str:
     """
-    使用 Faker 模块生成单个 IMEI 号码。
+    生成单个 IMEI 号码。
 
     参数:
-        locale: Faker 的语言环境，默认 zh_CN。
         seed: 可选随机种子，用于结果复现。
 
     返回:
-        由 Faker 生成的 15 位 IMEI 字符串。
-
-    异常:
-        Faker 本身会在 locale 或其他参数非法时抛出异常。
+        15 位 IMEI 字符串。
     """
-    fake = Faker(locale)
-    if seed is not None:
-        fake.seed_instance(seed)
-
-    return fake.imei()
+    return generate_imeis(1, seed=seed)[0]
 
 
 def generate_imeis(
     count: int,
     *,
-    locale: str = DEFAULT_LOCALE,
+    unique: bool = False,
     seed: int | None = None,
 ) -> List[str]:
     """
@@ -40,20 +115,135 @@ def generate_imeis(
     参数:
         count: 需要生成的 IMEI 数量，必须为正整数。
     关键字参数:
-        locale: Faker 的语言环境，默认 zh_CN。
+        unique: 是否保证号码互不重复。
         seed: 可选随机种子，用于结果复现。
 
     返回:
         IMEI 字符串列表。
 
     异常:
-        ValueError: 当 count <= 0 时抛出；其他异常由 Faker 抛出。
+        ValueError: 当 count <= 0 时抛出。
+    """
+    return generate_imei_batch(count, unique=unique, seed=seed).to_strings()
+
+
+def generate_imei_batch(
+    count: int,
+    *,
+    models: Sequence[DeviceModel] = DEFAULT_DEVICE_MODELS,
+    unique: bool = False,
+    imeisv: bool = False,
+    seed: int | None = None,
+) -> ImeiBatch:
+    """
+    按 TAC 表批量生成 IMEI，并给出每个号码对应的厂商与型号。
+
+    先按权重抽取型号，再批量填充 6 位序列号，最后以矩阵方式计算 Luhn 校验位。
+
+    参数:
+        count: 需要生成的数量。
+    关键字参数:
+        models: 型号配置表，按 weight 加权抽取 TAC。
+        unique: 为 True 时在各 TAC 的 10^6 序列号空间内无放回抽取，号码互不重复；
+            某个 TAC 的序列号用尽后，超出部分改抽其它型号。
+        imeisv: 为 True 时同时生成同一设备的 IMEISV（序列号后接 2 位软件版本号）。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        ImeiBatch，包含 IMEI、厂商、型号以及可选的 IMEISV 列。
+
+    异常:
+        ValueError: 当参数非法或 unique 模式下数量超出 TAC 容量时抛出。
     """
     if count <= 0:
         raise ValueError("count 必须为正整数")
 
-    fake = Faker(locale)
-    if seed is not None:
-        fake.seed_instance(seed)
-
-    return [fake.imei() for _ in range(count)]
+    tacs, manufacturers, model_names, weights = _compile_models(tuple(models))
+    if unique and count > len(tacs) * SERIAL_SPACE:
+        raise ValueError(f"TAC 容量仅有 {len(tacs) * SERIAL_SPACE} 个，无法生成 {count} 个不重复 IMEI")
+
+    rng = np.random.default_rng(seed)
+    picks = _pick_models(rng, weights, count)
+    if unique:
+        picks, serials = _draw_unique_serials(rng, picks, weights)
+    else:
+        serials = rng.integers(0, SERIAL_SPACE, size=count, dtype=np.int64)
+
+    digits = np.empty((count, 16), dtype=np.uint8)
+    digits[:, :8] = tacs[picks]
+    for position in range(13, 7, -1):
+        digits[:, position] = serials % 10
+        serials //= 10
+    digits[:, 14] = luhn_check_digits(digits[:, :14])
+
+    svn_digits = None
+    if imeisv:
+        # 软件版本号 99 保留不用
+        svn = rng.integers(0, 99, size=count, dtype=np.uint8)
+        svn_digits = np.stack((svn // 10, svn % 10), axis=1)
+
+    digits += ord("0")
+    imeis = np.ascontiguousarray(digits[:, :15]).view("S15").ravel()
+    imeisvs = None
+    if svn_digits is not None:
+        digits[:, 14:] = svn_digits + ord("0")
+        imeisvs = digits.view("S16").ravel()
+
+    return ImeiBatch(
+        imeis=imeis,
+        manufacturers=manufacturers[picks],
+        models=model_names[picks],
+        imeisvs=imeisvs,
+    )
+
+
+def _draw_unique_serials(
+    rng: np.random.Generator,
+    picks: np.ndarray,
+    weights: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    先确定各 TAC 的数量（超出 10^6 的部分按权重改派给仍有余量的 TAC），
+    再对每个 TAC 做一次无放回抽样。
+    """
+    counts = np.bincount(picks, minlength=len(weights))
+    excess = int(np.maximum(counts - SERIAL_SPACE, 0).sum())
+    while excess:
+        np.minimum(counts, SERIAL_SPACE, out=counts)
+        open_weights = np.where(counts < SERIAL_SPACE, weights, 0.0)
+        counts += rng.multinomial(excess, open_weights / open_weights.sum())
+        excess = int(np.maximum(counts - SERIAL_SPACE, 0).sum())
+
+    picks = rng.permutation(np.repeat(np.arange(len(weights)), counts))
+    serials = np.empty(len(picks), dtype=np.int64)
+    for model in np.flatnonzero(counts):
+        serials[picks == model] = rng.choice(SERIAL_SPACE, size=counts[model], replace=False)
+    return picks, serials
+
+
+@lru_cache(maxsize=32)
+def _compile_models(models: Tuple[DeviceModel, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    if not models:
+        raise ValueError("models 不能为空")
+    tacs = []
+    for model in models:
+        if len(model.tac) != 8 or not model.tac.isdigit():
+            raise ValueError("TAC 必须为 8 位数字")
+        if model.weight <= 0:
+            raise ValueError("weight 必须为正数")
+        tacs.append(np.frombuffer(model.tac.encode("ascii"), dtype=np.uint8) - ord("0"))
+    # 同一 TAC 出现两次时各自独立抽取序列号，不重复模式会产生相同的 IMEI
+    if len({model.tac for model in models}) != len(models):
+        raise ValueError("models 中存在重复的 TAC")
+    return (
+        np.stack(tacs),
+        np.asarray([model.manufacturer for model in models]),
+        np.asarray([model.model for model in models]),
+        np.asarray([model.weight for model in models], dtype=np.float64),
+    )
+
+
+def _pick_models(rng: np.random.Generator, weights: np.ndarray, size: int) -> np.ndarray:
+    cumulative = np.cumsum(weights)
+    picks = np.searchsorted(cumulative, rng.random(size) * cumulative[-1], side="right")
+    return np.minimum(picks, len(weights) - 1)
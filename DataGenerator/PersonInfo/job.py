@@ -2,9 +2,7 @@ from __future__ import annotations
 
 from typing import List
 
-from faker import Faker
-
-DEFAULT_LOCALE = "zh_CN"
+from DataGenerator.PersonInfo.faker_registry import DEFAULT_LOCALE, borrow_faker
 
 
 def generate_job_titles(
@@ -31,11 +29,8 @@ def generate_job_titles(
     if count <= 0:
         raise ValueError("count 必须为正整数")
 
-    fake = Faker(locale)
-    if seed is not None:
-        fake.seed_instance(seed)
-
-    return [fake.job() for _ in range(count)]
+    with borrow_faker(locale, seed=seed) as fake:
+        return [fake.job() for _ in range(count)]
 
 
 def generate_employer_names(
@@ -62,8 +57,5 @@ def generate_employer_names(
     if count <= 0:
         raise ValueError("count 必须为正整数")
 
-    fake = Faker(locale)
-    if seed is not None:
-        fake.seed_instance(seed)
-
-    return [fake.company() for _ in range(count)]
+    with borrow_faker(locale, seed=seed) as fake:
+        return [fake.company() for _ in range(count)]
@@ -1,171 +1,188 @@
 from __future__ import annotations
 
-import random
-from typing import List, Sequence
+from functools import lru_cache
+from typing import List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from DataGenerator.Numerical.sampling import AliasTable, build_alias_table, flatten_hierarchy
 
 
 class _ProvinceEntry(dict):
     """Typed helper for static province data."""
 
 
-PROVINCE_DATA: Sequence[_ProvinceEntry] = (
-    {
-        "province": "北京市",
-        "cities": ("北京市",),
-        "districts": ("东城区", "西城区", "朝阳区", "海淀区", "丰台区", "石景山区"),
-    },
-    {
-        "province": "天津市",
-        "cities": ("天津市",),
-        "districts": ("和平区", "河西区", "河北区", "南开区", "滨海新区"),
-    },
-    {
-        "province": "上海市",
-        "cities": ("上海市",),
-        "districts": ("黄浦区", "徐汇区", "长宁区", "静安区", "浦东新区"),
-    },
-    {
-        "province": "重庆市",
-        "cities": ("重庆市",),
-        "districts": ("渝中区", "江北区", "沙坪坝区", "九龙坡区", "南岸区"),
-    },
-    {
-        "province": "广东省",
-        "cities": ("广州市", "深圳市", "佛山市", "东莞市", "珠海市"),
-        "districts": ("天河区", "福田区", "南海区", "莞城区", "香洲区"),
-    },
-    {
-        "province": "浙江省",
-        "cities": ("杭州市", "宁波市", "温州市", "绍兴市"),
-        "districts": ("西湖区", "余杭区", "鄞州区", "鹿城区", "越城区"),
-    },
-    {
-        "province": "江苏省",
-        "cities": ("南京市", "苏州市", "无锡市", "常州市"),
-        "districts": ("玄武区", "鼓楼区", "吴中区", "滨湖区", "天宁区"),
-    },
-    {
-        "province": "四川省",
-        "cities": ("成都市", "绵阳市", "德阳市", "乐山市"),
-        "districts": ("锦江区", "青羊区", "涪城区", "广汉市", "市中区"),
-    },
-    {
-        "province": "湖北省",
-        "cities": ("武汉市", "宜昌市", "襄阳市"),
-        "districts": ("江汉区", "洪山区", "宜都市", "樊城区", "东津新区"),
-    },
-    {
-        "province": "陕西省",
-        "cities": ("西安市", "咸阳市", "宝鸡市"),
-        "districts": ("雁塔区", "碑林区", "秦都区", "金台区"),
-    },
-    {
-        "province": "山东省",
-        "cities": ("济南市", "青岛市", "烟台市"),
-        "districts": ("历下区", "市南区", "芝罘区", "崂山区"),
-    },
-    {
-        "province": "湖南省",
-        "cities": ("长沙市", "株洲市", "岳阳市"),
-        "districts": ("岳麓区", "雨花区", "天元区", "岳阳楼区"),
-    },
-    {
-        "province": "河北省",
-        "cities": ("石家庄市", "唐山市", "保定市"),
-        "districts": ("长安区", "路北区", "竞秀区", "桥西区"),
-    },
-    {
-        "province": "福建省",
-        "cities": ("福州市", "厦门市", "泉州市"),
-        "districts": ("鼓楼区", "仓山区", "思明区", "丰泽区"),
-    },
-    {
-        "province": "海南省",
-        "cities": ("海口市", "三亚市"),
-        "districts": ("龙华区", "美兰区", "吉阳区", "天涯区"),
-    },
-    {
-        "province": "广西壮族自治区",
-        "cities": ("南宁市", "桂林市", "柳州市"),
-        "districts": ("青秀区", "西乡塘区", "象山区", "柳北区"),
-    },
-    {
-        "province": "内蒙古自治区",
-        "cities": ("呼和浩特市", "包头市", "鄂尔多斯市"),
-        "districts": ("新城区", "玉泉区", "昆都仑区", "东胜区"),
-    },
-    {
-        "province": "宁夏回族自治区",
-        "cities": ("银川市", "石嘴山市"),
-        "districts": ("兴庆区", "金凤区", "大武口区"),
-    },
-    {
-        "province": "新疆维吾尔自治区",
-        "cities": ("乌鲁木齐市", "喀什地区", "昌吉市"),
-        "districts": ("天山区", "沙依巴克区", "乌鲁木齐县", "喀什市"),
-    },
-    {
-        "province": "西藏自治区",
-        "cities": ("拉萨市", "日喀则市"),
-        "districts": ("城关区", "堆龙德庆区", "桑珠孜区"),
-    },
-    {
-        "province": "香港特别行政区",
-        "cities": ("香港特别行政区",),
-        "districts": ("中西区", "湾仔区", "深水埗区", "油尖旺区"),
-    },
-    {
-        "province": "澳门特别行政区",
-        "cities": ("澳门特别行政区",),
-        "districts": ("花地玛堂区", "花王堂区", "望德堂区", "圣方济各堂区"),
-    },
-    {
-        "province": "甘肃省",
-        "cities": ("兰州市", "天水市"),
-        "districts": ("城关区", "七里河区", "秦州区"),
-    },
-    {
-        "province": "青海省",
-        "cities": ("西宁市", "海东市"),
-        "districts": ("城东区", "城中区", "乐都区"),
-    },
+# 各区县的行政区划代码（GB/T 2260），即身份证号前 6 位，是省市区县名称的唯一数据源。
+# 每项为 (区划代码, 省级名称, 地级名称, 区县名称)。
+REGION_CODES: Sequence[Tuple[str, str, str, str]] = (
+    ("110101", "北京市", "北京市", "东城区"),
+    ("110102", "北京市", "北京市", "西城区"),
+    ("110105", "北京市", "北京市", "朝阳区"),
+    ("110108", "北京市", "北京市", "海淀区"),
+    ("110106", "北京市", "北京市", "丰台区"),
+    ("110107", "北京市", "北京市", "石景山区"),
+    ("120101", "天津市", "天津市", "和平区"),
+    ("120103", "天津市", "天津市", "河西区"),
+    ("120105", "天津市", "天津市", "河北区"),
+    ("120104", "天津市", "天津市", "南开区"),
+    ("120116", "天津市", "天津市", "滨海新区"),
+    ("310101", "上海市", "上海市", "黄浦区"),
+    ("310104", "上海市", "上海市", "徐汇区"),
+    ("310105", "上海市", "上海市", "长宁区"),
+    ("310106", "上海市", "上海市", "静安区"),
+    ("310115", "上海市", "上海市", "浦东新区"),
+    ("500103", "重庆市", "重庆市", "渝中区"),
+    ("500105", "重庆市", "重庆市", "江北区"),
+    ("500106", "重庆市", "重庆市", "沙坪坝区"),
+    ("500107", "重庆市", "重庆市", "九龙坡区"),
+    ("500108", "重庆市", "重庆市", "南岸区"),
+    ("440106", "广东省", "广州市", "天河区"),
+    ("440304", "广东省", "深圳市", "福田区"),
+    ("440605", "广东省", "佛山市", "南海区"),
+    # 东莞市不设区县，身份证直接使用地级代码 441900，区县列按市级记为“东莞市”
+    ("441900", "广东省", "东莞市", "东莞市"),
+    ("440402", "广东省", "珠海市", "香洲区"),
+    ("330106", "浙江省", "杭州市", "西湖区"),
+    ("330110", "浙江省", "杭州市", "余杭区"),
+    ("330212", "浙江省", "宁波市", "鄞州区"),
+    ("330302", "浙江省", "温州市", "鹿城区"),
+    ("330602", "浙江省", "绍兴市", "越城区"),
+    ("320102", "江苏省", "南京市", "玄武区"),
+    ("320106", "江苏省", "南京市", "鼓楼区"),
+    ("320506", "江苏省", "苏州市", "吴中区"),
+    ("320211", "江苏省", "无锡市", "滨湖区"),
+    ("320402", "江苏省", "常州市", "天宁区"),
+    ("510104", "四川省", "成都市", "锦江区"),
+    ("510105", "四川省", "成都市", "青羊区"),
+    ("510703", "四川省", "绵阳市", "涪城区"),
+    ("510681", "四川省", "德阳市", "广汉市"),
+    ("511102", "四川省", "乐山市", "市中区"),
+    ("420103", "湖北省", "武汉市", "江汉区"),
+    ("420111", "湖北省", "武汉市", "洪山区"),
+    ("420581", "湖北省", "宜昌市", "宜都市"),
+    ("420606", "湖北省", "襄阳市", "樊城区"),
+    ("420607", "湖北省", "襄阳市", "襄州区"),
+    ("610113", "陕西省", "西安市", "雁塔区"),
+    ("610103", "陕西省", "西安市", "碑林区"),
+    ("610402", "陕西省", "咸阳市", "秦都区"),
+    ("610303", "陕西省", "宝鸡市", "金台区"),
+    ("370102", "山东省", "济南市", "历下区"),
+    ("370202", "山东省", "青岛市", "市南区"),
+    ("370602", "山东省", "烟台市", "芝罘区"),
+    ("370212", "山东省", "青岛市", "崂山区"),
+    ("430104", "湖南省", "长沙市", "岳麓区"),
+    ("430111", "湖南省", "长沙市", "雨花区"),
+    ("430211", "湖南省", "株洲市", "天元区"),
+    ("430602", "湖南省", "岳阳市", "岳阳楼区"),
+    ("130102", "河北省", "石家庄市", "长安区"),
+    ("130203", "河北省", "唐山市", "路北区"),
+    ("130602", "河北省", "保定市", "竞秀区"),
+    ("130104", "河北省", "石家庄市", "桥西区"),
+    ("350102", "福建省", "福州市", "鼓楼区"),
+    ("350104", "福建省", "福州市", "仓山区"),
+    ("350203", "福建省", "厦门市", "思明区"),
+    ("350503", "福建省", "泉州市", "丰泽区"),
+    ("460106", "海南省", "海口市", "龙华区"),
+    ("460108", "海南省", "海口市", "美兰区"),
+    ("460203", "海南省", "三亚市", "吉阳区"),
+    ("460204", "海南省", "三亚市", "天涯区"),
+    ("450103", "广西壮族自治区", "南宁市", "青秀区"),
+    ("450107", "广西壮族自治区", "南宁市", "西乡塘区"),
+    ("450304", "广西壮族自治区", "桂林市", "象山区"),
+    ("450205", "广西壮族自治区", "柳州市", "柳北区"),
+    ("150102", "内蒙古自治区", "呼和浩特市", "新城区"),
+    ("150104", "内蒙古自治区", "呼和浩特市", "玉泉区"),
+    ("150203", "内蒙古自治区", "包头市", "昆都仑区"),
+    ("150602", "内蒙古自治区", "鄂尔多斯市", "东胜区"),
+    ("640104", "宁夏回族自治区", "银川市", "兴庆区"),
+    ("640106", "宁夏回族自治区", "银川市", "金凤区"),
+    ("640202", "宁夏回族自治区", "石嘴山市", "大武口区"),
+    ("650102", "新疆维吾尔自治区", "乌鲁木齐市", "天山区"),
+    ("650103", "新疆维吾尔自治区", "乌鲁木齐市", "沙依巴克区"),
+    ("650121", "新疆维吾尔自治区", "乌鲁木齐市", "乌鲁木齐县"),
+    ("653101", "新疆维吾尔自治区", "喀什地区", "喀什市"),
+    ("540102", "西藏自治区", "拉萨市", "城关区"),
+    ("540103", "西藏自治区", "拉萨市", "堆龙德庆区"),
+    ("540202", "西藏自治区", "日喀则市", "桑珠孜区"),
+    ("810001", "香港特别行政区", "香港特别行政区", "中西区"),
+    ("810002", "香港特别行政区", "香港特别行政区", "湾仔区"),
+    ("810006", "香港特别行政区", "香港特别行政区", "深水埗区"),
+    ("810005", "香港特别行政区", "香港特别行政区", "油尖旺区"),
+    ("820001", "澳门特别行政区", "澳门特别行政区", "花地玛堂区"),
+    ("820002", "澳门特别行政区", "澳门特别行政区", "花王堂区"),
+    ("820003", "澳门特别行政区", "澳门特别行政区", "望德堂区"),
+    ("820008", "澳门特别行政区", "澳门特别行政区", "圣方济各堂区"),
+    ("620102", "甘肃省", "兰州市", "城关区"),
+    ("620103", "甘肃省", "兰州市", "七里河区"),
+    ("620502", "甘肃省", "天水市", "秦州区"),
+    ("630102", "青海省", "西宁市", "城东区"),
+    ("630103", "青海省", "西宁市", "城中区"),
+    ("630202", "青海省", "海东市", "乐都区"),
 )
 
 
-def generate_location(*, seed: int | None = None) -> str:
+def _province_data(rows: Sequence[Tuple[str, str, str, str]]) -> Tuple[_ProvinceEntry, ...]:
+    """按省汇总 REGION_CODES 中出现的地级与区县名称，保持首次出现的顺序。"""
+    entries: dict[str, _ProvinceEntry] = {}
+    for _, province, city, district in rows:
+        entry = entries.setdefault(province, _ProvinceEntry(province=province, cities=(), districts=()))
+        if city not in entry["cities"]:
+            entry["cities"] += (city,)
+        if district not in entry["districts"]:
+            entry["districts"] += (district,)
+    return tuple(entries.values())
+
+
+# 按省汇总的地级与区县名称，由 REGION_CODES 派生，二者始终一致。
+PROVINCE_DATA: Sequence[_ProvinceEntry] = _province_data(REGION_CODES)
+
+
+# 各省级行政区常住人口（万人，第七次全国人口普查），可作为 generate_locations 的 province_weights。
+PROVINCE_POPULATION_WEIGHTS: Mapping[str, float] = {
+    "北京市": 2189, "天津市": 1387, "上海市": 2487, "重庆市": 3205, "广东省": 12601,
+    "浙江省": 6457, "江苏省": 8475, "四川省": 8367, "湖北省": 5775, "陕西省": 3953,
+    "山东省": 10153, "湖南省": 6644, "河北省": 7461, "福建省": 4154, "海南省": 1008,
+    "广西壮族自治区": 5013, "内蒙古自治区": 2405, "宁夏回族自治区": 720,
+    "新疆维吾尔自治区": 2585, "西藏自治区": 365, "香港特别行政区": 747,
+    "澳门特别行政区": 68, "甘肃省": 2502, "青海省": 592,
+}
+
+
+def generate_location(
+    *,
+    province_weights: Mapping[str, float] | None = None,
+    seed: int | None = None,
+) -> str:
     """
     生成一个概略地址（省/直辖市/自治区 + 地级市/地区 + 区县）。
 
     参数:
+        province_weights: 可选的省级权重，例如 PROVINCE_POPULATION_WEIGHTS。
         seed: 可选随机种子，便于复现。
 
     返回:
         形如“广东省 广州市 天河区”的字符串。
     """
-    if not PROVINCE_DATA:
-        raise ValueError("未配置可用的省份数据")
-
-    rng = random.Random(seed)
-    entry = rng.choice(PROVINCE_DATA)
-
-    province = entry["province"]
-    city = rng.choice(entry["cities"])
-    district = rng.choice(entry["districts"])
-
-    return f"{province} {city} {district}"
+    return generate_locations(1, province_weights=province_weights, seed=seed)[0]
 
 
 def generate_locations(
     count: int,
     *,
+    province_weights: Mapping[str, float] | None = None,
     seed: int | None = None,
 ) -> List[str]:
     """
     批量生成概略地址。
 
+    省 → 市 → 区县 层级表预先展平为区县级别名表，每个地址只需一次 O(1) 抽样，
+    且市与区县始终对应。
+
     参数:
         count: 所需地址数量，必须为正整数。
     关键字参数:
+        province_weights: 可选的省级权重，例如 PROVINCE_POPULATION_WEIGHTS；
+            默认各省等概率，省内各市、市内各区县等概率。
         seed: 可选随机种子，便于复现。
 
     返回:
@@ -174,8 +191,40 @@ def generate_locations(
     if count <= 0:
         raise ValueError("count 必须为正整数")
 
-    rng = random.Random(seed)
-    return [
-        generate_location(seed=rng.randint(0, 1_000_000_000))
-        for _ in range(count)
-    ]
+    rows = sample_region_rows(np.random.default_rng(seed), count, province_weights=province_weights)
+    return _region_labels()[rows].tolist()
+
+
+def sample_region_rows(
+    rng: np.random.Generator,
+    count: int,
+    *,
+    province_weights: Mapping[str, float] | None = None,
+) -> np.ndarray:
+    """
+    按层级权重批量抽取 REGION_CODES 中的区县行。
+
+    参数:
+        rng: NumPy 随机数生成器。
+        count: 抽取数量。
+    关键字参数:
+        province_weights: 可选的省级权重，例如 PROVINCE_POPULATION_WEIGHTS。
+
+    返回:
+        REGION_CODES 的行索引数组。
+    """
+    weights_key = None if province_weights is None else tuple(sorted(province_weights.items()))
+    return _region_alias_table(weights_key).sample(rng, count)
+
+
+@lru_cache(maxsize=16)
+def _region_alias_table(weights_key: Tuple[Tuple[str, float], ...] | None) -> AliasTable:
+    if not REGION_CODES:
+        raise ValueError("未配置可用的省份数据")
+    paths = [row[1:] for row in REGION_CODES]
+    return build_alias_table(flatten_hierarchy(paths, top_weights=None if weights_key is None else dict(weights_key)))
+
+
+@lru_cache(maxsize=1)
+def _region_labels() -> np.ndarray:
+    return np.asarray([" ".join(row[1:]) for row in REGION_CODES])
@@ -1,25 +1,205 @@
-import random
+from __future__ import annotations
 
-def generate_mobile_phone(n: int) -> list[str]:
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Sequence, Tuple
+
+import numpy as np
+
+from DataGenerator.Numerical.unique import feistel_permutation
+
+# 每个号段下的用户号码空间（后 8 位）
+SUBSCRIBER_SPACE = 10 ** 8
+
+
+@dataclass(frozen=True)
+class CarrierSegment:
+    """手机号段配置。"""
+
+    prefix: str
+    """3 位号段，例如 "139"。"""
+
+    carrier: str
+    """所属运营商。"""
+
+    weight: float = 1.0
+    """抽样权重，大致对应该号段的存量用户占比。"""
+
+
+CARRIER_SEGMENTS: tuple[CarrierSegment, ...] = (
+    CarrierSegment("134", "中国移动", 3.0), CarrierSegment("135", "中国移动", 4.0),
+    CarrierSegment("136", "中国移动", 4.0), CarrierSegment("137", "中国移动", 4.0),
+    CarrierSegment("138", "中国移动", 4.5), CarrierSegment("139", "中国移动", 4.5),
+    CarrierSegment("147", "中国移动", 1.0), CarrierSegment("150", "中国移动", 3.0),
+    CarrierSegment("151", "中国移动", 3.0), CarrierSegment("152", "中国移动", 2.5),
+    CarrierSegment("157", "中国移动", 1.5), CarrierSegment("158", "中国移动", 3.0),
+    CarrierSegment("159", "中国移动", 3.0), CarrierSegment("172", "中国移动", 0.5),
+    CarrierSegment("178", "中国移动", 1.5), CarrierSegment("182", "中国移动", 2.5),
+    CarrierSegment("183", "中国移动", 2.0), CarrierSegment("184", "中国移动", 1.0),
+    CarrierSegment("187", "中国移动", 2.5), CarrierSegment("188", "中国移动", 2.5),
+    CarrierSegment("195", "中国移动", 0.5), CarrierSegment("197", "中国移动", 0.3),
+    CarrierSegment("198", "中国移动", 1.0),
+    CarrierSegment("130", "中国联通", 2.5), CarrierSegment("131", "中国联通", 2.5),
+    CarrierSegment("132", "中国联通", 2.5), CarrierSegment("145", "中国联通", 0.5),
+    CarrierSegment("155", "中国联通", 2.0), CarrierSegment("156", "中国联通", 2.0),
+    CarrierSegment("166", "中国联通", 1.0), CarrierSegment("175", "中国联通", 0.8),
+    CarrierSegment("176", "中国联通", 1.5), CarrierSegment("185", "中国联通", 2.0),
+    CarrierSegment("186", "中国联通", 2.5), CarrierSegment("196", "中国联通", 0.3),
+    CarrierSegment("133", "中国电信", 2.0), CarrierSegment("149", "中国电信", 0.5),
+    CarrierSegment("153", "中国电信", 2.0), CarrierSegment("173", "中国电信", 1.0),
+    CarrierSegment("177", "中国电信", 1.5), CarrierSegment("180", "中国电信", 2.0),
+    CarrierSegment("181", "中国电信", 2.0), CarrierSegment("189", "中国电信", 2.5),
+    CarrierSegment("190", "中国电信", 0.3), CarrierSegment("191", "中国电信", 0.8),
+    CarrierSegment("193", "中国电信", 0.5), CarrierSegment("199", "中国电信", 1.0),
+    CarrierSegment("192", "中国广电", 0.3),
+    CarrierSegment("170", "虚拟运营商", 0.5), CarrierSegment("171", "虚拟运营商", 0.3),
+    CarrierSegment("162", "虚拟运营商", 0.1), CarrierSegment("165", "虚拟运营商", 0.1),
+    CarrierSegment("167", "虚拟运营商", 0.1),
+)
+
+
+def generate_mobile_phone(n: int, *, unique: bool = False, seed: int | None = None) -> list[str]:
     """
     批量生成中国随机手机号
 
     Args:
         n (int): 要生成的手机号数量
+        unique (bool): 是否保证号码互不重复
+        seed (int | None): 可选随机种子，便于复现
 
     Returns:
         list[str]: 手机号列表
     """
-    prefixes = [
-        '130', '131', '132', '133', '134', '135', '136', '137', '138', '139',
-        '145', '147', '149',
-        '150', '151', '152', '153', '155', '156', '157', '158', '159',
-        '170', '171', '173', '175', '176', '177', '178',
-        '180', '181', '182', '183', '184', '185', '186', '187', '188', '189',
-        '191', '193', '195', '196', '197', '198', '199'
-    ]
-    return [
-        random.choice(prefixes) + ''.join(random.choices('0123456789', k=8))
-        for _ in range(n)
-    ]
+    return format_mobile_phones(generate_mobile_phone_array(n, unique=unique, seed=seed))
+
+
+def generate_mobile_phone_array(
+    count: int,
+    *,
+    segments: Sequence[CarrierSegment] = CARRIER_SEGMENTS,
+    unique: bool = False,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    批量生成手机号，结果为 int64 数组（11 位整数），仅在写出时再格式化。
+
+    参数:
+        count: 需要生成的数量。
+    关键字参数:
+        segments: 号段配置表，按 weight 加权抽取号段。
+        unique: 为 True 时在各号段的 10^8 用户号码空间内无放回抽取，号码互不重复。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        int64 手机号数组。
+
+    异常:
+        ValueError: 当参数非法或 unique 模式下数量超出号段容量时抛出。
+    """
+    return np.concatenate(list(iter_mobile_phone_chunks(count, segments=segments, chunk_size=count, unique=unique, seed=seed)))
+
+
+def iter_mobile_phone_chunks(
+    count: int,
+    *,
+    segments: Sequence[CarrierSegment] = CARRIER_SEGMENTS,
+    chunk_size: int = 1_000_000,
+    unique: bool = False,
+    seed: int | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    分块流式生成手机号，内存占用只与 chunk_size 有关。
+
+    unique 模式下每个号段使用一个带密钥的 10^8 置换（Feistel 网络），第 k 次从该号段取号
+    即取置换后的第 k 个值，因此无需记录已生成号码也能保证不重复。
+
+    参数:
+        count: 需要生成的总数量。
+    关键字参数:
+        segments: 号段配置表。
+        chunk_size: 每块的号码数量。
+        unique: 是否保证号码互不重复。
+        seed: 可选随机种子；相同的 seed 与 chunk_size 产出相同序列。
+
+    返回:
+        逐块产出 int64 手机号数组的迭代器。
+
+    异常:
+        ValueError: 当参数非法或 unique 模式下数量超出号段容量时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须为正整数")
+
+    prefixes, weights = _compile_segments(tuple(segments))
+    if unique and count > len(prefixes) * SUBSCRIBER_SPACE:
+        raise ValueError(f"号段容量仅有 {len(prefixes) * SUBSCRIBER_SPACE} 个，无法生成 {count} 个不重复手机号")
+
+    rng = np.random.default_rng(seed)
+    permutations = [feistel_permutation(SUBSCRIBER_SPACE, seed=rng) for _ in range(len(prefixes))] if unique else []
+    used = np.zeros(len(prefixes), dtype=np.int64)
+    weights = weights.copy()
+
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        remaining -= size
+        picks = _pick_segments(rng, weights, size)
+        if not unique:
+            subscribers = rng.integers(0, SUBSCRIBER_SPACE, size=size, dtype=np.int64)
+            yield prefixes[picks] * SUBSCRIBER_SPACE + subscribers
+            continue
+
+        numbers = np.empty(size, dtype=np.int64)
+        pending = np.arange(size)
+        while pending.size:
+            overflow = []
+            for segment in np.unique(picks):
+                rows = pending[picks == segment]
+                free = SUBSCRIBER_SPACE - used[segment]
+                taken = rows[:free]
+                ranks = used[segment] + np.arange(taken.size, dtype=np.int64)
+                numbers[taken] = prefixes[segment] * SUBSCRIBER_SPACE + permutations[segment].apply(ranks).astype(np.int64)
+                used[segment] += taken.size
+                if rows.size > free:
+                    # 号段已用尽：不再抽取该号段，超出部分改抽其它号段
+                    weights[segment] = 0.0
+                    overflow.append(rows[free:])
+            pending = np.concatenate(overflow) if overflow else np.empty(0, dtype=np.intp)
+            if pending.size:
+                picks = _pick_segments(rng, weights, pending.size)
+        yield numbers
+
+
+def format_mobile_phones(numbers: np.ndarray) -> list[str]:
+    """
+    将 int64 手机号数组格式化为字符串列表。
+    """
+    return np.asarray(numbers, dtype=np.int64).astype("U11").tolist()
+
+
+@lru_cache(maxsize=32)
+def _compile_segments(segments: Tuple[CarrierSegment, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    if not segments:
+        raise ValueError("segments 不能为空")
+    prefixes = []
+    weights = []
+    for segment in segments:
+        if len(segment.prefix) != 3 or not segment.prefix.isdigit() or segment.prefix[0] != "1":
+            raise ValueError("号段须为以 1 开头的 3 位数字")
+        if segment.weight <= 0:
+            raise ValueError("号段权重必须为正数")
+        prefixes.append(int(segment.prefix))
+        weights.append(segment.weight)
+    # 每个号段各用一个置换保证不重复，同一号段出现两次会产生相同的号码
+    if len(set(prefixes)) != len(prefixes):
+        raise ValueError("segments 中存在重复的号段")
+    return np.asarray(prefixes, dtype=np.int64), np.asarray(weights, dtype=np.float64)
+
+
+def _pick_segments(rng: np.random.Generator, weights: np.ndarray, size: int) -> np.ndarray:
+    cumulative = np.cumsum(weights)
+    picks = np.searchsorted(cumulative, rng.random(size) * cumulative[-1], side="right")
+    return np.minimum(picks, len(weights) - 1)
 
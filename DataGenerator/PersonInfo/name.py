@@ -1,46 +1,291 @@
-from faker import Faker
-from faker.exceptions import UniquenessException
-import random
-from faker import Faker
+from __future__ import annotations
 
-def generate_unique_names(n: int) -> list[str]:
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, List
+
+import numpy as np
+
+from DataGenerator.PersonInfo.uniqueness import (
+    CombinationSpace,
+    UniquenessFilter,
+    make_uniqueness_filter,
+    perplexity,
+)
+
+# 常见姓氏及其人口占比（%），含复姓
+SURNAME_WEIGHTS: tuple[tuple[str, float], ...] = (
+    ("王", 7.17), ("李", 7.0), ("张", 6.74), ("刘", 5.1), ("陈", 4.61), ("杨", 3.22), ("黄", 2.45),
+    ("吴", 2.0), ("赵", 2.0), ("周", 1.9), ("徐", 1.45), ("孙", 1.38), ("马", 1.29), ("朱", 1.28),
+    ("胡", 1.16), ("林", 1.13), ("郭", 1.13), ("何", 1.06), ("高", 1.0), ("罗", 0.95), ("郑", 0.93),
+    ("梁", 0.85), ("谢", 0.76), ("宋", 0.7), ("唐", 0.69), ("许", 0.66), ("邓", 0.62), ("冯", 0.62),
+    ("韩", 0.61), ("曹", 0.6), ("曾", 0.58), ("彭", 0.58), ("萧", 0.56), ("蔡", 0.53), ("潘", 0.52),
+    ("田", 0.52), ("董", 0.51), ("袁", 0.5), ("于", 0.49), ("余", 0.48), ("叶", 0.48), ("蒋", 0.48),
+    ("杜", 0.47), ("苏", 0.46), ("魏", 0.45), ("程", 0.45), ("吕", 0.45), ("丁", 0.43), ("沈", 0.41),
+    ("任", 0.41), ("姚", 0.4), ("卢", 0.4), ("傅", 0.4), ("钟", 0.4), ("姜", 0.39), ("崔", 0.38),
+    ("谭", 0.38), ("廖", 0.37), ("范", 0.36), ("汪", 0.36), ("陆", 0.36), ("金", 0.35), ("石", 0.34),
+    ("戴", 0.34), ("贾", 0.33), ("韦", 0.32), ("夏", 0.32), ("邱", 0.32), ("方", 0.31), ("侯", 0.3),
+    ("邹", 0.3), ("熊", 0.29), ("孟", 0.29), ("秦", 0.29), ("白", 0.28), ("江", 0.28), ("阎", 0.27),
+    ("薛", 0.26), ("尹", 0.26), ("段", 0.24), ("雷", 0.24), ("黎", 0.22), ("史", 0.21), ("龙", 0.21),
+    ("陶", 0.21), ("贺", 0.21), ("顾", 0.2), ("毛", 0.2), ("郝", 0.2), ("龚", 0.2), ("邵", 0.2),
+    ("万", 0.19), ("钱", 0.19), ("严", 0.19), ("赖", 0.18), ("覃", 0.18), ("洪", 0.18), ("武", 0.18),
+    ("莫", 0.18), ("孔", 0.17), ("汤", 0.17), ("向", 0.17), ("常", 0.16), ("温", 0.16), ("康", 0.16),
+    ("施", 0.15), ("文", 0.15), ("牛", 0.15), ("樊", 0.15), ("葛", 0.15), ("邢", 0.14), ("安", 0.13),
+    ("齐", 0.13), ("易", 0.13), ("乔", 0.13), ("伍", 0.13), ("庞", 0.13), ("颜", 0.12), ("倪", 0.12),
+    ("庄", 0.12), ("聂", 0.12), ("章", 0.12), ("鲁", 0.11), ("岳", 0.11), ("翟", 0.11), ("殷", 0.11),
+    ("詹", 0.11), ("申", 0.11), ("欧", 0.11), ("耿", 0.11), ("关", 0.1), ("兰", 0.1), ("焦", 0.1),
+    ("俞", 0.1), ("左", 0.1), ("柳", 0.1), ("甘", 0.095), ("祝", 0.09), ("包", 0.087), ("宁", 0.083),
+    ("尚", 0.082), ("符", 0.082), ("舒", 0.082), ("阮", 0.082), ("柯", 0.08), ("纪", 0.08),
+    ("梅", 0.079), ("童", 0.079), ("凌", 0.078), ("毕", 0.078), ("单", 0.076), ("季", 0.076),
+    ("裴", 0.076), ("霍", 0.075), ("涂", 0.075), ("成", 0.075), ("苗", 0.075), ("谷", 0.075),
+    ("盛", 0.074), ("曲", 0.074), ("翁", 0.073), ("冉", 0.073), ("骆", 0.073), ("蓝", 0.072),
+    ("路", 0.072), ("游", 0.071), ("辛", 0.07), ("靳", 0.069), ("欧阳", 0.068), ("管", 0.065),
+    ("柴", 0.065), ("蒙", 0.062), ("鲍", 0.062), ("华", 0.061), ("喻", 0.061), ("祁", 0.061),
+    ("蒲", 0.056), ("房", 0.056), ("滕", 0.055), ("屈", 0.055), ("饶", 0.055), ("解", 0.053),
+    ("牟", 0.053), ("艾", 0.052), ("尤", 0.052), ("阳", 0.05), ("时", 0.05), ("穆", 0.048),
+    ("农", 0.047), ("司", 0.044), ("卓", 0.043), ("古", 0.043), ("吉", 0.043), ("缪", 0.043),
+    ("简", 0.043), ("车", 0.043), ("项", 0.043), ("连", 0.043), ("芦", 0.042), ("麦", 0.041),
+    ("褚", 0.041), ("娄", 0.04), ("窦", 0.04), ("戚", 0.04), ("岑", 0.039), ("景", 0.039),
+    ("党", 0.039), ("宫", 0.039), ("费", 0.039), ("卜", 0.038), ("冷", 0.038), ("晏", 0.038),
+    ("席", 0.036), ("卫", 0.036), ("米", 0.035), ("柏", 0.035), ("宗", 0.034), ("瞿", 0.033),
+    ("桂", 0.033), ("全", 0.033), ("佟", 0.033), ("应", 0.033), ("臧", 0.032), ("闵", 0.032),
+    ("苟", 0.032), ("邬", 0.032), ("边", 0.032), ("卞", 0.032), ("姬", 0.032), ("师", 0.031),
+    ("和", 0.031), ("仇", 0.03), ("栾", 0.03), ("隋", 0.03), ("商", 0.03), ("刁", 0.03), ("沙", 0.03),
+    ("荣", 0.029), ("巫", 0.029), ("寇", 0.029),
+    ("司马", 0.012), ("上官", 0.011), ("诸葛", 0.008), ("司徒", 0.006), ("东方", 0.005),
+    ("皇甫", 0.005), ("尉迟", 0.003), ("公孙", 0.003), ("慕容", 0.003), ("令狐", 0.003),
+    ("夏侯", 0.003), ("端木", 0.002), ("长孙", 0.002), ("宇文", 0.002), ("南宫", 0.002),
+    ("轩辕", 0.001), ("独孤", 0.001),
+)
+
+# 名字用字及其相对使用频率（常见 + 部分生僻）
+GIVEN_NAME_CHAR_WEIGHTS: tuple[tuple[str, float], ...] = (
+    ("伟", 8), ("芳", 6), ("娜", 5), ("敏", 6), ("静", 6), ("丽", 8), ("强", 5), ("磊", 5),
+    ("军", 5), ("洋", 4), ("勇", 4), ("艳", 4), ("杰", 6), ("娟", 4), ("涛", 4), ("明", 6),
+    ("超", 4), ("秀", 5), ("霞", 4), ("平", 4), ("刚", 4), ("桂", 3), ("英", 5), ("华", 6),
+    ("玉", 5), ("兰", 4), ("红", 7), ("建", 5), ("国", 4), ("文", 7), ("辉", 4), ("鹏", 4),
+    ("飞", 4), ("鑫", 3), ("波", 3), ("斌", 3), ("宇", 5), ("浩", 5), ("凯", 3), ("健", 5),
+    ("俊", 6), ("帆", 2), ("帅", 2), ("旭", 3), ("宁", 3), ("龙", 3), ("林", 4), ("欢", 3),
+    ("佳", 5), ("阳", 4), ("亮", 3), ("成", 3), ("峰", 3), ("晨", 4), ("瑞", 3), ("志", 4),
+    ("兵", 2), ("雷", 2), ("东", 3), ("博", 5), ("彬", 2), ("坤", 2), ("岩", 2), ("杨", 2),
+    ("利", 2), ("楠", 3), ("梅", 4), ("燕", 4), ("玲", 4), ("丹", 3), ("萍", 3), ("莉", 3),
+    ("婷", 4), ("珍", 3), ("凤", 3), ("晶", 3), ("颖", 4), ("雪", 4), ("慧", 5), ("倩", 4),
+    ("琴", 3), ("畅", 1), ("云", 4), ("洁", 3), ("柳", 1), ("淑", 3), ("春", 5), ("海", 7),
+    ("冬", 2), ("荣", 3), ("琳", 3), ("欣", 7), ("芝", 2), ("香", 2), ("花", 2), ("金", 3),
+    ("小", 3), ("瑜", 2), ("璐", 3), ("子", 5), ("梓", 3), ("涵", 4), ("轩", 4), ("怡", 4),
+    ("思", 4), ("雨", 4), ("嘉", 3), ("可", 3), ("一", 3), ("诗", 3), ("雅", 4), ("晓", 4),
+    ("家", 3), ("天", 3), ("泽", 3), ("昊", 2), ("睿", 2), ("铭", 2), ("豪", 2), ("航", 2),
+    ("翔", 2), ("庆", 2), ("德", 2), ("忠", 2), ("福", 2), ("安", 3), ("永", 3), ("新", 2),
+    ("立", 2), ("振", 2), ("卫", 2), ("光", 2), ("宏", 2), ("正", 2), ("世", 2), ("学", 2),
+    ("长", 2), ("美", 3), ("月", 2), ("琪", 2), ("桐", 2), ("霖", 2), ("煜", 1), ("珺", 1),
+    ("澜", 1), ("骁", 1), ("钰", 2), ("瑶", 2), ("璇", 1), ("沐", 2), ("宸", 2), ("萱", 2),
+    ("晟", 1), ("铎", 1), ("灏", 1), ("尧", 1), ("祺", 1), ("瑾", 1), ("竣", 1), ("璟", 1),
+    ("颢", 1), ("珂", 1), ("泓", 1), ("煦", 1), ("景", 1), ("彤", 2), ("悦", 2), ("馨", 2),
+    ("妍", 2), ("茜", 1), ("蕾", 1), ("薇", 1), ("露", 1), ("岚", 1), ("菲", 1), ("晴", 2),
+    ("婉", 1), ("婧", 1), ("琦", 1), ("瑛", 1), ("佩", 1), ("蓉", 1), ("秋", 2), ("夏", 1),
+    ("雯", 2), ("洪", 1), ("松", 1), ("柏", 1), ("森", 1), ("鸿", 1), ("毅", 2), ("诚", 1),
+    ("信", 1), ("达", 1), ("彦", 1), ("皓", 1), ("然", 2), ("逸", 1), ("辰", 2), ("奕", 1),
+    ("恒", 1), ("锐", 1), ("哲", 1), ("凡", 1), ("勋", 1), ("远", 1), ("鸣", 1), ("舟", 1),
+    ("川", 1), ("山", 1), ("源", 1),
+)
+
+# 单字名占比，其余为双字名
+SINGLE_GIVEN_NAME_RATIO = 0.35
+
+
+@dataclass(frozen=True)
+class _NameTables:
+    surnames: tuple[str, ...]
+    surname_cumulative: np.ndarray
+    chars: tuple[str, ...]
+    char_cumulative: np.ndarray
+    compound_aliases: tuple[tuple[int, int, int], ...]
+    """(单姓, 名首字, 复姓) 索引：单姓 + 首字恰好拼成复姓时，按复姓编码以免同名异键。"""
+
+    @property
+    def space(self) -> int:
+        """(姓, 名首字, 名次字或空) 组合总数。"""
+        return len(self.surnames) * len(self.chars) * (len(self.chars) + 1)
+
+
+def name_space(single_given_ratio: float = SINGLE_GIVEN_NAME_RATIO) -> CombinationSpace:
     """
-    批量生成不重复中文姓名
+    估计姓名组合空间的容量。
+
+    Args:
+        single_given_ratio: float, 单字名占比
+
+    Returns:
+        CombinationSpace: total 为组合总数，effective 为按用字频率折算的等效数量
+    """
+    surnames = perplexity(weight for _, weight in SURNAME_WEIGHTS)
+    chars = perplexity(weight for _, weight in GIVEN_NAME_CHAR_WEIGHTS)
+    effective = surnames * chars * (single_given_ratio + (1.0 - single_given_ratio) * chars)
+    return CombinationSpace(total=_name_tables().space, effective=effective)
+
+
+def generate_names(
+    n: int,
+    *,
+    single_given_ratio: float = SINGLE_GIVEN_NAME_RATIO,
+    seed: int | None = None,
+) -> list[str]:
+    """
+    按姓氏与名字用字频率批量生成中文姓名（可能重复）。
 
     Args:
         n: int, 生成的数量
+        single_given_ratio: float, 单字名占比
+        seed: 可选随机种子，便于复现
 
     Returns:
-        list[str]: 不重复姓名的列表
+        list[str]: 姓名列表
     """
+    if n <= 0:
+        raise ValueError("n 必须为正整数")
+    if not 0.0 <= single_given_ratio <= 1.0:
+        raise ValueError("single_given_ratio 必须在 [0.0, 1.0] 之间")
 
+    tables = _name_tables()
+    rng = np.random.default_rng(seed)
+    return _format_names(tables, _draw_name_keys(rng, tables, n, single_given_ratio))
 
-    fake = Faker("zh_CN")
-    unique_names = set()
 
-    # 扩展用字（常见+部分生僻）
-    extra_chars = [
-        "景", "琪", "桐", "昊", "霖", "涵", "煜", "珺", "澜", "骁",
-        "钰", "瑜", "瑶", "璇", "沐", "宸", "萱", "晟", "鑫", "铎",
-        "灏", "尧", "祺", "瑾", "竣", "璟", "颢", "珂", "泓", "煦"
-    ]
+def iter_unique_names(
+    n: int,
+    *,
+    chunk_size: int = 100_000,
+    single_given_ratio: float = SINGLE_GIVEN_NAME_RATIO,
+    uniqueness: str | UniquenessFilter = "exact",
+    seed: int | None = None,
+) -> Iterator[list[str]]:
+    """
+    分块流式生成不重复的中文姓名，适合数量很大的场景。
+
+    Args:
+        n: int, 生成的总数量
+        chunk_size: int, 每块的姓名数量
+        single_given_ratio: float, 单字名占比
+        uniqueness: 判重模式 "exact" / "bloom" / "disk"，或自行创建的 UniquenessFilter
+        seed: 可选随机种子，便于复现
+
+    Returns:
+        Iterator[list[str]]: 逐块产出的姓名列表，块与块之间同样不重复
+    """
+    if n <= 0:
+        raise ValueError("n 必须为正整数")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须为正整数")
+    if not 0.0 <= single_given_ratio <= 1.0:
+        raise ValueError("single_given_ratio 必须在 [0.0, 1.0] 之间")
+
+    name_space(single_given_ratio).check(n, label="姓名")
 
-    # 先用 Faker 生成一部分（名字质量高）
-    while len(unique_names) < min(n, 200000):  # Faker 的组合有限，先占一部分
-        unique_names.add(fake.name())
+    tables = _name_tables()
+    rng = np.random.default_rng(seed)
+    seen = uniqueness if isinstance(uniqueness, UniquenessFilter) else make_uniqueness_filter(uniqueness, expected_items=n)
+    try:
+        remaining = n
+        while remaining > 0:
+            wanted = min(chunk_size, remaining)
+            parts: list[np.ndarray] = []
+            collected = 0
+            stalled_rounds = 0
+            while collected < wanted:
+                # 多抽一些以抵消重复
+                batch = _draw_name_keys(rng, tables, (wanted - collected) * 5 // 4 + 16, single_given_ratio)
+                fresh = batch[seen.add_batch(batch)][: wanted - collected]
+                parts.append(fresh)
+                collected += len(fresh)
+                stalled_rounds = 0 if len(fresh) else stalled_rounds + 1
+                if stalled_rounds >= 32:
+                    raise ValueError(f"已生成 {n - remaining + collected} 个姓名，剩余组合过于稀少，无法继续生成")
+            remaining -= wanted
+            yield _format_names(tables, np.concatenate(parts))
+    finally:
+        if seen is not uniqueness:
+            seen.close()
 
-    # 如果数量不足，自己组合姓氏 + 名字
-    last_names = list(set(fake.last_name() for _ in range(200)))  # 常见姓氏池
-    first_names = list(set(fake.first_name() for _ in range(500))) + extra_chars  # 常见名字 + 扩展字
 
-    while len(unique_names) < n:
-        last = random.choice(last_names)
-        first = random.choice(first_names)
-        # 30% 概率加第二个字
-        if random.random() < 0.3:
-            first += random.choice(first_names)
-        unique_names.add(last + first)
+def generate_unique_names(n: int, *, uniqueness: str | UniquenessFilter = "exact") -> list[str]:
+    """
+    批量生成不重复中文姓名
 
-    return list(unique_names)
+    Args:
+        n: int, 生成的数量
+        uniqueness: 判重模式 "exact" / "bloom" / "disk"，或自行创建的 UniquenessFilter
 
+    Returns:
+        list[str]: 不重复姓名的列表
+    """
+    names: list[str] = []
+    for chunk in iter_unique_names(n, chunk_size=n, uniqueness=uniqueness):
+        names.extend(chunk)
+    return names
 
+
+@lru_cache(maxsize=1)
+def _name_tables() -> _NameTables:
+    """
+    把姓氏、名字用字表编译为累积权重数组，进程内只构建一次。
+    """
+    surnames = tuple(name for name, _ in SURNAME_WEIGHTS)
+    chars = tuple(char for char, _ in GIVEN_NAME_CHAR_WEIGHTS)
+    surname_index = {name: index for index, name in enumerate(surnames)}
+    char_index = {char: index for index, char in enumerate(chars)}
+    compound_aliases = tuple(
+        (surname_index[name[0]], char_index[name[1]], index)
+        for index, name in enumerate(surnames)
+        if len(name) == 2 and name[0] in surname_index and name[1] in char_index
+    )
+    def cumulative(weights: List[float]) -> np.ndarray:
+        values = np.cumsum(np.asarray(weights, dtype=np.float64))
+        return values / values[-1]
+
+    return _NameTables(
+        surnames=surnames,
+        surname_cumulative=cumulative([weight for _, weight in SURNAME_WEIGHTS]),
+        chars=chars,
+        char_cumulative=cumulative([weight for _, weight in GIVEN_NAME_CHAR_WEIGHTS]),
+        compound_aliases=compound_aliases,
+    )
+
+
+def _draw_name_keys(
+    rng: np.random.Generator,
+    tables: _NameTables,
+    size: int,
+    single_given_ratio: float,
+) -> np.ndarray:
+    """
+    抽取 size 个姓名编码：key = (姓 * C + 首字) * (C + 1) + 次字，次字为 C 表示单字名。
+    """
+    char_count = len(tables.chars)
+    surname = np.searchsorted(tables.surname_cumulative, rng.random(size), side="right")
+    first = np.searchsorted(tables.char_cumulative, rng.random(size), side="right")
+    second = np.searchsorted(tables.char_cumulative, rng.random(size), side="right")
+    np.minimum(surname, len(tables.surnames) - 1, out=surname)
+    np.minimum(first, char_count - 1, out=first)
+    np.minimum(second, char_count - 1, out=second)
+    second[rng.random(size) < single_given_ratio] = char_count
+    for single, char, compound in tables.compound_aliases:
+        rows = (surname == single) & (first == char) & (second != char_count)
+        surname[rows] = compound
+        first[rows] = second[rows]
+        second[rows] = char_count
+    return (surname.astype(np.int64) * char_count + first) * (char_count + 1) + second
+
+
+def _format_names(tables: _NameTables, keys: np.ndarray) -> list[str]:
+    char_count = len(tables.chars)
+    seconds = tables.chars + ("",)
+    second = keys % (char_count + 1)
+    rest = keys // (char_count + 1)
+    first = rest % char_count
+    surname = rest // char_count
+    surnames = tables.surnames
+    chars = tables.chars
+    return [
+        surnames[s] + chars[f] + seconds[c]
+        for s, f, c in zip(surname.tolist(), first.tolist(), second.tolist())
+    ]
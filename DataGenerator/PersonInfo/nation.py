@@ -1,4 +1,17 @@
-import random
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from DataGenerator.Numerical.sampling import (
+    AliasTable,
+    ConditionalAliasTable,
+    build_alias_table,
+    build_conditional_alias_table,
+)
+from DataGenerator.PersonInfo.location import REGION_CODES
 
 # 民族的名称和对应的比例。比例大致按照人口比例进行设置
 ethnic_ratios = {
@@ -14,18 +27,101 @@ ethnic_ratios = {
     "门巴族": 0.01, "鄂伦春族": 0.01, "独龙族": 0.01, "赫哲族": 0.01, "珞巴族": 0.01
 }
 
-def generate_ethnic_sample(n: int) -> list[str]:
+# 少数民族聚居省份的民族构成（百分比，大致按人口普查设置），其余省份使用全国比例。
+province_ethnic_ratios = {
+    "新疆维吾尔自治区": {"维吾尔族": 44.9, "汉族": 42.2, "哈萨克族": 6.5, "回族": 4.2, "柯尔克孜族": 0.8,
+                        "蒙古族": 0.7, "塔吉克族": 0.2, "锡伯族": 0.2, "乌孜别克族": 0.1, "俄罗斯族": 0.05},
+    "西藏自治区": {"藏族": 86.0, "汉族": 12.2, "回族": 0.4, "门巴族": 0.3, "珞巴族": 0.1},
+    "宁夏回族自治区": {"汉族": 64.0, "回族": 35.0, "满族": 0.4, "蒙古族": 0.1},
+    "内蒙古自治区": {"汉族": 78.7, "蒙古族": 17.7, "满族": 1.8, "回族": 0.9, "达斡尔族": 0.3,
+                   "鄂温克族": 0.1, "朝鲜族": 0.1, "鄂伦春族": 0.02},
+    "广西壮族自治区": {"汉族": 62.5, "壮族": 31.4, "瑶族": 3.3, "苗族": 1.1, "侗族": 0.7,
+                     "仫佬族": 0.4, "毛南族": 0.1, "回族": 0.1, "京族": 0.05},
+    "青海省": {"汉族": 50.5, "藏族": 24.4, "回族": 14.8, "土族": 3.6, "撒拉族": 1.9, "蒙古族": 1.7},
+    "海南省": {"汉族": 82.6, "黎族": 15.8, "苗族": 0.9, "回族": 0.1},
+    "甘肃省": {"汉族": 90.6, "回族": 5.0, "东乡族": 2.4, "藏族": 1.9, "保安族": 0.1,
+             "裕固族": 0.1, "撒拉族": 0.1},
+    "湖南省": {"汉族": 89.2, "土家族": 4.4, "苗族": 3.2, "侗族": 1.3, "瑶族": 1.1, "白族": 0.2},
+    "重庆市": {"汉族": 93.5, "土家族": 4.6, "苗族": 1.6},
+    "湖北省": {"汉族": 95.6, "土家族": 3.6, "苗族": 0.4, "侗族": 0.1},
+    "四川省": {"汉族": 93.9, "彝族": 3.6, "藏族": 1.9, "羌族": 0.4},
+    "河北省": {"汉族": 95.7, "满族": 2.9, "回族": 0.8, "蒙古族": 0.3},
+    "福建省": {"汉族": 98.1, "畲族": 1.0, "回族": 0.3, "苗族": 0.2, "土家族": 0.1},
+}
+
+def generate_ethnic_sample(
+    n: int,
+    *,
+    region_codes: Sequence[int | str] | np.ndarray | None = None,
+    seed: int | None = None,
+) -> list[str]:
     """
     按照人口比例批量生成民族列表
 
     Args:
         n: int, 生成的数量
+        region_codes: 可选的 6 位区划代码序列（长度须为 n），指定时按各行所在省份的民族构成抽样
+        seed: 可选随机种子，便于复现
 
     Returns:
         list[str]: 生成的民族列表
     """
-    names = list(ethnic_ratios.keys())
-    weights = list(ethnic_ratios.values())
+    if n <= 0:
+        raise ValueError("n 必须为正整数")
+
+    names = _ethnic_tables()[0]
+    return names[sample_ethnic_indices(np.random.default_rng(seed), n, region_codes=region_codes)].tolist()
+
+
+def sample_ethnic_indices(
+    rng: np.random.Generator,
+    n: int,
+    *,
+    region_codes: Sequence[int | str] | np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    批量抽取民族在 ethnic_ratios 中的索引。
+
+    参数:
+        rng: NumPy 随机数生成器。
+        n: 抽取数量。
+    关键字参数:
+        region_codes: 可选的 6 位区划代码序列，指定时按所在省份的民族构成条件抽样。
+
+    返回:
+        民族索引数组。
+
+    异常:
+        ValueError: 当 region_codes 长度与 n 不一致时抛出。
+    """
+    _, national, by_province, province_groups = _ethnic_tables()
+    if region_codes is None:
+        return national.sample(rng, n)
+
+    codes = np.asarray(region_codes).astype(np.int64)
+    if len(codes) != n:
+        raise ValueError("region_codes 的长度必须与 n 一致")
+    # 区划代码前两位为省级代码，未单独配置的省份落在全国比例这一组
+    return by_province.sample(rng, province_groups[codes // 10000 % 100])
+
+
+@lru_cache(maxsize=1)
+def _ethnic_tables() -> Tuple[np.ndarray, AliasTable, ConditionalAliasTable, np.ndarray]:
+    names = list(ethnic_ratios)
+    national = [ethnic_ratios[name] for name in names]
+
+    provinces = list(province_ethnic_ratios)
+    rows = [national]
+    for province in provinces:
+        ratios = province_ethnic_ratios[province]
+        unknown = set(ratios) - set(ethnic_ratios)
+        if unknown:
+            raise ValueError(f"未知的民族名称: {sorted(unknown)}")
+        rows.append([ratios.get(name, 0.0) for name in names])
 
-    return random.choices(names, weights=weights, k=n)
+    province_groups = np.zeros(100, dtype=np.intp)
+    for code, province, _, _ in REGION_CODES:
+        if province in province_ethnic_ratios:
+            province_groups[int(code[:2])] = provinces.index(province) + 1
 
+    return np.asarray(names), build_alias_table(national), build_conditional_alias_table(rows), province_groups
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping
+
+import numpy as np
+
+from DataGenerator.PersonInfo.address import AddressBatch, generate_address_batch
+from DataGenerator.PersonInfo.id_card import IdNumberBatch, generate_id_numbers_for_regions
+from DataGenerator.PersonInfo.location import REGION_CODES, sample_region_rows
+from DataGenerator.PersonInfo.name import iter_unique_names
+from DataGenerator.PersonInfo.nation import ethnic_ratios, sample_ethnic_indices
+
+
+@dataclass
+class PersonRecord:
+    """
+    批量生成的人员记录，按列保存，各列按行一一对应且相互一致：
+    身份证区划代码、住址所在区县与民族构成取自同一区划，出生日期与性别写入身份证号。
+    """
+
+    names: np.ndarray
+    """不重复的中文姓名。"""
+
+    ethnicities: np.ndarray
+    """民族名称，按所在省份的民族构成抽样。"""
+
+    ids: IdNumberBatch
+    """身份证号及其出生日期、性别列。"""
+
+    addresses: AddressBatch
+    """结构化住址，区县与身份证区划代码一致。"""
+
+    region_rows: np.ndarray
+    """所在区县在 location.REGION_CODES 中的行索引。"""
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def is_male(self) -> np.ndarray:
+        """性别列，True 表示男性（与身份证顺序码奇偶一致）。"""
+        return self.ids.is_male
+
+    def columns(self) -> Dict[str, List]:
+        """
+        返回可直接写入 CSV 或交给身份证图片渲染的列，键与 id_picture 使用的字段名一致。
+        """
+        return {
+            "name": self.names.tolist(),
+            "sex": self.ids.sexes(),
+            "nation": self.ethnicities.tolist(),
+            "year": self.ids.years.tolist(),
+            "mon": self.ids.months.tolist(),
+            "day": self.ids.days.tolist(),
+            "addr": self.addresses.to_strings(),
+            "idn": self.ids.to_strings(),
+            "region_code": self.ids.region_codes.tolist(),
+        }
+
+
+def generate_person_records(
+    count: int,
+    *,
+    province_weights: Mapping[str, float] | None = None,
+    birth_start: str = "1950-01-01",
+    birth_end: str = "2005-12-31",
+    male_ratio: float = 0.5,
+    seed: int | None = None,
+) -> PersonRecord:
+    """
+    一次向量化地生成相互一致的人员记录。
+
+    先按行抽取 区县 与 性别，再据此生成：区划 → 身份证区划代码 + 住址 + 民族，
+    出生日期 → 身份证日期段，性别 → 顺序码奇偶；姓名单独保证不重复。
+
+    参数:
+        count: 需要生成的人数。
+    关键字参数:
+        province_weights: 可选的省级权重，例如 location.PROVINCE_POPULATION_WEIGHTS。
+        birth_start: 出生日期下限（含），格式 YYYY-MM-DD。
+        birth_end: 出生日期上限（含），格式 YYYY-MM-DD。
+        male_ratio: 男性占比。
+        seed: 可选随机种子，便于复现。
+
+    返回:
+        PersonRecord 列式记录。
+
+    异常:
+        ValueError: 当参数非法或数量超出姓名、身份证号组合空间时抛出。
+    """
+    if count <= 0:
+        raise ValueError("count 必须为正整数")
+    if not 0.0 <= male_ratio <= 1.0:
+        raise ValueError("male_ratio 必须在 [0.0, 1.0] 之间")
+
+    rng = np.random.default_rng(seed)
+    name_seed, id_seed, address_seed = (int(value) for value in rng.integers(0, 2 ** 63, size=3))
+
+    region_rows = sample_region_rows(rng, count, province_weights=province_weights)
+    region_codes = np.asarray([int(row[0]) for row in REGION_CODES], dtype=np.int64)[region_rows]
+    is_male = rng.random(count) < male_ratio
+
+    names: List[str] = []
+    for chunk in iter_unique_names(count, chunk_size=count, seed=name_seed):
+        names.extend(chunk)
+
+    return PersonRecord(
+        names=np.asarray(names),
+        ethnicities=np.asarray(list(ethnic_ratios))[sample_ethnic_indices(rng, count, region_codes=region_codes)],
+        ids=generate_id_numbers_for_regions(
+            region_codes, is_male=is_male, birth_start=birth_start, birth_end=birth_end, seed=id_seed
+        ),
+        addresses=generate_address_batch(count, region_rows=region_rows, seed=address_seed),
+        region_rows=region_rows,
+    )
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import shutil
+import tempfile
+import warnings
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from DataGenerator.Numerical.unique import mix64
+
+UNIQUENESS_MODES: tuple[str, ...] = ("exact", "bloom", "disk")
+
+
+@dataclass(frozen=True)
+class CombinationSpace:
+    """
+    组合空间的容量估计，用于在生成前判断不重复数量是否可达。
+    """
+
+    total: int
+    """所有可能取值的数量（上界）。"""
+
+    effective: float
+    """按抽样权重折算的有效取值数量（exp(熵)），权重越偏斜越小于 total。"""
+
+    def remaining(self, used: int = 0) -> int:
+        """扣除已占用数量后的剩余容量。"""
+        return max(self.total - used, 0)
+
+    def check(self, count: int, *, used: int = 0, label: str = "值") -> None:
+        """
+        当 count 超出剩余容量时立即抛出 ValueError，避免生成循环无法结束；
+        未超出容量但超出按权重折算的有效容量时发出 RuntimeWarning，
+        此时重复抽样急剧增多，生成会明显变慢，并可能因连续多轮没有新值而中途失败。
+        """
+        remaining = self.remaining(used)
+        if count > remaining:
+            raise ValueError(f"组合空间剩余容量约为 {remaining} 个，无法生成 {count} 个不重复{label}")
+        effective = max(int(self.effective) - used, 0)
+        if count > effective:
+            warnings.warn(
+                f"按抽样权重折算的有效容量约为 {effective} 个，生成 {count} 个不重复{label}时重复率会很高，"
+                "可能明显变慢或中途失败",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+
+class UniquenessFilter(ABC):
+    """
+    判重过滤器：按批接收 64 位整数键，返回其中首次出现的键的掩码。
+
+    键既可以是可逆的组合编码（如姓名编码），也可以是 hash_strings 得到的字符串摘要；
+    任何模式下误判都只会多拒绝一些新值，输出始终不重复。
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+
+    def add_batch(self, keys: Iterable[int] | np.ndarray) -> np.ndarray:
+        """
+        登记一批键。
+
+        参数:
+            keys: 64 位整数键序列。
+
+        返回:
+            与 keys 等长的 bool 数组，True 表示该键此前未出现（批内重复仅首个为 True）。
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        mask = np.zeros(len(keys), dtype=bool)
+        if len(keys) == 0:
+            return mask
+
+        distinct, first = np.unique(keys, return_index=True)
+        fresh = self._insert_new(distinct)
+        mask[first[fresh]] = True
+        self._count += int(fresh.sum())
+        return mask
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """释放过滤器占用的外部资源。"""
+
+    def __enter__(self) -> UniquenessFilter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @abstractmethod
+    def _insert_new(self, keys: np.ndarray) -> np.ndarray:
+        """登记一批互不相同的键，返回其中新键的掩码。"""
+
+
+class ExactFilter(UniquenessFilter):
+    """内存精确模式：以集合保存全部键。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._seen: set[int] = set()
+
+    def _insert_new(self, keys: np.ndarray) -> np.ndarray:
+        seen = self._seen
+        values = keys.tolist()
+        fresh = np.fromiter((key not in seen for key in values), dtype=bool, count=len(values))
+        seen.update(keys[fresh].tolist())
+        return fresh
+
+
+class BloomFilter(UniquenessFilter):
+    """
+    布隆过滤器模式：内存只与 expected_items 和误判率有关。
+
+    误判表现为偶尔把新值当作重复值拒绝；超过 expected_items 后误判率会逐渐升高。
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float = 1e-6) -> None:
+        if expected_items <= 0:
+            raise ValueError("expected_items 必须为正整数")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate 必须在 (0, 1) 之间")
+        super().__init__()
+        self.bit_count = max(64, math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / expected_items * math.log(2)))
+        self._bits = np.zeros((self.bit_count + 7) // 8, dtype=np.uint8)
+
+    def _insert_new(self, keys: np.ndarray) -> np.ndarray:
+        byte_index, bit_mask = self._positions(keys)
+        present = np.ones(len(keys), dtype=bool)
+        for row in range(self.hash_count):
+            present &= (self._bits[byte_index[row]] & bit_mask[row]) != 0
+
+        fresh = ~present
+        np.bitwise_or.at(self._bits, byte_index[:, fresh].ravel(), bit_mask[:, fresh].ravel())
+        return fresh
+
+    def _positions(self, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # 双重散列：第 i 个位置为 h1 + i * h2（对 bit_count 取模）
+        h1 = mix64(keys)
+        h2 = mix64(h1 ^ keys) | np.uint64(1)
+        steps = np.arange(self.hash_count, dtype=np.uint64)[:, None]
+        with np.errstate(over="ignore"):
+            positions = (h1[None, :] + steps * h2[None, :]) % np.uint64(self.bit_count)
+        bit_mask = np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8))
+        return (positions >> np.uint64(3)).astype(np.intp), bit_mask
+
+
+class DiskFilter(UniquenessFilter):
+    """
+    磁盘溢写模式：内存中最多保留 memory_limit 个键，满后排序写成磁盘有序段，
+    查询时在各有序段上二分查找。结果与精确模式一致。
+    """
+
+    def __init__(self, memory_limit: int = 5_000_000, *, spill_dir: str | None = None) -> None:
+        if memory_limit <= 0:
+            raise ValueError("memory_limit 必须为正整数")
+        super().__init__()
+        self.memory_limit = memory_limit
+        self._buffer: set[int] = set()
+        self._runs: List[np.ndarray] = []
+        self._directory = tempfile.mkdtemp(prefix="unique_runs_", dir=spill_dir)
+
+    def _insert_new(self, keys: np.ndarray) -> np.ndarray:
+        fresh = np.ones(len(keys), dtype=bool)
+        for run in self._runs:
+            candidates = np.flatnonzero(fresh)
+            if candidates.size == 0:
+                break
+            fresh[candidates[_contains_sorted(run, keys[candidates])]] = False
+
+        buffer = self._buffer
+        values = keys.tolist()
+        for index in np.flatnonzero(fresh).tolist():
+            value = values[index]
+            if value in buffer:
+                fresh[index] = False
+            else:
+                buffer.add(value)
+        if len(buffer) >= self.memory_limit:
+            self._spill()
+        return fresh
+
+    def _spill(self) -> None:
+        run = np.fromiter(self._buffer, dtype=np.uint64, count=len(self._buffer))
+        run.sort()
+        path = os.path.join(self._directory, f"run_{len(self._runs):05d}.u64")
+        run.tofile(path)
+        self._runs.append(np.memmap(path, dtype=np.uint64, mode="r"))
+        self._buffer = set()
+
+    def close(self) -> None:
+        self._runs = []
+        self._buffer = set()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
+def make_uniqueness_filter(
+    mode: str = "exact",
+    *,
+    expected_items: int = 1_000_000,
+    false_positive_rate: float = 1e-6,
+    memory_limit: int = 5_000_000,
+    spill_dir: str | None = None,
+) -> UniquenessFilter:
+    """
+    按模式创建判重过滤器。
+
+    参数:
+        mode: "exact"（内存集合）、"bloom"（布隆过滤器）或 "disk"（磁盘有序段）。
+    关键字参数:
+        expected_items: 预计登记的键数量，用于确定布隆过滤器大小。
+        false_positive_rate: 布隆过滤器的目标误判率。
+        memory_limit: 磁盘模式下内存中最多保留的键数量。
+        spill_dir: 磁盘模式的临时目录，默认使用系统临时目录。
+
+    返回:
+        UniquenessFilter 实例。
+
+    异常:
+        ValueError: 当 mode 未知或参数非法时抛出。
+    """
+    if mode == "exact":
+        return ExactFilter()
+    if mode == "bloom":
+        return BloomFilter(expected_items, false_positive_rate)
+    if mode == "disk":
+        return DiskFilter(memory_limit, spill_dir=spill_dir)
+    raise ValueError(f"未知的判重模式: {mode}，可选值为 {UNIQUENESS_MODES}")
+
+
+def hash_strings(values: Sequence[str]) -> np.ndarray:
+    """
+    将字符串映射为 64 位摘要，供判重过滤器使用。
+    """
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little") for value in values),
+        dtype=np.uint64,
+        count=len(values),
+    )
+
+
+def perplexity(weights: Iterable[float]) -> float:
+    """
+    计算加权分布的困惑度 exp(熵)，即等效的均匀取值个数。
+    """
+    values = np.asarray(list(weights), dtype=np.float64)
+    values = values[values > 0]
+    if values.size == 0:
+        return 0.0
+    probabilities = values / values.sum()
+    return float(np.exp(-(probabilities * np.log(probabilities)).sum()))
+
+
+def _contains_sorted(run: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    positions = np.searchsorted(run, keys)
+    found = positions < len(run)
+    found[found] = run[positions[found]] == keys[found]
+    return found
+
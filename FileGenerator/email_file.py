@@ -1,8 +1,9 @@
 from email import policy
 from email.message import EmailMessage
-from email.utils import formatdate, make_msgid
+from datetime import datetime
+from email.utils import format_datetime, formatdate, make_msgid
 from pathlib import Path
-from typing import Mapping, Optional, Sequence, Tuple
+from typing import Mapping, Optional, Sequence, Tuple, Union
 
 
 def create_email_file(
@@ -17,6 +18,7 @@ def create_email_file(
     additional_headers: Optional[Mapping[str, str]] = None,
     attachments: Optional[Sequence[Tuple[str, bytes, str]]] = None,
     encoding: str = "utf-8",
+    date: Optional[Union[float, datetime]] = None,
 ) -> Path:
     """
     根据传入参数构造一封邮件并写入 .eml 文件。
@@ -31,6 +33,8 @@ def create_email_file(
       additional_headers: 额外自定义头部，例如 {"X-Env": "staging"}。
       attachments: 附件列表，每项为 (filename, content_bytes, mime_type)。
       encoding: 正文编码。
+      date: Date 头对应的时刻，UNIX 秒或 datetime；为 None 时使用当前时间。
+        批量生成邮件时可传入 DataGenerator.DateTime.event_process 生成的时间戳，使发信时间呈现真实的起伏。
 
     返回:
       实际写入的 Path 对象。
@@ -43,7 +47,10 @@ def create_email_file(
         message["Cc"] = ", ".join(cc)
     if bcc:
         message["Bcc"] = ", ".join(bcc)
-    message["Date"] = formatdate(localtime=True)
+    if isinstance(date, datetime):
+        message["Date"] = format_datetime(date)
+    else:
+        message["Date"] = formatdate(date, localtime=True)
     message["Message-ID"] = make_msgid()
 
     if additional_headers:
@@ -4,6 +4,7 @@
 import os
 import sys
 import csv
+import random
 import numpy as np
 import cv2
 from PIL import Image as PImage, ImageFont, ImageDraw
@@ -11,10 +12,7 @@ from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from DataGenerator.PersonInfo.name import *
-from DataGenerator.PersonInfo.id_card import *
-from DataGenerator.PersonInfo.address import *
-from DataGenerator.PersonInfo.nation import *
+from DataGenerator.PersonInfo.person import generate_person_records
 
 # 获取 base_dir
 if getattr(sys, 'frozen', None):
@@ -52,25 +50,19 @@ def create_person_csv(person_count:int, csv_path:str)->list[dict[str,str]]:
     with open(csv_path, "w", newline="", encoding="utf-8-sig") as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=headers)
         writer.writeheader()
-        names = generate_unique_names(person_count)
-        ids = generate_unique_id_numbers(person_count)
-        addresses = generate_home_addresses(person_count)
-        nations = generate_ethnic_sample(person_count)
+        columns = generate_person_records(person_count).columns()
 
         for i in range(person_count):
-            y, m, d = parse_birth_ymd_from_id(ids[i])
-            sex = '男' if ids[i][-2].isdigit() and int(ids[i][-2]) % 2 == 1 else '女'
-
             row = {
                 "avatar_path": _get_random_avatar_path(),
-                "name":  names[i],
-                "sex": sex,
-                "nation":  nations[i],
-                "year": y,
-                "mon": m,
-                "day": d,
-                "addr": addresses[i],
-                "idn": ids[i],
+                "name": columns["name"][i],
+                "sex": columns["sex"][i],
+                "nation": columns["nation"][i],
+                "year": columns["year"][i],
+                "mon": columns["mon"][i],
+                "day": columns["day"][i],
+                "addr": columns["addr"][i],
+                "idn": columns["idn"][i],
                 "auto_cut_bg": str(False)
             }
             writer.writerow(row)
@@ -4,6 +4,8 @@ from scapy.layers.l2 import Ether
 from scapy.layers.inet import IP, TCP
 from scapy.packet import Raw
 
+from DataGenerator.DateTime.event_process import EventProcess
+
 
 def generate_random_tcp_packets(
     count: int,
@@ -15,6 +17,7 @@ def generate_random_tcp_packets(
     payload_size_range: Tuple[int, int] = (20, 600),
     server_port_pool: Optional[Sequence[int]] = None,
     seed: Optional[int] = None,
+    time_process: Optional[EventProcess] = None,
 ) -> Tuple[List[Ether], float]:
     """
     随机生成指定数量的 TCP 背景流量包，用更真实的会话流程（握手/数据/关闭），
@@ -30,6 +33,8 @@ def generate_random_tcp_packets(
       payload_size_range: TCP payload 的随机大小范围 (字节)。
       server_port_pool: 服务器端口候选列表；为 None 时使用常见服务端口。
       seed: 为 None 时使用系统随机源；否则使用固定随机种子，便于复现。
+      time_process: 可选的事件到达过程（见 DataGenerator.DateTime.event_process）；
+        提供时一次性整批生成全部包的时间戳（泊松/突发/昼夜起伏），忽略 time_gap_range。
 
     返回:
       (packets, next_time):
@@ -69,6 +74,8 @@ def generate_random_tcp_packets(
 
     t = float(start_time)
     packets: List[Ether] = []
+    # 首包仍位于 start_time，其后 count 个时刻整批生成，最后一个作为 next_time
+    times = [t] + time_process.times(count, start=t, seed=seed).tolist() if time_process else None
 
     while len(packets) < count:
         client_mac = rng.choice(mac_pool)
@@ -94,7 +101,7 @@ def generate_random_tcp_packets(
                 return False
             pkt.time = t
             packets.append(pkt)
-            t += rng.uniform(gap_min, gap_max)
+            t = times[len(packets)] if times is not None else t + rng.uniform(gap_min, gap_max)
             return len(packets) < count
 
         # SYN (client -> server)
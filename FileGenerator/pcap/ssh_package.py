@@ -1,5 +1,6 @@
 # 运行前请先安装 scapy：
 # pip install scapy
+import itertools
 import time
 from typing import List, Optional, Tuple
 
@@ -8,6 +9,8 @@ from scapy.layers.inet import IP, TCP
 from scapy.packet import Raw
 from scapy.utils import wrpcap
 
+from DataGenerator.DateTime.event_process import EventProcess
+
 from .random_package import generate_random_tcp_packets
 
 
@@ -30,6 +33,8 @@ def simulate_ssh_file_transfer(
     pre_noise_packets: int = 0,
     post_noise_packets: int = 0,
     noise_packet_kwargs: Optional[dict] = None,
+    time_process: Optional[EventProcess] = None,
+    seed: Optional[int] = None,
 ) -> Tuple[List[Ether], float]:
     """
     构造并写入一个模拟的 SSH/SCP 文件传输的 pcap（离线构造，无网络 I/O）。
@@ -49,6 +54,9 @@ def simulate_ssh_file_transfer(
       initial_seq_client / initial_seq_server: TCP 初始序列号（分别用于 client/server 方向）
       pre_noise_packets / post_noise_packets: 在 SSH 传输前/后插入的随机背景包数量
       noise_packet_kwargs: 传递给 generate_random_tcp_packets 的可选参数（除 start_time 外）
+      time_process: 可选的事件到达过程（见 DataGenerator.DateTime.event_process）；提供时包间隔
+        按该过程整批生成，不再使用固定的 time_between_packets
+      seed: time_process 使用的随机种子，便于复现
 
     行为说明（模拟流程）:
       - 创建三次握手（SYN, SYN-ACK, ACK）
@@ -102,11 +110,18 @@ def simulate_ssh_file_transfer(
         pre_pkts, t = generate_random_tcp_packets(pre_noise_packets, t, **noise_kwargs)
         pkts.extend(pre_pkts)
 
+    # 握手 3 + 控制行 2 + 每个分片 2 + NUL 2 + 关闭 4 个包，每个包之后一个间隔（最后一个供背景流量续接）
+    if time_process is not None:
+        chunk_count = -(-file_size // chunk_size)
+        gaps = iter(time_process.gaps(11 + 2 * chunk_count, start=t, seed=seed).tolist())
+    else:
+        gaps = itertools.repeat(time_between_packets)
+
     # 1) SYN (client -> server)
     syn = Ether(src=ether_src, dst=ether_dst) / IP(src=client_ip, dst=server_ip, id=ip_id) / TCP(sport=client_port, dport=server_port, flags="S", seq=seq_c)
     syn.time = t
     pkts.append(syn)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
     seq_c += 1  # SYN consumes 1 seq
 
@@ -114,7 +129,7 @@ def simulate_ssh_file_transfer(
     synack = Ether(src=ether_dst, dst=ether_src) / IP(src=server_ip, dst=client_ip, id=ip_id) / TCP(sport=server_port, dport=client_port, flags="SA", seq=seq_s, ack=seq_c)
     synack.time = t
     pkts.append(synack)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
     seq_s += 1
 
@@ -122,7 +137,7 @@ def simulate_ssh_file_transfer(
     ack = Ether(src=ether_src, dst=ether_dst) / IP(src=client_ip, dst=server_ip, id=ip_id) / TCP(sport=client_port, dport=server_port, flags="A", seq=seq_c, ack=seq_s)
     ack.time = t
     pkts.append(ack)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
 
     # 4) SCP-like control line from server indicating file send
@@ -131,7 +146,7 @@ def simulate_ssh_file_transfer(
     pkt_ctrl = Ether(src=ether_dst, dst=ether_src) / IP(src=server_ip, dst=client_ip, id=ip_id) / TCP(sport=server_port, dport=client_port, flags="PA", seq=seq_s, ack=seq_c) / Raw(load=ctrl_line)
     pkt_ctrl.time = t
     pkts.append(pkt_ctrl)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
     seq_s += len(ctrl_line)
 
@@ -139,7 +154,7 @@ def simulate_ssh_file_transfer(
     ack1 = Ether(src=ether_src, dst=ether_dst) / IP(src=client_ip, dst=server_ip, id=ip_id) / TCP(sport=client_port, dport=server_port, flags="A", seq=seq_c, ack=seq_s)
     ack1.time = t
     pkts.append(ack1)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
 
     # 5) Server sends file bytes in chunks (server -> client), with interleaved client ACKs
@@ -150,7 +165,7 @@ def simulate_ssh_file_transfer(
         raw_pkt = Ether(src=ether_dst, dst=ether_src) / IP(src=server_ip, dst=client_ip, id=ip_id) / TCP(sport=server_port, dport=client_port, flags="PA", seq=seq_s, ack=seq_c) / Raw(load=chunk)
         raw_pkt.time = t
         pkts.append(raw_pkt)
-        t += time_between_packets
+        t += next(gaps)
         ip_id += 1
 
         seq_s += len(chunk)
@@ -161,7 +176,7 @@ def simulate_ssh_file_transfer(
         ack_chunk = Ether(src=ether_src, dst=ether_dst) / IP(src=client_ip, dst=server_ip, id=ip_id) / TCP(sport=client_port, dport=server_port, flags="A", seq=seq_c, ack=seq_s)
         ack_chunk.time = t
         pkts.append(ack_chunk)
-        t += time_between_packets
+        t += next(gaps)
         ip_id += 1
 
     # 6) SCP end-of-file NUL byte (some SCP implementations expect a NUL)
@@ -169,7 +184,7 @@ def simulate_ssh_file_transfer(
     pkt_nul = Ether(src=ether_dst, dst=ether_src) / IP(src=server_ip, dst=client_ip, id=ip_id) / TCP(sport=server_port, dport=client_port, flags="PA", seq=seq_s, ack=seq_c) / Raw(load=nul)
     pkt_nul.time = t
     pkts.append(pkt_nul)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
     seq_s += 1
 
@@ -177,14 +192,14 @@ def simulate_ssh_file_transfer(
     ack_nul = Ether(src=ether_src, dst=ether_dst) / IP(src=client_ip, dst=server_ip, id=ip_id) / TCP(sport=client_port, dport=server_port, flags="A", seq=seq_c, ack=seq_s)
     ack_nul.time = t
     pkts.append(ack_nul)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
 
     # 7) FIN from server
     fin = Ether(src=ether_dst, dst=ether_src) / IP(src=server_ip, dst=client_ip, id=ip_id) / TCP(sport=server_port, dport=client_port, flags="FA", seq=seq_s, ack=seq_c) / Raw(load=b"")
     fin.time = t
     pkts.append(fin)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
     seq_s += 1
 
@@ -192,14 +207,14 @@ def simulate_ssh_file_transfer(
     finack = Ether(src=ether_src, dst=ether_dst) / IP(src=client_ip, dst=server_ip, id=ip_id) / TCP(sport=client_port, dport=server_port, flags="A", seq=seq_c, ack=seq_s)
     finack.time = t
     pkts.append(finack)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
 
     # 8) Client FIN -> server (close both sides)
     fin2 = Ether(src=ether_src, dst=ether_dst) / IP(src=client_ip, dst=server_ip, id=ip_id) / TCP(sport=client_port, dport=server_port, flags="FA", seq=seq_c, ack=seq_s) / Raw(load=b"")
     fin2.time = t
     pkts.append(fin2)
-    t += time_between_packets
+    t += next(gaps)
     ip_id += 1
     seq_c += 1
 
@@ -208,7 +223,7 @@ def simulate_ssh_file_transfer(
     fin2ack.time = t
     pkts.append(fin2ack)
 
-    t = fin2ack.time + time_between_packets
+    t = fin2ack.time + next(gaps)
     if post_noise_packets > 0:
         post_pkts, _ = generate_random_tcp_packets(post_noise_packets, t, **noise_kwargs)
         pkts.extend(post_pkts)